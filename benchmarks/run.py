@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of conversions and ORM paths against in-memory SQLite
+
+Run from root of repository::
+
+    python benchmarks/run.py                          # print results
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json [--fail]
+
+Results are operations per second, median of repeats (11 by default). Comparing with baseline
+reports change of each benchmark and marks those slower than threshold (60% by default) as
+regressions, ``--fail`` exits with status 1 if any. Default threshold is above noise measured
+between runs on a shared machine (up to 51%), lower it on a quiet dedicated machine.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    DATABASES={
+        'default': {
+            'NAME': ':memory:',
+            'ENGINE': 'django.db.backends.sqlite3',
+        },
+    },
+    INSTALLED_APPS=[
+        'unixtimestampfield',
+    ],
+    TEMPLATES=[
+        {
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [],
+            'APP_DIRS': True,
+        },
+    ],
+    USE_TZ=True,
+    TIME_ZONE='UTC',
+)
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.template import Context, Template  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from unixtimestampfield.export import export  # noqa: E402
+from unixtimestampfield.fields import UnixTimeStampField, OrdinalField  # noqa: E402
+from unixtimestampfield.iterators import batch_iterator  # noqa: E402
+from unixtimestampfield.managers import UnixTimeStampManager  # noqa: E402
+from unixtimestampfield.submiddleware import field_value_middleware  # noqa: E402
+
+
+class BenchModel(models.Model):
+
+    created = UnixTimeStampField(auto_now_add=True)
+    ts = UnixTimeStampField(default=0.0)
+
+    class Meta:
+        app_label = 'unixtimestampfield'
+
+
+class BenchBatchModel(models.Model):
+
+    created = UnixTimeStampField(auto_now_add=True)
+    ts = UnixTimeStampField(default=0.0)
+
+    objects = UnixTimeStampManager()
+
+    class Meta:
+        app_label = 'unixtimestampfield'
+
+
+class BenchLazyModel(models.Model):
+
+    ts = UnixTimeStampField(lazy=True, default=0.0)
+
+    class Meta:
+        app_label = 'unixtimestampfield'
+
+
+class BenchStorageModel(models.Model):
+
+    ts = UnixTimeStampField(storage='int64_us', default=0)
+
+    class Meta:
+        app_label = 'unixtimestampfield'
+
+
+ENVIRONMENTS = (
+    ('naive', {'USE_TZ': False}),
+    ('utc', {'USE_TZ': True, 'TIME_ZONE': 'UTC'}),
+    ('taipei', {'USE_TZ': True, 'TIME_ZONE': 'Asia/Taipei'}),
+    ('chicago', {'USE_TZ': True, 'TIME_ZONE': 'America/Chicago'}),
+)
+USF_FORMATS = ('usf_default', 'usf_datetime', 'usf_timestamp')
+
+ROWS = 100000
+BATCH = 10000
+
+# results are medians of REPEAT runs. On a shared machine, whole runs compared with the
+# saved baseline still moved by up to 51% either way (best of 5 repeats: 40%), so default
+# threshold stays above that; pass lower --threshold on a quiet dedicated machine.
+REPEAT = 11
+THRESHOLD = 0.6
+
+BENCHMARKS = []
+
+
+def benchmark(name, number, overrides=None, setup=None):
+    """
+    register function doing ``number`` operations as benchmark
+    """
+    def decorator(func):
+        BENCHMARKS.append((name, number, overrides or {}, setup, func))
+        return func
+    return decorator
+
+
+def timestamps(n):
+    return [1767270896.123456 + i * 37.5 for i in range(n)]
+
+
+FIELD = UnixTimeStampField()
+ORDINAL = OrdinalField()
+VALUES = timestamps(BATCH)
+DATETIMES = [datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=v)
+             for v in range(BATCH)]
+ISO_STRINGS = [d.isoformat() for d in DATETIMES]
+ORDINALS = [739617 + i for i in range(BATCH)]
+
+
+@benchmark('to_timestamp.datetime', BATCH)
+def bench_to_timestamp_datetime():
+    to_timestamp = FIELD.to_timestamp
+    for value in DATETIMES:
+        to_timestamp(value)
+
+
+@benchmark('to_timestamp.iso_string', BATCH)
+def bench_to_timestamp_iso_string():
+    to_timestamp = FIELD.to_timestamp
+    for value in ISO_STRINGS:
+        to_timestamp(value)
+
+
+@benchmark('to_timestamp.float', BATCH)
+def bench_to_timestamp_float():
+    to_timestamp = FIELD.to_timestamp
+    for value in VALUES:
+        to_timestamp(value)
+
+
+def make_to_datetime(env, overrides):
+
+    @benchmark('to_datetime.%s' % env, BATCH, overrides)
+    def bench_to_datetime():
+        to_datetime = FIELD.to_datetime
+        for value in VALUES:
+            to_datetime(value)
+
+
+def make_ordinal(env, overrides):
+
+    @benchmark('ordinal.to_datetime.%s' % env, BATCH, overrides)
+    def bench_ordinal_to_datetime():
+        to_datetime = ORDINAL.to_datetime
+        for value in ORDINALS:
+            to_datetime(value)
+
+    @benchmark('ordinal.to_timestamp.%s' % env, BATCH, overrides)
+    def bench_ordinal_to_timestamp():
+        to_timestamp = ORDINAL.to_timestamp
+        for value in DATETIMES:
+            to_timestamp(value)
+
+
+def make_middleware(usf_format):
+
+    @benchmark('middleware.%s' % usf_format, BATCH, {'USF_FORMAT': usf_format})
+    def bench_middleware():
+        for value in VALUES:
+            field_value_middleware(FIELD, value, stored=True)
+
+
+for env, overrides in ENVIRONMENTS:
+    make_to_datetime(env, overrides)
+    make_ordinal(env, overrides)
+
+for usf_format in USF_FORMATS:
+    make_middleware(usf_format)
+
+
+def fill(model):
+    if not model.objects.exists():
+        model.objects.bulk_create([model(ts=value) for value in timestamps(ROWS)], batch_size=BATCH)
+
+
+@benchmark('queryset.load', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchModel))
+def bench_queryset_load():
+    for _ in BenchModel.objects.all().iterator(chunk_size=BATCH):
+        pass
+
+
+@benchmark('queryset.load_lazy', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchLazyModel))
+def bench_queryset_load_lazy():
+    for _ in BenchLazyModel.objects.all().iterator(chunk_size=BATCH):
+        pass
+
+
+@benchmark('queryset.load_int64_us', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchStorageModel))
+def bench_queryset_load_int64_us():
+    for _ in BenchStorageModel.objects.all().iterator(chunk_size=BATCH):
+        pass
+
+
+@benchmark('queryset.batch_iterator', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchModel))
+def bench_queryset_batch_iterator():
+    for _ in batch_iterator(BenchModel.objects.all(), chunk_size=BATCH):
+        pass
+
+
+@benchmark('queryset.values_list', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchModel))
+def bench_queryset_values_list():
+    for _ in BenchModel.objects.values_list('ts', flat=True).iterator(chunk_size=BATCH):
+        pass
+
+
+class NullStream(object):
+
+    def write(self, value):
+        pass
+
+
+@benchmark('export.iterator_ndjson_iso', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchModel))
+def bench_export_iterator():
+    stream = NullStream()
+    for obj in BenchModel.objects.all().iterator(chunk_size=BATCH):
+        stream.write(json.dumps({
+            'id': obj.id,
+            'created': obj.created.astimezone(datetime.timezone.utc).isoformat(),
+            'ts': obj.ts.astimezone(datetime.timezone.utc).isoformat(),
+        }) + '\n')
+
+
+@benchmark('export.ndjson_iso', ROWS, {'TIME_ZONE': 'Asia/Taipei'}, lambda: fill(BenchModel))
+def bench_export_ndjson():
+    export(BenchModel.objects.all(), NullStream(), timestamps='iso', chunk_size=BATCH)
+
+
+@benchmark('bulk_create.auto_now_add', BATCH)
+def bench_bulk_create():
+    BenchModel.objects.bulk_create([BenchModel(ts=value) for value in VALUES])
+
+
+@benchmark('bulk_create.auto_now_add_batch', BATCH)
+def bench_bulk_create_batch():
+    BenchBatchModel.objects.bulk_create([BenchBatchModel(ts=value) for value in VALUES])
+
+
+TEMPLATE = Template(
+    '{% load unixtimestampfield %}{% for v in values %}{{ v|to_datetime }}{{ v|to_timestamp }}{% endfor %}')
+
+
+@benchmark('template.filters', BATCH, {'TIME_ZONE': 'Asia/Taipei'})
+def bench_template_filters():
+    TEMPLATE.render(Context({'values': VALUES}))
+
+
+FORMAT_TEMPLATE = Template(
+    '{% load unixtimestampfield %}{% for v in values %}{{ v|usf_format:"Y-m-d H:i:s" }}{% endfor %}')
+
+
+@benchmark('template.usf_format', BATCH, {'TIME_ZONE': 'Asia/Taipei'})
+def bench_template_usf_format():
+    FORMAT_TEMPLATE.render(Context({'values': VALUES}))
+
+
+def measure(number, func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return number / statistics.median(timings)
+
+
+def run(selected=None, repeat=REPEAT):
+    with connection.schema_editor() as editor:
+        for model in (BenchModel, BenchBatchModel, BenchLazyModel, BenchStorageModel):
+            editor.create_model(model)
+
+    results = {}
+    for name, number, overrides, setup, func in BENCHMARKS:
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        with override_settings(**overrides):
+            if setup is not None:
+                setup()
+            # the first call warms up caches, e.g. converters and offset transitions
+            func()
+            results[name] = measure(number, func, repeat)
+        print('%-36s %14.0f ops/s' % (name, results[name]))
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'platform': platform.platform(),
+        'date': datetime.date.today().isoformat(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    print comparison report, return names of regressions
+    """
+    print('\nCompared with baseline (%s, Python %s, Django %s)' % (
+        baseline['environment']['date'], baseline['environment']['python'], baseline['environment']['django']))
+    print('%-36s %14s %14s %9s' % ('benchmark', 'baseline', 'current', 'change'))
+
+    regressions = []
+    for name in sorted(results):
+        old, new = baseline['results'].get(name), results[name]
+        if old is None:
+            print('%-36s %14s %14.0f %9s' % (name, '-', new, 'new'))
+            continue
+        change = new / old - 1
+        mark = ''
+        if change < -threshold:
+            mark = '  REGRESSION'
+            regressions.append(name)
+        print('%-36s %14.0f %14.0f %+8.1f%%%s' % (name, old, new, change * 100, mark))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*', help='run benchmarks of which names start with these only')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--save', metavar='FILE', help='save results as baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare results with baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='ratio of slowdown regarded as regression')
+    parser.add_argument('--fail', action='store_true', help='exit with status 1 on regression')
+    args = parser.parse_args()
+
+    results = run(args.names, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            results = {name: round(ops) for name, ops in results.items()}
+            json.dump({'environment': environment(), 'results': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions and args.fail:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -35,6 +35,16 @@ class TestCommand(Command):
                     'NAME': ':memory:',
                     'ENGINE': 'django.db.backends.sqlite3',
                 },
+                # partitions of PartitionTest, which declares them in databases, so test databases of
+                # them are created only as it runs, DATABASES can't be overridden per test
+                'partition_2026_01': {
+                    'NAME': ':memory:',
+                    'ENGINE': 'django.db.backends.sqlite3',
+                },
+                'partition_2026_02': {
+                    'NAME': ':memory:',
+                    'ENGINE': 'django.db.backends.sqlite3',
+                },
             },
             INSTALLED_APPS=[
                 'unixtimestampfield',
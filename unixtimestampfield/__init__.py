@@ -1 +1,2 @@
 from .fields import UnixTimeStampField
+from . import lookups  # noqa: register transforms
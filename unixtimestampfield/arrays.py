@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Arrays
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, read timestamp columns into NumPy arrays from stored values.
+
+
+Stored values of a :class:`~unixtimestampfield.fields.UnixTimeStampField` (or
+:class:`~unixtimestampfield.fields.OrdinalField`) are fetched by ``values_list`` of
+:class:`~unixtimestampfield.functions.RawEpoch` in chunks and written into a buffer allocated
+for ``count()`` of queryset, each chunk is converted as a whole without building datetimes:
+
+.. code-block:: python
+
+    >>> ModelA.objects.filter(...).usf_array('created')
+    array(['2026-01-01T12:34:56.123456', ...], dtype='datetime64[us]')
+    >>> ModelA.objects.filter(...).usf_array('created', dtype='float64')
+    array([1.76727089e+09, ...])
+
+``datetime64[us]`` values are UTC, ``float64`` values are seconds since epoch (days of ordinal are
+converted into seconds as well). NULL is ``NaT`` or ``nan``.
+
+NumPy is optional. Without it, ``float64`` is returned as ``array.array('d')`` and
+``datetime64[us]`` raises ImportError.
+
+
+Contents
+--------
+
+Functions:
+
+* :func:`to_array`
+* :func:`convert_chunk`
+* :func:`convert_chunk_to_seconds`
+
+Members
+-------
+
+"""
+import array
+import itertools
+
+from .fields import EPOCH, OrdinalField, UnixTimeStampField
+from .functions import RawEpoch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DTYPE_DATETIME64 = 'datetime64[us]'
+DTYPE_FLOAT64 = 'float64'
+DTYPES = (DTYPE_DATETIME64, DTYPE_FLOAT64)
+
+CHUNK_SIZE = 10000
+
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+
+def convert_chunk(field, chunk, dtype=DTYPE_DATETIME64):
+    """
+    convert list of stored values of field into NumPy array of dtype
+    """
+    scale = field.storage_scale
+    missing = None
+    if scale is None:
+        # None is nan
+        values = numpy.array(chunk, dtype=numpy.float64)
+        if isinstance(field, OrdinalField):
+            values = (values - EPOCH_ORDINAL) * 86400.0
+    else:
+        try:
+            values = numpy.array(chunk, dtype=numpy.int64)
+        except TypeError:
+            missing = numpy.fromiter((value is None for value in chunk), dtype=bool, count=len(chunk))
+            values = numpy.array([0 if value is None else value for value in chunk], dtype=numpy.int64)
+
+    if dtype == DTYPE_FLOAT64:
+        if scale is None:
+            return values
+        values = values / scale
+        if missing is not None:
+            values[missing] = numpy.nan
+        return values
+
+    if scale is None:
+        missing = numpy.isnan(values)
+        values = numpy.rint(values * 1000000.0)
+        values[missing] = 0
+        values = values.astype(numpy.int64)
+    elif scale != 1000000:
+        values *= 1000000 // scale
+    values = values.view(DTYPE_DATETIME64)
+    if missing is not None:
+        values[missing] = numpy.datetime64('NaT')
+    return values
+
+
+def convert_chunk_to_seconds(field, chunk):
+    """
+    convert list of stored values of field into ``array.array('d')`` of seconds, without NumPy
+    """
+    if field.storage_scale is None and not isinstance(field, OrdinalField):
+        try:
+            return array.array('d', chunk)
+        except TypeError:
+            pass
+    nan, to_seconds = float('nan'), field.stored_to_seconds
+    return array.array('d', [nan if value is None else to_seconds(value) for value in chunk])
+
+
+def to_array(queryset, name, dtype=DTYPE_DATETIME64, chunk_size=CHUNK_SIZE):
+    """
+    return array of values of timestamp field ``name`` of queryset, as ``datetime64[us]`` in UTC
+    or ``float64`` seconds, fetched and converted in chunks of ``chunk_size`` rows
+    """
+    field = queryset.model._meta.get_field(name)
+    if not isinstance(field, UnixTimeStampField):
+        raise ValueError('%s should be a UnixTimeStampField or OrdinalField' % name)
+    if dtype not in DTYPES:
+        raise ValueError('dtype: %s should be one of %s' % (dtype, ', '.join(DTYPES)))
+    if numpy is None and dtype == DTYPE_DATETIME64:
+        raise ImportError('NumPy is required for %s arrays' % dtype)
+
+    count = queryset.count()
+    if numpy is None:
+        buffer = array.array('d', bytes(8 * count))
+    else:
+        buffer = numpy.empty(count, dtype=dtype)
+
+    rows = queryset.values_list(RawEpoch(name), flat=True).iterator(chunk_size=chunk_size)
+    filled = 0
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        end = filled + len(chunk)
+        if numpy is None:
+            # slice assignment grows array if rows were added after count
+            buffer[filled:end] = convert_chunk_to_seconds(field, chunk)
+        else:
+            if end > len(buffer):
+                buffer = numpy.concatenate([buffer[:filled], numpy.empty(end - filled, dtype=dtype)])
+            buffer[filled:end] = convert_chunk(field, chunk, dtype)
+        filled = end
+
+    if filled < len(buffer):
+        # rows were deleted after count
+        buffer = buffer[:filled]
+    return buffer
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+"""
+Backfill from DateTimeField
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, copy DateTimeField columns into UnixTimeStampField columns in chunks.
+
+
+Values of a DateTimeField are converted into stored values of a
+:class:`~unixtimestampfield.fields.UnixTimeStampField` of the same model and written by
+``bulk_update`` in chunks of primary keys or of time ranges of the source field, one transaction
+per chunk. Chunks could be run by a pool of processes, completed ones are recorded in a
+checkpoint file so that an interrupted run resumes where it stopped.
+
+Management command ``usf_convert_datetime`` runs it:
+
+.. code-block:: bash
+
+    python manage.py usf_convert_datetime app.ModelA created created_ts --chunk-size 10000 \\
+        --workers 4 --checkpoint created.json --sleep 0.1
+
+Rows of which source is NULL are left as they are.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`Backfill`
+* :class:`Checkpoint`
+
+Functions:
+
+* :func:`run`
+
+Members
+-------
+
+"""
+import datetime
+import json
+import os
+import time
+import zoneinfo
+
+from concurrent import futures
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, models, transaction
+
+from .fields import EPOCH_UTC, LazyTimestamp, UnixTimeStampField
+
+BY_PK = 'pk'
+BY_TIME = 'time'
+
+
+class Backfill(object):
+    """
+    Convert ``source`` DateTimeField of model (``app_label.ModelName``) into ``target`` UnixTimeStampField
+
+    Chunks are ``chunk_size`` primary keys (integers) with ``by='pk'``, or ``interval`` seconds of source
+    with ``by='time'``. Naive values are in ``naive_timezone``.
+    """
+
+    def __init__(self, label, source, target, by=BY_PK, chunk_size=5000, interval=86400,
+                 using='default', naive_timezone='UTC', sleep=0):
+        self.label, self.source, self.target, self.by = label, source, target, by
+        self.chunk_size, self.interval, self.using = chunk_size, interval, using
+        self.naive_timezone, self.sleep = naive_timezone, sleep
+        self.check()
+
+    @property
+    def model(self):
+        return apps.get_model(self.label)
+
+    def check(self):
+        meta = self.model._meta
+        if not isinstance(meta.get_field(self.source), models.DateTimeField):
+            raise ValueError('source: %s should be a DateTimeField' % self.source)
+        if not isinstance(meta.get_field(self.target), UnixTimeStampField):
+            raise ValueError('target: %s should be a UnixTimeStampField' % self.target)
+        if self.by not in (BY_PK, BY_TIME):
+            raise ValueError('by: %s should be one of %s, %s' % (self.by, BY_PK, BY_TIME))
+        if self.by == BY_PK and not isinstance(meta.pk, (models.AutoField, models.IntegerField)):
+            raise ValueError('primary key of %s is not an integer, chunk by time instead' % self.label)
+
+    @property
+    def params(self):
+        """
+        parameters determining chunks, checked against checkpoint
+        """
+        return {
+            'model': self.label, 'source': self.source, 'target': self.target, 'by': self.by,
+            'chunk_size': self.chunk_size, 'interval': self.interval,
+        }
+
+    def get_queryset(self):
+        return self.model._base_manager.using(self.using).exclude(**{'%s__isnull' % self.source: True})
+
+    def get_chunks(self):
+        """
+        return [(low, high)], primary keys or epoch seconds in ``[low, high)``
+        """
+        field = self.source if self.by == BY_TIME else 'pk'
+        bounds = self.get_queryset().aggregate(low=models.Min(field), high=models.Max(field))
+        low, high = bounds['low'], bounds['high']
+        if low is None:
+            return []
+
+        if self.by == BY_PK:
+            step = self.chunk_size
+        else:
+            low, high, step = self.to_seconds(low), self.to_seconds(high), self.interval
+            low = low // step * step
+        return [(start, start + step) for start in range(int(low), int(high) + 1, step)]
+
+    def to_seconds(self, value):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=zoneinfo.ZoneInfo(self.naive_timezone))
+        return int((value - EPOCH_UTC).total_seconds())
+
+    def from_seconds(self, seconds):
+        value = EPOCH_UTC + datetime.timedelta(seconds=seconds)
+        if settings.USE_TZ:
+            return value
+        return value.astimezone(zoneinfo.ZoneInfo(self.naive_timezone)).replace(tzinfo=None)
+
+    def estimate(self, done=()):
+        """
+        return (rows, chunks) to convert, chunks in ``done`` and rows of them excluded
+        """
+        chunks = self.get_chunks()
+        pending = [chunk for chunk in chunks if chunk not in done]
+        if len(pending) == len(chunks):
+            return self.get_queryset().count(), len(pending)
+        # rows are counted per chunk, of done ones or pending ones, whichever are fewer
+        if len(pending) <= len(chunks) - len(pending):
+            rows = sum(self.get_chunk_queryset(chunk).count() for chunk in pending)
+        else:
+            rows = self.get_queryset().count() - sum(
+                self.get_chunk_queryset(chunk).count() for chunk in chunks if chunk in done)
+        return rows, len(pending)
+
+    def get_chunk_queryset(self, chunk):
+        low, high = chunk
+        if self.by == BY_PK:
+            return self.get_queryset().filter(pk__gte=low, pk__lt=high)
+        return self.get_queryset().filter(**{
+            '%s__gte' % self.source: self.from_seconds(low),
+            '%s__lt' % self.source: self.from_seconds(high),
+        })
+
+    def run_chunk(self, chunk):
+        """
+        convert rows of chunk, written in one transaction, return number of rows
+        """
+        model = self.model
+        field = model._meta.get_field(self.target)
+        rows = self.get_chunk_queryset(chunk)
+
+        tz = zoneinfo.ZoneInfo(self.naive_timezone)
+        objs = []
+        for pk, value in rows.values_list('pk', self.source).iterator():
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=tz)
+            obj = model(pk=pk)
+            # stored values are saved as they are
+            setattr(obj, field.attname, LazyTimestamp(field, field.to_storage(value)))
+            objs.append(obj)
+
+        # rows are read before transaction, so that it only holds locks of writes
+        if objs:
+            with transaction.atomic(using=self.using):
+                models.QuerySet(model, using=self.using).bulk_update(objs, [self.target], batch_size=1000)
+
+        if self.sleep:
+            time.sleep(self.sleep)
+        return len(objs)
+
+
+class Checkpoint(object):
+    """
+    Chunks done, kept in JSON file with parameters of backfill
+    """
+
+    def __init__(self, path, params):
+        self.path, self.params, self.done = path, params, set()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data['params'] != params:
+                raise ValueError('checkpoint %s is of other parameters: %s' % (path, data['params']))
+            self.done = {tuple(chunk) for chunk in data['done']}
+
+    def add(self, chunk):
+        self.done.add(tuple(chunk))
+        if not self.path:
+            return
+        temporary = '%s.tmp' % self.path
+        with open(temporary, 'w') as f:
+            json.dump({'params': self.params, 'done': sorted(self.done)}, f)
+        os.replace(temporary, self.path)
+
+
+def init_worker():
+    """
+    set up Django in worker process started by spawn, connections are opened by each worker
+    """
+    if not apps.ready:
+        django.setup()
+
+
+def run(backfill, checkpoint=None, workers=1, callback=None):
+    """
+    run chunks of backfill not done in checkpoint, by a pool of ``workers`` processes if more than 1,
+    ``callback(chunk, rows)`` is called as each chunk is done, return number of rows converted
+    """
+    checkpoint = checkpoint or Checkpoint(None, backfill.params)
+    chunks = [chunk for chunk in backfill.get_chunks() if chunk not in checkpoint.done]
+    converted = 0
+
+    def done(chunk, rows):
+        checkpoint.add(chunk)
+        if callback is not None:
+            callback(chunk, rows)
+        return rows
+
+    if workers <= 1:
+        for chunk in chunks:
+            converted += done(chunk, backfill.run_chunk(chunk))
+        return converted
+
+    # forked workers must not share connections of parent
+    connections.close_all()
+    with futures.ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        pending = {executor.submit(backfill.run_chunk, chunk): chunk for chunk in chunks}
+        for future in futures.as_completed(pending):
+            converted += done(pending[future], future.result())
+    return converted
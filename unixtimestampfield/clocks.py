@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""
+Clocks
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, pluggable clock sources of now and frozen now within a context.
+
+
+Clocks are callables returning now as naive UTC datetime. They are registered by name,
+fields use the one of **clock** option or `USF_CLOCK` setting (``system`` by default).
+
+Within :class:`frozen_now`, e.g. a request or transaction, each clock is read once and
+all fields of the same clock get the same now.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`SystemClock`
+* :class:`CoarseClock`
+* :class:`TestClock`
+* :class:`frozen_now`
+
+Functions:
+
+* :func:`register_clock`
+* :func:`get_clock`
+* :func:`now`
+
+Members
+-------
+
+"""
+import contextvars
+import datetime
+import functools
+import threading
+import time
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:  # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+class SystemClock(object):
+    """
+    Read system clock every time
+    """
+
+    def __call__(self):
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class CoarseClock(object):
+    """
+    Read system clock at most once per ``resolution`` seconds, the cached now is returned in between
+    """
+
+    def __init__(self, resolution=0.01):
+        self.resolution = resolution
+        self.cached = (float('-inf'), None)
+
+    def __call__(self):
+        read_at, value = self.cached
+        tick = time.monotonic()
+        if tick - read_at >= self.resolution:
+            value = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+            self.cached = (tick, value)
+        return value
+
+
+class TestClock(object):
+    """
+    Clock under control of tests, starts from ``start`` (naive UTC, epoch by default)
+    """
+
+    def __init__(self, start=None):
+        self.value = start or datetime.datetime(1970, 1, 1)
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.value
+
+    def set(self, value):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        self.value = value
+
+    def advance(self, seconds=0, **kwargs):
+        """
+        move forward by seconds or timedelta keywords
+        """
+        with self.lock:
+            self.value += datetime.timedelta(seconds=seconds, **kwargs)
+        return self.value
+
+
+_clocks = {
+    'system': SystemClock(),
+    'coarse': CoarseClock(),
+}
+
+
+def register_clock(name, clock):
+    """
+    register clock by name, return clock
+    """
+    _clocks[name] = clock
+    return clock
+
+
+def get_default_clock():
+    return getattr(settings, 'USF_CLOCK', 'system')
+
+
+DEFAULT_CLOCK = get_default_clock()
+
+
+@receiver(setting_changed)
+def reset_default_clock(setting, **kwargs):
+    global DEFAULT_CLOCK
+    if setting == 'USF_CLOCK':
+        DEFAULT_CLOCK = get_default_clock()
+
+
+def get_clock(clock=None):
+    """
+    get clock by name, callables are returned as they are, None for default clock
+    """
+    if clock is None:
+        clock = DEFAULT_CLOCK
+    if callable(clock):
+        return clock
+    try:
+        return _clocks[clock]
+    except KeyError:
+        raise ValueError('clock: %s is not registered, registered: %s' % (clock, ', '.join(sorted(_clocks))))
+
+
+# {clock: now} read within frozen_now
+_frozen = contextvars.ContextVar('unixtimestampfield_frozen_now', default=None)
+
+
+class frozen_now(object):
+    """
+    read each clock once within, e.g. a request or transaction, usable as decorator of sync and async
+    functions as well
+
+    Nested ones share now of the outermost one.
+    """
+
+    def __init__(self):
+        self.tokens = []
+
+    def __enter__(self):
+        self.tokens.append(None if _frozen.get() is not None else _frozen.set({}))
+
+    def __exit__(self, *exc_info):
+        token = self.tokens.pop()
+        if token is not None:
+            _frozen.reset(token)
+
+    def __call__(self, func):
+        # each call sets its own token, calls may run concurrently
+        if iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def inner(*args, **kwargs):
+                with frozen_now():
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                with frozen_now():
+                    return func(*args, **kwargs)
+        return inner
+
+
+def now(clock=None):
+    """
+    now as naive UTC datetime from clock (name or callable, default clock if None),
+    which is read once per clock within :class:`frozen_now`
+    """
+    clock = get_clock(clock)
+    frozen = _frozen.get()
+    if frozen is None:
+        return clock()
+    try:
+        return frozen[clock]
+    except KeyError:
+        value = frozen[clock] = clock()
+        return value
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""
+Export
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, stream querysets as NDJSON or CSV.
+
+
+Rows are fetched by ``values_list`` in chunks, columns of
+:class:`~unixtimestampfield.fields.UnixTimeStampField` are selected by
+:class:`~unixtimestampfield.functions.RawEpoch` and formatted from stored values as numbers
+(seconds, or days of ordinal) or ISO 8601 strings in UTC, without building datetimes.
+Memory is constant whatever size of queryset.
+
+.. code-block:: python
+
+    >>> from unixtimestampfield.export import export
+    >>> with open('a.ndjson', 'w') as f:
+    ...     export(ModelA.objects.all(), f, timestamps='iso')
+
+Or by management command::
+
+    python manage.py usf_export app.ModelA --format csv --timestamps iso -o a.csv
+
+
+Contents
+--------
+
+Functions:
+
+* :func:`format_iso`
+* :func:`iter_rows`
+* :func:`iter_ndjson`
+* :func:`iter_csv`
+* :func:`export`
+
+Members
+-------
+
+"""
+import csv
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .fields import OrdinalField, UnixTimeStampField
+from .functions import RawEpoch
+
+FORMAT_NDJSON = 'ndjson'
+FORMAT_CSV = 'csv'
+FORMATS = (FORMAT_NDJSON, FORMAT_CSV)
+
+TIMESTAMPS_NUMBER = 'number'
+TIMESTAMPS_ISO = 'iso'
+TIMESTAMPS = (TIMESTAMPS_NUMBER, TIMESTAMPS_ISO)
+
+CHUNK_SIZE = 2000
+
+EPOCH_ORDINAL = 719163  # 1970/01/01
+
+# minutes since epoch: 'YYYY-mm-ddTHH:MM:', cleared when full
+MINUTE_CACHE_SIZE = 4096
+_minutes = {}
+
+
+def get_minute_prefix(minutes):
+    prefix = _minutes.get(minutes)
+    if prefix is None:
+        days, minute = divmod(minutes, 1440)
+        prefix = '%sT%02d:%02d:' % (
+            datetime.date.fromordinal(days + EPOCH_ORDINAL).isoformat(), minute // 60, minute % 60)
+        if len(_minutes) >= MINUTE_CACHE_SIZE:
+            _minutes.clear()
+        _minutes[minutes] = prefix
+    return prefix
+
+
+def format_iso(microseconds):
+    """
+    format microseconds since epoch as ISO 8601 in UTC, e.g. 2026-01-01T12:34:56.123000Z,
+    like isoformat of datetime, fraction is omitted if zero
+    """
+    minutes, microseconds = divmod(microseconds, 60000000)
+    seconds, microseconds = divmod(microseconds, 1000000)
+    if microseconds:
+        return '%s%02d.%06dZ' % (get_minute_prefix(minutes), seconds, microseconds)
+    return '%s%02dZ' % (get_minute_prefix(minutes), seconds)
+
+
+def get_formatter(field, timestamps):
+    """
+    return function formatting stored value of field, None for values as they are
+    """
+    if isinstance(field, OrdinalField):
+        if timestamps == TIMESTAMPS_NUMBER:
+            return int
+        return lambda value: datetime.date.fromordinal(int(value)).isoformat()
+
+    scale = field.storage_scale
+    if timestamps == TIMESTAMPS_NUMBER:
+        if scale is None or scale == 1:
+            return None
+        return lambda value: value / scale
+    if scale is None:
+        return lambda value: format_iso(round(value * 1000000))
+    step = 1000000 // scale
+    return lambda value: format_iso(value * step)
+
+
+def get_columns(model, fields=None, timestamps=TIMESTAMPS_NUMBER):
+    """
+    return [(name, selected, formatter)], concrete fields by default
+    """
+    if timestamps not in TIMESTAMPS:
+        raise ValueError('timestamps: %s should be one of %s' % (timestamps, ', '.join(TIMESTAMPS)))
+    if fields is None:
+        fields = [field.attname for field in model._meta.concrete_fields]
+
+    columns = []
+    for name in fields:
+        field = model._meta.get_field(name)
+        if isinstance(field, UnixTimeStampField):
+            columns.append((name, RawEpoch(name), get_formatter(field, timestamps)))
+        else:
+            columns.append((name, name, None))
+    return columns
+
+
+def iter_rows(queryset, fields=None, timestamps=TIMESTAMPS_NUMBER, chunk_size=CHUNK_SIZE, columns=None):
+    """
+    yield tuples of values of fields (concrete fields by default) fetched in chunks
+    """
+    if columns is None:
+        columns = get_columns(queryset.model, fields, timestamps)
+    formatters = [(i, formatter) for i, (_, _, formatter) in enumerate(columns) if formatter is not None]
+    rows = queryset.values_list(*[selected for _, selected, _ in columns]).iterator(chunk_size=chunk_size)
+
+    if not formatters:
+        yield from rows
+        return
+
+    for row in rows:
+        row = list(row)
+        for i, formatter in formatters:
+            if row[i] is not None:
+                row[i] = formatter(row[i])
+        yield row
+
+
+def iter_ndjson(queryset, fields=None, timestamps=TIMESTAMPS_NUMBER, chunk_size=CHUNK_SIZE):
+    """
+    yield lines of JSON objects
+    """
+    columns = get_columns(queryset.model, fields, timestamps)
+    names = [name for name, _, _ in columns]
+    encode = DjangoJSONEncoder().encode
+    for row in iter_rows(queryset, chunk_size=chunk_size, columns=columns):
+        yield encode(dict(zip(names, row))) + '\n'
+
+
+class Echo(object):
+    """
+    file-like object returning what is written, for csv.writer
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset, fields=None, timestamps=TIMESTAMPS_NUMBER, chunk_size=CHUNK_SIZE):
+    """
+    yield lines of CSV, header of field names at first
+    """
+    columns = get_columns(queryset.model, fields, timestamps)
+    writer = csv.writer(Echo(), lineterminator='\n')
+    yield writer.writerow([name for name, _, _ in columns])
+    for row in iter_rows(queryset, chunk_size=chunk_size, columns=columns):
+        yield writer.writerow(row)
+
+
+def export(queryset, stream, format=FORMAT_NDJSON, fields=None, timestamps=TIMESTAMPS_NUMBER,
+           chunk_size=CHUNK_SIZE):
+    """
+    write queryset into text stream as NDJSON or CSV, return number of rows
+    """
+    if format == FORMAT_NDJSON:
+        lines = iter_ndjson(queryset, fields, timestamps, chunk_size)
+    elif format == FORMAT_CSV:
+        lines = iter_csv(queryset, fields, timestamps, chunk_size)
+        stream.write(next(lines))
+    else:
+        raise ValueError('format: %s should be one of %s' % (format, ', '.join(FORMATS)))
+
+    count = 0
+    for line in lines:
+        stream.write(line)
+        count += 1
+    return count
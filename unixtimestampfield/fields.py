@@ -5,6 +5,20 @@ UnixTimeStampField
 
 release |release|, version |version|
 
+.. versionadded:: 1.1.0
+
+    Per-field converters resolve settings once and are rebuilt when settings changed.
+    Add **storage** option for integer columns (seconds, milliseconds, microseconds).
+    Convert to local datetimes with cached UTC offset transitions of default timezone.
+    Parse ISO 8601 strings with offset and formats of **USF_INPUT_FORMATS**.
+    Add **lazy** option to load values as :class:`LazyTimestamp`.
+    Stamp auto_now fields with one clock read per batch in :func:`stamp_batch`.
+    Add **clock** option to read now from clocks of :mod:`unixtimestampfield.clocks`.
+    Accept Decimal as number.
+    Bind ``db_default=EpochNow()`` to storage, auto_now_add fields with it are stamped by database.
+    Add **storage** option ``int32_d`` for integer columns of OrdinalField, and **use_date** option
+    to use dates instead of datetimes of midnight.
+
 .. versionadded:: 0.4.0
 
     Import Six library from https://pypi.org/project/six/.
@@ -48,34 +62,243 @@ Contents
 Classes:
 
 * :class:`TimestampPatchMixin`
+* :class:`LazyTimestamp`
 * :class:`UnixTimeStampField`
 * :class:`OrdinalPatchMixin`
 * :class:`OrdinalField`
 
+Functions:
+
+* :func:`stamp_batch`
+* :func:`to_seconds`
+* :func:`refresh_db_now`
+
 Members
 -------
 
 """
 from __future__ import unicode_literals
 
+import contextlib
+import contextvars
 import datetime
+import decimal
+import math
+import operator
+import re
 
 from django.db.models import Field
+from django.db.models.signals import post_save
 from django.utils import timezone
 from django.core import exceptions
+from django.core.signals import setting_changed
 from django.conf import settings
+from django.dispatch import receiver
 from django.forms import fields
 
 import six
 
-from .submiddleware import field_value_middleware
+try:
+    from django.db.models.expressions import DatabaseDefault
+except ImportError:  # Django < 5.0, without db_default
+    DatabaseDefault = None
+
+from .functions import EpochNow
+from .submiddleware import field_value_middleware, USF_DATETIME, USF_TIMESTAMP, USF_DEFAULT
+from .transitions import get_table
+from . import clocks
+
+NUMBER_TYPES = (float, ) + six.integer_types
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+# storage: (internal type, stored units per second)
+STORAGE_FLOAT, STORAGE_INT32_S, STORAGE_INT64_MS, STORAGE_INT64_US = (
+    'float', 'int32_s', 'int64_ms', 'int64_us')
+STORAGES = {
+    STORAGE_FLOAT: ('FloatField', None),
+    STORAGE_INT32_S: ('IntegerField', 1),
+    STORAGE_INT64_MS: ('BigIntegerField', 1000),
+    STORAGE_INT64_US: ('BigIntegerField', 1000000),
+}
+
+# storage of OrdinalField: internal type, stored as days
+STORAGE_INT32_D = 'int32_d'
+ORDINAL_STORAGES = {
+    STORAGE_FLOAT: 'FloatField',
+    STORAGE_INT32_D: 'IntegerField',
+}
+
+
+def to_seconds(value):
+    """
+    from datetime (naive in UTC) or number to seconds since epoch
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return (value - EPOCH).total_seconds()
+    return float(value)
+
+
+NUMERIC_STR = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$')
+
+
+def looks_numeric(value):
+    """
+    classify string up front instead of failing float() on datetime strings,
+    which contain ':' or '-' after the sign while numbers don't, except negative exponents
+    """
+    if ':' in value:
+        return False
+    if '-' not in value[1:]:
+        return True
+    return NUMERIC_STR.match(value) is not None
+
+
+# tried in order after ISO 8601 format
+DEFAULT_INPUT_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S',
+)
+
+
+def get_input_formats():
+    return tuple(getattr(settings, 'USF_INPUT_FORMATS', DEFAULT_INPUT_FORMATS))
+
+
+INPUT_FORMATS = get_input_formats()
+
+
+@receiver(setting_changed)
+def reset_input_formats(setting, **kwargs):
+    global INPUT_FORMATS
+    if setting == 'USF_INPUT_FORMATS':
+        INPUT_FORMATS = get_input_formats()
+
+
+# auto_now values shared within a batch, {field: (value, stamp)}
+_batch_stamps = contextvars.ContextVar('unixtimestampfield_batch_stamps', default=None)
+
+
+@contextlib.contextmanager
+def stamp_batch():
+    """
+    read clock once within, auto_now and auto_now_add fields saved inside are stamped with the same value,
+    which is converted once per field
+    """
+    if _batch_stamps.get() is not None:
+        yield
+        return
+
+    token = _batch_stamps.set({})
+    try:
+        with clocks.frozen_now():
+            yield
+    finally:
+        _batch_stamps.reset(token)
+
+
+def refresh_db_now(sender, instance, created=False, raw=False, using=None, **kwargs):
+    """
+    reload fields stamped by database after insert, which are returned by INSERT already
+    on databases supporting RETURNING
+    """
+    if not created or raw:
+        return
+    names = [
+        field.attname for field in sender._meta.concrete_fields
+        if getattr(field, 'db_now', False) and hasattr(instance.__dict__.get(field.attname), 'resolve_expression')
+    ]
+    if names:
+        instance.refresh_from_db(using=using, fields=names)
+
+
+# bumped while settings which converters depend on are changed
+_converters_generation = 0
+
+
+@receiver(setting_changed)
+def expire_converters(setting, **kwargs):
+    global _converters_generation
+    if setting in ('USE_TZ', 'TIME_ZONE'):
+        _converters_generation += 1
 
 
 class TimestampPatchMixin(object):
 
     INT32 = (1 << 31) - 1
+    clock = None
     MAX_TS, MIN_TS = 253402271999.999, -719162  # 9999/12/31 23:59:59, 1/1/1 00:00:00
 
+    def get_converter(self, usf_format, stored=False):
+        """
+        get converter of usf_format, built once and cached until settings changed
+
+        stored converters take values as stored in database
+        """
+        cache = self.__dict__.get('_converters')
+        if cache is None or cache[0] != _converters_generation:
+            cache = self._converters = (_converters_generation, {})
+
+        try:
+            return cache[1][usf_format, stored]
+        except KeyError:
+            converter = cache[1][usf_format, stored] = self.build_converter(usf_format, stored)
+            return converter
+
+    def build_converter(self, usf_format, stored=False):
+        """
+        build converter of usf_format according to field options and current settings
+        """
+        if usf_format == USF_DEFAULT:
+            usf_format = USF_TIMESTAMP if getattr(self, 'use_numeric', False) else USF_DATETIME
+
+        if usf_format == USF_DATETIME:
+            return self._build_datetime_converter(stored)
+
+        if usf_format == USF_TIMESTAMP:
+            return self._build_timestamp_converter(stored)
+
+        raise ValueError('USF_FORMAT: %s should not in optional values' % usf_format)
+
+    def _build_timestamp_converter(self, stored=False):
+        return self.to_timestamp
+
+    def _build_datetime_converter(self, stored=False):
+        """
+        specialise to_datetime for USE_TZ and TIME_ZONE, numbers skip type dispatching
+        """
+        from_number = self.from_stored if stored else self.from_number
+        to_naive = self.to_naive_datetime
+
+        if not settings.USE_TZ:
+            def to_naive_datetime(value):
+                if value.__class__ in NUMBER_TYPES:
+                    return from_number(value)
+                return to_naive(value)
+            return to_naive_datetime
+
+        utc, to_utc = datetime.timezone.utc, self.to_utc_datetime
+
+        if settings.TIME_ZONE == 'UTC':
+            def to_utc_datetime(value):
+                if value.__class__ in NUMBER_TYPES:
+                    return from_number(value).replace(tzinfo=utc)
+                return to_utc(value)
+            return to_utc_datetime
+
+        # offsets are looked up in cached transitions instead of tzinfo
+        fromutc = get_table(timezone.get_default_timezone()).fromutc
+
+        def to_default_timezone_datetime(value):
+            if value.__class__ in NUMBER_TYPES:
+                return fromutc(from_number(value))
+            return fromutc(to_utc(value).replace(tzinfo=None))
+        return to_default_timezone_datetime
+
     def _datetime_to_timestamp(self, v):
         """
         Py2 doesn't supports timestamp()
@@ -83,15 +306,30 @@ class TimestampPatchMixin(object):
 
         # stole from https://docs.python.org/3/library/datetime.html#datetime.datetime.timestamp
         if timezone.is_aware(v):
-            return (v - timezone.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)).total_seconds()
+            return (v - EPOCH_UTC).total_seconds()
         else:
-            return (v - timezone.datetime(1970, 1, 1)).total_seconds()
+            return (v - EPOCH).total_seconds()
 
-    def get_datetimenow(self):
+    def _datetime_to_microseconds(self, v):
         """
-        get datetime now according to USE_TZ and default time
+        exact integer version of _datetime_to_timestamp
         """
-        value = timezone.datetime.utcnow()
+        if timezone.is_aware(v):
+            return (v - EPOCH_UTC) // ONE_MICROSECOND
+        else:
+            return (v - EPOCH) // ONE_MICROSECOND
+
+    def get_utcnow(self):
+        """
+        get naive UTC now from clock of field
+        """
+        return clocks.now(self.clock)
+
+    def get_datetimenow(self, now=None):
+        """
+        get datetime now according to USE_TZ and default time, or of ``now`` (naive UTC) if given
+        """
+        value = self.get_utcnow() if now is None else now
         if settings.USE_TZ:
             value = timezone.localtime(
                 timezone.make_aware(value, datetime.timezone.utc),
@@ -103,13 +341,16 @@ class TimestampPatchMixin(object):
         """
         get utc unix timestamp
         """
-        return self._datetime_to_timestamp(timezone.datetime.utcnow())
+        return self._datetime_to_timestamp(self.get_utcnow())
 
     def to_timestamp(self, value):
         """
         from value to timestamp format(float)
         """
-        if isinstance(value, (six.integer_types, float, six.string_types)):
+        if isinstance(value, six.string_types) and not looks_numeric(value):
+            value = self.datetime_str_to_datetime(value)
+
+        if isinstance(value, (six.integer_types, float, decimal.Decimal, six.string_types)):
             try:
                 return float(value)
             except ValueError:
@@ -133,7 +374,10 @@ class TimestampPatchMixin(object):
         """
         from value to datetime with tzinfo format (datetime.datetime instance)
         """
-        if isinstance(value, (six.integer_types, float, six.string_types)):
+        if isinstance(value, six.string_types) and not looks_numeric(value):
+            return self.datetime_str_to_datetime(value)
+
+        if isinstance(value, (six.integer_types, float, decimal.Decimal, six.string_types)):
             try:
                 return self.from_number(value)
             except ValueError:
@@ -172,31 +416,46 @@ class TimestampPatchMixin(object):
         return timezone.localtime(self.to_utc_datetime(value), timezone.get_default_timezone())
 
     def to_datetime(self, value):
-
-        if settings.USE_TZ:
-            if settings.TIME_ZONE != 'UTC':
-                return self.to_default_timezone_datetime(value)
-            else:
-                return self.to_utc_datetime(value)
-        else:
-            return self.to_naive_datetime(value)
+        """
+        convert to datetime according to USE_TZ and TIME_ZONE
+        """
+        return self.get_converter(USF_DATETIME)(value)
 
     def datetime_str_to_datetime(self, value):
+        """
+        parse ISO 8601 string (with offset or Z) or formats of USF_INPUT_FORMATS in order
+
+        strings with offset are converted into naive UTC datetime
+        """
+        text = value.strip()
         try:
-            if value.find('.') >= 0:
-                return timezone.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ')
+            if text.endswith(('Z', 'z')):
+                result = datetime.datetime.fromisoformat(text[:-1] + '+00:00')
             else:
-                return timezone.datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ')
-        except:
+                result = datetime.datetime.fromisoformat(text)
+        except ValueError:
+            result = None
+            for input_format in INPUT_FORMATS:
+                try:
+                    result = datetime.datetime.strptime(text, input_format)
+                    break
+                except ValueError:
+                    continue
+
+        if result is None:
             raise exceptions.ValidationError(
                 "Unable to convert value: '%s' to datetime, "
                 "please use 'YYYY-mm-dd HH:MM:SS'" % value,
                 code="invalid_timestamp"
             )
 
+        if result.tzinfo is not None:
+            result = result.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return result
+
     def from_number(self, value):
         value = float(value)
-        if value > self.MAX_TS or value < self.MIN_TS:
+        if not self.MIN_TS <= value <= self.MAX_TS:
             raise exceptions.ValidationError(
                 "Value out of range,acceptable: "
                 "%s ~ %s (1/1/1 00:00:00 ~ 9999/12/31 23:59:59)" % (self.MIN_TS, self.MAX_TS),
@@ -205,6 +464,99 @@ class TimestampPatchMixin(object):
 
         return timezone.datetime(1970, 1, 1, 0, 0) + timezone.timedelta(seconds=value)
 
+    def from_stored(self, value):
+        """
+        from value stored in database to naive datetime
+        """
+        return self.from_number(value)
+
+
+class LazyTimestamp(object):
+    """
+    Raw stored value loaded by field with ``lazy=True``, converted into value of field
+    (datetime or number according to USF_FORMAT) and cached on first attribute access,
+    comparison or :meth:`resolve`.
+
+    Lazy values of the same field are compared by raw values without conversion,
+    and saved back by the field as they are.
+    """
+    __slots__ = ('field', 'raw', '_value')
+
+    def __init__(self, field, raw):
+        self.field, self.raw, self._value = field, raw, LazyTimestamp
+
+    def resolve(self):
+        value = self._value
+        if value is LazyTimestamp:
+            value = self._value = field_value_middleware(self.field, self.raw, stored=True)
+        return value
+
+    def __getattr__(self, name):
+        # probes like hasattr(value, 'resolve_expression') of ORM shouldn't convert value
+        if not (hasattr(datetime.datetime, name) or hasattr(float, name)):
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, name))
+        return getattr(self.resolve(), name)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _compare(self, other, op):
+        if other.__class__ is LazyTimestamp:
+            if other.field is self.field:
+                return op(self.raw, other.raw)
+            other = other.resolve()
+        return op(self.resolve(), other)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __hash__(self):
+        return hash(self.resolve())
+
+    def __bool__(self):
+        return bool(self.resolve())
+
+    def __float__(self):
+        return float(self.resolve())
+
+    def __add__(self, other):
+        return self.resolve() + other
+
+    def __radd__(self, other):
+        return other + self.resolve()
+
+    def __sub__(self, other):
+        if other.__class__ is LazyTimestamp:
+            other = other.resolve()
+        return self.resolve() - other
+
+    def __rsub__(self, other):
+        return other - self.resolve()
+
+    def __str__(self):
+        return str(self.resolve())
+
+    def __repr__(self):
+        return '<%s: %r>' % (self.__class__.__name__, self.raw)
+
 
 class UnixTimeStampField(TimestampPatchMixin, Field):
     """
@@ -215,15 +567,40 @@ class UnixTimeStampField(TimestampPatchMixin, Field):
     empty_strings_allowed = False
     description = "Unix POSIX timestamp"
 
-    def __init__(self, verbose_name=None, name=None, auto_now=False,
-                 auto_now_add=False, round_to=6, use_numeric=False, **kwargs):
+    storage, storage_scale, round_to = STORAGE_FLOAT, None, 6
+
+    def __init__(self, verbose_name=None, name=None, auto_now=False, auto_now_add=False,
+                 round_to=6, use_numeric=False, storage=STORAGE_FLOAT, lazy=False, clock=None, **kwargs):
         self.auto_now, self.auto_now_add = auto_now, auto_now_add
-        self.round_to, self.use_numeric = round_to, use_numeric
+        self.round_to, self.use_numeric, self.lazy, self.clock = round_to, use_numeric, lazy, clock
+        if storage not in STORAGES:
+            raise ValueError('storage: %s should be one of %s' % (storage, ', '.join(sorted(STORAGES))))
+        self.storage, self.storage_scale = storage, STORAGES[storage][1]
+        if storage == STORAGE_INT32_S:
+            self.storage_range = (-self.INT32 - 1, self.INT32)
+        elif self.storage_scale is not None:
+            self.storage_range = tuple(
+                int(decimal.Decimal(repr(ts)) * self.storage_scale) for ts in (self.MIN_TS, self.MAX_TS))
         if auto_now or auto_now_add:
             kwargs['editable'] = False
             kwargs['blank'] = True
+        db_default = kwargs.get('db_default')
+        if isinstance(db_default, EpochNow) and db_default.storage is None and storage != STORAGE_FLOAT:
+            kwargs['db_default'] = EpochNow(storage)
         super(UnixTimeStampField, self).__init__(verbose_name, name, **kwargs)
 
+    def __copy__(self):
+        obj = super(UnixTimeStampField, self).__copy__()
+        obj.__dict__.pop('_converters', None)
+        return obj
+
+    def __reduce__(self):
+        reduced = super(UnixTimeStampField, self).__reduce__()
+        if len(reduced) > 2:
+            # converters are closures over this field and can't be pickled
+            reduced[2].pop('_converters', None)
+        return reduced
+
     def deconstruct(self):
         name, path, args, kwargs = super(UnixTimeStampField, self).deconstruct()
         if self.auto_now:
@@ -233,24 +610,79 @@ class UnixTimeStampField(TimestampPatchMixin, Field):
         if self.auto_now or self.auto_now_add:
             del kwargs['editable']
             del kwargs['blank']
+        if self.round_to != 6:
+            kwargs['round_to'] = self.round_to
+        if self.use_numeric:
+            kwargs['use_numeric'] = True
+        if self.storage != STORAGE_FLOAT:
+            kwargs['storage'] = self.storage
+        if self.lazy:
+            kwargs['lazy'] = True
+        if self.clock is not None:
+            kwargs['clock'] = self.clock
         return name, path, args, kwargs
 
     def get_internal_type(self):
-        return "FloatField"
+        return STORAGES[self.storage][0]
+
+    @property
+    def db_now(self):
+        """
+        whether default of field is now of database, see :class:`~unixtimestampfield.functions.EpochNow`
+        """
+        return isinstance(getattr(self, 'db_default', None), EpochNow)
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super(UnixTimeStampField, self).contribute_to_class(cls, name, *args, **kwargs)
+        if self.db_now:
+            post_save.connect(refresh_db_now, sender=cls, dispatch_uid='unixtimestampfield.refresh_db_now')
 
     def pre_save(self, model_instance, add):
+        if add and self.db_now and (self.auto_now or self.auto_now_add):
+            # inserted as DEFAULT, no clock is read
+            value = DatabaseDefault(self._db_default_expression, output_field=self)
+            setattr(model_instance, self.attname, value)
+            return value
         if self.auto_now or (self.auto_now_add and add):
+            batch_stamp = self.get_batch_stamp()
+            if batch_stamp is not None:
+                setattr(model_instance, self.attname, batch_stamp[0])
+                return batch_stamp[1]
             value = self.get_datetimenow()
         else:
             value = getattr(model_instance, self.attname)
+            if value.__class__ is LazyTimestamp and value.field is self or hasattr(value, 'resolve_expression'):
+                return value
 
         setattr(model_instance, self.attname, field_value_middleware(self, value))
         return value
 
+    def get_batch_stamp(self):
+        """
+        return (value of field, stamp saved as stored value) of now in :func:`stamp_batch`, or None outside
+        """
+        stamps = _batch_stamps.get()
+        if stamps is None:
+            return None
+
+        try:
+            return stamps[self]
+        except KeyError:
+            pass
+        value = field_value_middleware(self, self.get_datetimenow())
+        stamp = LazyTimestamp(self, self.to_storage(value))
+        stamp._value = value
+        stamps[self] = value, stamp
+        return stamps[self]
+
     def to_python(self, value):
+        if value.__class__ is LazyTimestamp:
+            value = value.resolve()
         return field_value_middleware(self, value)
 
     def get_default(self):
+        if self.db_now and not self.has_default():
+            return super(UnixTimeStampField, self).get_default()
         if self.auto_now or self.auto_now_add:
             v = self.get_datetimenow()
         else:
@@ -264,23 +696,116 @@ class UnixTimeStampField(TimestampPatchMixin, Field):
 
     def value_to_string(self, obj):
         val = self._get_val_from_obj(obj)
+        if val.__class__ is LazyTimestamp:
+            val = val.resolve()
         return '' if val is None else val
 
     def get_prep_value(self, value):
+        if value.__class__ is LazyTimestamp:
+            if value.field is self:
+                return value.raw
+            value = value.resolve()
         value = super(UnixTimeStampField, self).get_prep_value(value)
-        return self.to_timestamp(value)
+        return self.to_storage(value)
 
     def get_db_prep_value(self, value, connection, prepared=False):
         if not prepared:
             value = self.get_prep_value(value)
-        return self.to_timestamp(value)
+        return value
 
     def from_db_value(self, value, expression, connection):
-        return field_value_middleware(self, value)
+        if self.lazy and value is not None:
+            return LazyTimestamp(self, value)
+        return field_value_middleware(self, value, stored=True)
 
     def to_timestamp(self, value):
         return round(super(UnixTimeStampField, self).to_timestamp(value), self.round_to)
 
+    def to_storage(self, value):
+        """
+        from value to the representation stored in database
+
+        integer storages are computed exactly, without going through float seconds
+        """
+        scale = self.storage_scale
+        if scale is None:
+            return self.to_timestamp(value)
+
+        if isinstance(value, six.string_types):
+            try:
+                if not looks_numeric(value):
+                    raise decimal.InvalidOperation
+                value = decimal.Decimal(value)
+            except decimal.InvalidOperation:
+                value = self.datetime_str_to_datetime(value)
+
+        if isinstance(value, datetime.datetime):
+            step = 1000000 // scale
+            stored = (self._datetime_to_microseconds(value) + step // 2) // step
+        elif isinstance(value, six.integer_types):
+            stored = value * scale
+        elif isinstance(value, float) and math.isfinite(value):
+            stored = int(round(value * scale))
+        elif isinstance(value, decimal.Decimal) and value.is_finite():
+            stored = int((value * scale).to_integral_value())
+        elif value is None:
+            stored = int(round(self.to_timestamp(value) * scale))
+        else:
+            raise exceptions.ValidationError(
+                "Unable to convert value: '%s' to timestamp" % value,
+                code="invalid_timestamp"
+            )
+
+        return self._check_stored(stored)
+
+    def stored_to_seconds(self, value):
+        """
+        from stored value to seconds since epoch
+        """
+        scale = self.storage_scale
+        return float(value) if scale is None else value / scale
+
+    def to_storage_bound(self, value):
+        """
+        from datetime to stored representation as bound of range lookups, without range checking
+        """
+        microseconds = self._datetime_to_microseconds(value)
+        if self.storage_scale is None:
+            return microseconds / 1000000.0
+        return microseconds * self.storage_scale // 1000000
+
+    def from_stored(self, value):
+        if self.storage_scale is None or not isinstance(value, six.integer_types):
+            return self.from_number(value)
+
+        value = self._check_stored(value)
+        return EPOCH + datetime.timedelta(microseconds=value * (1000000 // self.storage_scale))
+
+    def _check_stored(self, value):
+        low, high = self.storage_range
+        if not low <= value <= high:
+            raise exceptions.ValidationError(
+                "Value out of range, acceptable: %s ~ %s (%s)" % (low, high, self.storage),
+                code="out_of_rnage"
+            )
+        return value
+
+    def _build_timestamp_converter(self, stored=False):
+        to_timestamp, round_to, scale = self.to_timestamp, self.round_to, self.storage_scale
+
+        if stored and scale is not None:
+            def stored_to_timestamp(value):
+                if value.__class__ in six.integer_types:
+                    return value / scale
+                return to_timestamp(value)
+            return stored_to_timestamp
+
+        def round_timestamp(value):
+            if value.__class__ is float:
+                return round(value, round_to)
+            return to_timestamp(value)
+        return round_timestamp
+
     def formfield(self, **kwargs):
         defaults = {'form_class': fields.CharField}
         defaults.update(kwargs)
@@ -297,11 +822,16 @@ class OrdinalPatchMixin(TimestampPatchMixin):
         """
         return v.toordinal()
 
-    def get_datetimenow(self):
+    def _build_timestamp_converter(self, stored=False):
+        return self.to_timestamp
+
+    def get_datetimenow(self, now=None):
         """
-        get datetime now according to USE_TZ and default time
+        get datetime now according to USE_TZ and default time, or of ``now`` (naive UTC) if given
         """
-        value = timezone.datetime.fromordinal(timezone.datetime.utcnow().toordinal())
+        if now is None:
+            now = self.get_utcnow()
+        value = timezone.datetime.fromordinal(now.toordinal())
         if settings.USE_TZ:
             value = timezone.localtime(
                 timezone.make_aware(value, datetime.timezone.utc),
@@ -313,7 +843,10 @@ class OrdinalPatchMixin(TimestampPatchMixin):
         """
         from value to ordinal timestamp format(int)
         """
-        if isinstance(value, (six.integer_types, float, six.string_types)):
+        if isinstance(value, six.string_types) and not looks_numeric(value):
+            value = self.datetime_str_to_datetime(value)
+
+        if isinstance(value, (six.integer_types, float, decimal.Decimal, six.string_types)):
             try:
                 return int(value)
             except ValueError:
@@ -324,6 +857,9 @@ class OrdinalPatchMixin(TimestampPatchMixin):
                 value = timezone.localtime(value, datetime.timezone.utc)
             return self._datetime_to_timestamp(value)
 
+        if value.__class__ is datetime.date:
+            return value.toordinal()
+
         raise exceptions.ValidationError(
             "Unable to convert value: '%s' to timestamp" % value,
             code="invalid_timestamp"
@@ -333,7 +869,10 @@ class OrdinalPatchMixin(TimestampPatchMixin):
         """
         from value to datetime with tzinfo format (datetime.datetime instance)
         """
-        if isinstance(value, (six.integer_types, float, six.string_types)):
+        if isinstance(value, six.string_types) and not looks_numeric(value):
+            return self.datetime_str_to_datetime(value)
+
+        if isinstance(value, (six.integer_types, float, decimal.Decimal, six.string_types)):
             try:
                 return self.from_number(value)
             except ValueError:
@@ -342,6 +881,9 @@ class OrdinalPatchMixin(TimestampPatchMixin):
         if isinstance(value, datetime.datetime):
             return value
 
+        if value.__class__ is datetime.date:
+            return datetime.datetime.fromordinal(value.toordinal())
+
         raise exceptions.ValidationError(
             "Unable to convert value: '%s' to python data type" % value,
             code="invalid_datetime"
@@ -351,7 +893,7 @@ class OrdinalPatchMixin(TimestampPatchMixin):
         """
         from value to datetime with tzinfo format (datetime.datetime instance)
         """
-        if isinstance(value, (six.integer_types, float, six.string_types)):
+        if isinstance(value, (six.integer_types, float, decimal.Decimal, six.string_types, datetime.date)):
             value = self.to_naive_datetime(value)
 
         if isinstance(value, datetime.datetime):
@@ -375,26 +917,65 @@ class OrdinalPatchMixin(TimestampPatchMixin):
             )
         return timezone.datetime(1, 1, 1, 0, 0) + timezone.timedelta(days=(value-1))
 
+    def to_date(self, value):
+        """
+        from value to date (datetime.date instance), aware datetimes are taken in UTC as stored
+        """
+        if value.__class__ is datetime.date:
+            return value
+        if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+            value = timezone.localtime(value, datetime.timezone.utc)
+        return self.to_naive_datetime(value).date()
+
 
 class OrdinalField(OrdinalPatchMixin, UnixTimeStampField):
     """
     Copy and mimic django.db.models.fields.DatetimeField
-    Stored as float in database and used as datetime object in Python
+    Stored as float (or integer with ``storage='int32_d'``) in database and used as datetime object
+    (or date with ``use_date=True``) in Python
 
     """
     empty_strings_allowed = False
     description = "Ordinal timestamp"
 
-    def __init__(self, verbose_name=None, name=None, auto_now=False,
-                 auto_now_add=False, use_numeric=False, **kwargs):
+    def __init__(self, verbose_name=None, name=None, auto_now=False, auto_now_add=False, use_numeric=False,
+                 storage=STORAGE_FLOAT, use_date=False, lazy=False, clock=None, **kwargs):
         self.auto_now, self.auto_now_add, self.use_numeric = auto_now, auto_now_add, use_numeric
+        self.use_date, self.lazy, self.clock = use_date, lazy, clock
+        if storage not in ORDINAL_STORAGES:
+            raise ValueError('storage: %s should be one of %s' % (storage, ', '.join(sorted(ORDINAL_STORAGES))))
+        self.storage = storage
         if auto_now or auto_now_add:
             kwargs['editable'] = False
             kwargs['blank'] = True
         super(UnixTimeStampField, self).__init__(verbose_name, name, **kwargs)
 
+    def deconstruct(self):
+        name, path, args, kwargs = super(OrdinalField, self).deconstruct()
+        if self.use_date:
+            kwargs['use_date'] = True
+        return name, path, args, kwargs
+
     def get_internal_type(self):
-        return "FloatField"
+        return ORDINAL_STORAGES[self.storage]
+
+    def _build_datetime_converter(self, stored=False):
+        if not self.use_date:
+            return super(OrdinalField, self)._build_datetime_converter(stored)
+
+        fromordinal, max_od, to_date = datetime.date.fromordinal, self.MAX_OD, self.to_date
+
+        def ordinal_to_date(value):
+            if value.__class__ in NUMBER_TYPES and 1 <= value <= max_od:
+                return fromordinal(int(value))
+            return to_date(value)
+        return ordinal_to_date
+
+    def stored_to_seconds(self, value):
+        return (value - EPOCH.toordinal()) * 86400.0
+
+    def to_storage_bound(self, value):
+        return value.toordinal()
 
     def formfield(self, **kwargs):
         defaults = {'form_class': fields.CharField}
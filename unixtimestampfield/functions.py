@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+
+"""
+Database functions
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, convert stored timestamps into database datetimes.
+    Truncate and bucket timestamps in database.
+    Select stored values without conversion of field.
+    Convert database datetimes into stored values and back exactly, for migrations.
+    Now of database as stored value, for updates and db_default.
+    Shift timestamps by timedelta or DurationField in stored units.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`FromEpoch`
+* :class:`TruncEpoch`
+* :class:`TimeBucket`
+* :class:`RawEpoch`
+* :class:`DateTimeToEpoch`
+* :class:`EpochToDateTime`
+* :class:`EpochNow`
+* :class:`Ago`
+* :class:`EpochShift`
+* :class:`EpochF`
+
+Members
+-------
+
+"""
+import datetime
+
+from django.conf import settings
+from django.db import NotSupportedError
+from django.db.models import BigIntegerField, DateField, DateTimeField, F, FloatField, Func, IntegerField, Value
+from django.db.models.functions import Trunc
+
+
+class FromEpoch(Func):
+    """
+    Convert stored values into database datetime (in UTC) for datetime functions
+
+    Values of :class:`~unixtimestampfield.fields.OrdinalField` are converted into database date.
+    """
+    arity = 1
+
+    def _resolve_output_field(self):
+        if self.is_ordinal:
+            return DateField()
+        return DateTimeField()
+
+    @property
+    def source_field(self):
+        return getattr(self.get_source_expressions()[0], 'output_field', None)
+
+    @property
+    def is_ordinal(self):
+        from .fields import OrdinalField
+        return isinstance(self.source_field, OrdinalField)
+
+    def compile_seconds(self, compiler, connection):
+        """
+        compile source expression into seconds (or days of ordinal) since epoch
+        """
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        scale = getattr(self.source_field, 'storage_scale', None)
+        if scale is not None and scale != 1:
+            sql = '(%s / %s.0)' % (sql, scale)
+        return sql, params
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('%s is not supported on %s.' % (self.__class__.__name__, connection.vendor))
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = self.compile_seconds(compiler, connection)
+        if self.is_ordinal:
+            # julian day number of 0001/01/01 00:00:00 is 1721425.5
+            return "date(%s + 1721424.5)" % sql, params
+        return "datetime(%s, 'unixepoch')" % sql, params
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = self.compile_seconds(compiler, connection)
+        if self.is_ordinal:
+            return "(DATE '0001-01-01' + (CAST(%s AS integer) - 1))" % sql, params
+        if settings.USE_TZ:
+            return "TO_TIMESTAMP(%s)" % sql, params
+        return "(TO_TIMESTAMP(%s) AT TIME ZONE 'UTC')" % sql, params
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = self.compile_seconds(compiler, connection)
+        if self.is_ordinal:
+            return "DATE_ADD(DATE('0001-01-01'), INTERVAL (CAST(%s AS SIGNED) - 1) DAY)" % sql, params
+        return "DATE_ADD(TIMESTAMP('1970-01-01'), INTERVAL ROUND(%s * 1000000) MICROSECOND)" % sql, params
+
+    def as_oracle(self, compiler, connection, **extra_context):
+        sql, params = self.compile_seconds(compiler, connection)
+        if self.is_ordinal:
+            return "(DATE '0001-01-01' + (TRUNC(%s) - 1))" % sql, params
+        return "(TIMESTAMP '1970-01-01 00:00:00' + NUMTODSINTERVAL(%s, 'SECOND'))" % sql, params
+
+
+class TruncEpoch(Trunc):
+    """
+    Truncate stored timestamp to ``kind`` (year, quarter, month, week, day, hour, minute or second)
+    in timezone like Trunc, then convert result into value of the field, i.e. datetime or number.
+
+    Result is computed as database datetime, use :class:`TimeBucket` to compare with stored values.
+    """
+
+    def __init__(self, expression, kind, tzinfo=None, **extra):
+        super(TruncEpoch, self).__init__(FromEpoch(expression), kind, tzinfo=tzinfo, **extra)
+
+    def convert_value(self, value, expression, connection):
+        value = super(TruncEpoch, self).convert_value(value, expression, connection)
+        field = self.lhs.source_field
+        if value is None or not hasattr(field, 'get_converter'):
+            return value
+        if not isinstance(value, datetime.datetime):
+            value = datetime.datetime.combine(value, datetime.time())
+        return field.to_python(value)
+
+
+class TimeBucket(Func):
+    """
+    Floor stored timestamp to bucket of ``size`` seconds (or timedelta) since ``origin``,
+    which defaults to epoch (days of ordinal are bucketed since 0001/01/01).
+
+    Result is in stored units and comes back through the field as well.
+    """
+    arity = 1
+
+    def __init__(self, expression, size, origin=None, **extra):
+        # numbers are inlined in SQL, e.g. Decimal would be rendered as repr
+        size = size.total_seconds() if isinstance(size, datetime.timedelta) else float(size)
+        if size <= 0:
+            raise ValueError('size of bucket must be positive: %s' % size)
+        self.size, self.origin = size, origin
+        super(TimeBucket, self).__init__(expression, **extra)
+
+    def _resolve_output_field(self):
+        return self.get_source_expressions()[0].output_field
+
+    def get_stored_bucket(self, field):
+        """
+        return size and origin of bucket in stored units of field
+        """
+        from .fields import OrdinalField
+
+        if isinstance(field, OrdinalField):
+            if self.size % 86400:
+                raise ValueError('size of bucket of OrdinalField must be days: %s' % self.size)
+            return int(self.size // 86400), 1 if self.origin is None else int(field.to_timestamp(self.origin))
+
+        origin = 0 if self.origin is None else float(field.to_timestamp(self.origin))
+        scale = getattr(field, 'storage_scale', None)
+        if scale is None:
+            return self.size, origin
+        return int(round(self.size * scale)), int(round(origin * scale))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        source = self.get_source_expressions()[0]
+        field = source.output_field
+        size, origin = self.get_stored_bucket(field)
+
+        sql, params = compiler.compile(source)
+        # numbers are inlined for GROUP BY, dividing by float avoids integer division
+        sql = '(FLOOR((%s - %r) / %r) * %r + %r)' % (sql, origin, float(size), size, origin)
+        if getattr(field, 'storage_scale', None) is not None:
+            sql = 'CAST(%s AS %s)' % (sql, field.cast_db_type(connection))
+        return sql, params
+
+
+class RawEpoch(Func):
+    """
+    Stored value as it is, e.g. float seconds, milliseconds of int64_ms or days of ordinal,
+    which comes back as number without conversion of field.
+    """
+    arity = 1
+    template = '%(expressions)s'
+    output_fields = {
+        'FloatField': FloatField,
+        'IntegerField': IntegerField,
+        'BigIntegerField': BigIntegerField,
+    }
+
+    def _resolve_output_field(self):
+        source = self.get_source_expressions()[0].output_field
+        return self.output_fields[source.get_internal_type()]()
+
+
+class DateTimeToEpoch(Func):
+    """
+    Convert database datetime (or date) into stored values of ``field``, as ``field.to_storage`` does,
+    i.e. seconds rounded to ``round_to``, integer units of storage or days of ordinal.
+
+    Naive datetimes (``USE_TZ = False``) are taken as they are, like the field does.
+    """
+    arity = 1
+
+    def __init__(self, expression, field, **extra):
+        self.target_field = field
+        super(DateTimeToEpoch, self).__init__(expression, output_field=RawEpoch.output_fields[
+            field.get_internal_type()](), **extra)
+
+    @property
+    def is_ordinal(self):
+        from .fields import OrdinalField
+        return isinstance(self.target_field, OrdinalField)
+
+    def finish(self, microseconds, seconds):
+        """
+        stored value from SQL of microseconds (integer) and of seconds since epoch,
+        integer units are rounded half up like ``to_storage``
+        """
+        scale = self.target_field.storage_scale
+        if scale is None:
+            return 'ROUND(%s, %d)' % (seconds, self.target_field.round_to)
+        step = 1000000 // scale
+        if step == 1:
+            return microseconds
+        return 'FLOOR((%s + %d) / %d.0)' % (microseconds, step // 2, step)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('%s is not supported on %s.' % (self.__class__.__name__, connection.vendor))
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        if self.is_ordinal:
+            # julian day number of 0001/01/01 00:00:00 is 1721425.5
+            return 'CAST(julianday(date(%s)) - 1721424.5 AS INTEGER)' % sql, params
+        # datetimes are stored as text with optional microseconds from 20th character,
+        # '%' is doubled for formatting of parameters
+        whole, fraction = "CAST(strftime('%%%%s', %s) AS INTEGER)" % sql, "CAST(substr(%s, 20) AS REAL)" % sql
+        scale = self.target_field.storage_scale
+        if scale is None:
+            return 'CAST(ROUND(%s + %s, %d) AS REAL)' % (whole, fraction, self.target_field.round_to), params * 2
+        # fraction isn't negative, so that integer division floors it
+        step = 1000000 // scale
+        return '(%s * %d + (CAST(ROUND(%s * 1000000) AS INTEGER) + %d) / %d)' % (
+            whole, scale, fraction, step // 2, step), params * 2
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        if self.is_ordinal:
+            return "(CAST(%s AS date) - DATE '0001-01-01' + 1)" % sql, params
+        seconds = 'CAST(EXTRACT(EPOCH FROM %s) AS numeric)' % sql
+        sql = self.finish('(%s * 1000000)' % seconds, seconds)
+        return 'CAST(%s AS %s)' % (sql, self.target_field.cast_db_type(connection)), params
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        if self.is_ordinal:
+            # TO_DAYS of 0001-01-01 is 366
+            return '(TO_DAYS(%s) - 365)' % sql, params
+        microseconds = "TIMESTAMPDIFF(MICROSECOND, '1970-01-01 00:00:00', %s)" % sql
+        return self.finish(microseconds, '(%s / 1000000)' % microseconds), params
+
+
+class EpochToDateTime(FromEpoch):
+    """
+    Convert stored values into database datetime (or date with ``output_field=DateField()``)
+    to be written into columns, keeping microseconds which :class:`FromEpoch` drops on SQLite.
+    """
+
+    def __init__(self, expression, output_field=None, **extra):
+        super(EpochToDateTime, self).__init__(expression, output_field=output_field or DateTimeField(), **extra)
+
+    @property
+    def is_date(self):
+        return not isinstance(self.output_field, DateTimeField)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        if self.is_ordinal or self.is_date:
+            sql, params = super(EpochToDateTime, self).as_sqlite(compiler, connection, **extra_context)
+            if self.is_ordinal and not self.is_date:
+                sql = "(%s || ' 00:00:00')" % sql
+            elif not self.is_ordinal:
+                sql = 'date(%s)' % sql
+            return sql, params
+
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        scale = self.source_field.storage_scale
+        if scale is None:
+            microseconds = 'CAST(ROUND(%s * 1000000) AS INTEGER)' % sql
+        else:
+            microseconds = '(%s * %d)' % (sql, 1000000 // scale)
+        fraction = '((%s %%%% 1000000 + 1000000) %%%% 1000000)' % microseconds
+        # text as Django writes datetimes, fraction only if any
+        sql = ("(datetime((%(us)s - %(fraction)s) / 1000000, 'unixepoch') || "
+               "CASE WHEN %(fraction)s = 0 THEN '' ELSE printf('.%%%%06d', %(fraction)s) END)") % {
+            'us': microseconds, 'fraction': fraction}
+        return sql, params * 4
+
+
+class EpochNow(Func):
+    """
+    Now of database as stored value of ``storage`` (float seconds by default), e.g. for
+    ``update(modified=EpochNow())`` or ``db_default=EpochNow()`` of
+    :class:`~unixtimestampfield.fields.UnixTimeStampField`, which binds it to storage of the field.
+
+    Now is read once per statement (transaction on PostgreSQL), all rows get the same value.
+    """
+    arity = 0
+    allowed_default = True
+
+    def __init__(self, storage=None, **extra):
+        from .fields import STORAGE_FLOAT, STORAGES
+
+        if storage is not None and storage not in STORAGES:
+            raise ValueError('storage: %s should be one of %s' % (storage, ', '.join(sorted(STORAGES))))
+        self.storage = storage
+        internal_type, self.scale = STORAGES[storage or STORAGE_FLOAT]
+        super(EpochNow, self).__init__(output_field=RawEpoch.output_fields[internal_type](), **extra)
+
+    def bind(self, field):
+        """
+        return copy in storage of ``field`` (compared or updated) if storage isn't given
+        """
+        from .fields import OrdinalField
+
+        if isinstance(field, OrdinalField):
+            raise ValueError('%s: %s is not of days of OrdinalField' % (field.name, self.__class__.__name__))
+        if self.storage is not None:
+            return self
+        return self.with_storage(field.storage)
+
+    def with_storage(self, storage):
+        return EpochNow(storage)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('%s is not supported on %s.' % (self.__class__.__name__, connection.vendor))
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # 'now' is fixed within a statement, %f is seconds with milliseconds, '%' is doubled for parameters
+        seconds = ("(CAST(strftime('%%s', 'now') AS INTEGER) - CAST(strftime('%%S', 'now') AS INTEGER) + "
+                   "CAST(strftime('%%f', 'now') AS REAL))")
+        if self.scale is None:
+            return seconds, []
+        return 'CAST(ROUND(%s * %d) AS INTEGER)' % (seconds, self.scale), []
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        seconds = 'EXTRACT(EPOCH FROM CURRENT_TIMESTAMP)'
+        if self.scale is None:
+            return 'CAST(%s AS double precision)' % seconds, []
+        return 'CAST(ROUND(%s * %d) AS %s)' % (seconds, self.scale, 'integer' if self.scale == 1 else 'bigint'), []
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        seconds = 'UNIX_TIMESTAMP(NOW(6))'
+        if self.scale is None:
+            return 'CAST(%s AS DOUBLE)' % seconds, []
+        return 'CAST(ROUND(%s * %d) AS SIGNED)' % (seconds, self.scale), []
+
+
+def stored_delta(delta, scale=None):
+    """
+    timedelta (or seconds) as difference of values stored in ``scale`` units per second, float seconds if None
+    """
+    if not isinstance(delta, datetime.timedelta):
+        delta = datetime.timedelta(seconds=delta)
+    if scale is None:
+        return delta.total_seconds()
+    return delta // datetime.timedelta(microseconds=1000000 // scale)
+
+
+class Ago(EpochNow):
+    """
+    Now of database minus ``delta`` (timedelta or seconds) as stored value, e.g.
+    ``filter(created__gte=Ago(300))`` for rows of last 5 minutes, bound to storage of field compared.
+    """
+
+    def __init__(self, delta, storage=None, **extra):
+        self.delta = delta
+        super(Ago, self).__init__(storage, **extra)
+
+    def with_storage(self, storage):
+        return Ago(self.delta, storage)
+
+    def subtract(self, sql, params):
+        return '(%s - %%s)' % sql, list(params) + [stored_delta(self.delta, self.scale)]
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.subtract(*super(Ago, self).as_sqlite(compiler, connection, **extra_context))
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.subtract(*super(Ago, self).as_postgresql(compiler, connection, **extra_context))
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.subtract(*super(Ago, self).as_mysql(compiler, connection, **extra_context))
+
+
+class EpochCombinable(object):
+    """
+    Adding or subtracting timedelta, seconds or DurationField expression makes :class:`EpochShift`
+    """
+
+    def _combine(self, other, connector, reversed):
+        if connector == self.ADD or connector == self.SUB and not reversed:
+            return EpochShift(self, other, connector)
+        return super(EpochCombinable, self)._combine(other, connector, reversed)
+
+
+class EpochShift(EpochCombinable, Func):
+    """
+    Stored timestamp of ``expression`` shifted by ``delta``, timedelta (or seconds) or expression of
+    DurationField, computed in stored units of the field, which result comes back through.
+    """
+    arity = 2
+
+    def __init__(self, expression, delta, connector='+', **extra):
+        if connector not in (self.ADD, self.SUB):
+            raise ValueError('connector: %s should be one of %s, %s' % (connector, self.ADD, self.SUB))
+        self.connector = connector
+        if not hasattr(delta, 'resolve_expression'):
+            if not isinstance(delta, datetime.timedelta):
+                delta = datetime.timedelta(seconds=delta)
+            delta = Value(delta)
+        super(EpochShift, self).__init__(expression, delta, **extra)
+
+    def _resolve_output_field(self):
+        return self.get_source_expressions()[0].output_field
+
+    def compile_delta(self, compiler, connection):
+        """
+        compile delta into stored units of field
+        """
+        from .fields import OrdinalField
+
+        field, delta = self.output_field, self.get_source_expressions()[1]
+        scale = getattr(field, 'storage_scale', None)
+        if isinstance(delta, Value) and isinstance(delta.value, datetime.timedelta):
+            if not isinstance(field, OrdinalField):
+                return '%s', [stored_delta(delta.value, scale)]
+            if delta.value % datetime.timedelta(days=1):
+                raise ValueError('shift of OrdinalField must be days: %s' % delta.value)
+            return '%s', [delta.value.days]
+
+        if delta.output_field.get_internal_type() != 'DurationField':
+            raise ValueError('delta of %s should be a DurationField: %s' % (self.__class__.__name__, delta))
+        sql, params = compiler.compile(delta)
+        if connection.features.has_native_duration_field:
+            if connection.vendor != 'postgresql':
+                raise NotSupportedError('%s is not supported on %s.' % (self.__class__.__name__, connection.vendor))
+            sql = 'EXTRACT(EPOCH FROM %s)' % sql
+            if isinstance(field, OrdinalField):
+                return 'CAST(FLOOR(%s / 86400) AS integer)' % sql, params
+            if scale is None:
+                return 'CAST(%s AS double precision)' % sql, params
+            return 'CAST(ROUND(%s * %d) AS %s)' % (sql, scale, field.cast_db_type(connection)), params
+
+        # microseconds of durations stored as integers
+        if isinstance(field, OrdinalField):
+            return '(%s / 86400000000)' % sql, params
+        if scale is None:
+            return '(%s / 1000000.0)' % sql, params
+        if scale == 1000000:
+            return sql, params
+        return '(%s / %d)' % (sql, 1000000 // scale), params
+
+    def as_sql(self, compiler, connection, **extra_context):
+        lhs_sql, lhs_params = compiler.compile(self.get_source_expressions()[0])
+        delta_sql, delta_params = self.compile_delta(compiler, connection)
+        return '(%s %s %s)' % (lhs_sql, self.connector, delta_sql), list(lhs_params) + list(delta_params)
+
+
+class EpochF(EpochCombinable, F):
+    """
+    F of timestamp field, ``EpochF('started') + timedelta(hours=1)`` is computed in stored units,
+    so that it's compared with other timestamp fields in database.
+    """
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+Instrumentation
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, count and time conversions per field.
+
+
+Calls of ``to_python``, ``from_db_value``, ``get_db_prep_value``, ``pre_save`` and
+``datetime_str_to_datetime`` are counted and timed per field, as well as ValidationError raised by them.
+Times are inclusive, e.g. time of ``to_python`` includes ``datetime_str_to_datetime`` called by it.
+
+Methods are wrapped only while instrumentation is enabled, by :func:`enable` or within :func:`measure`,
+so there's no overhead when disabled. Wrapping is process-wide: while any :func:`measure` is open, calls of
+other threads and coroutines go through wrappers as well, which skip timing but for a check of context.
+
+.. code-block:: python
+
+    >>> from unixtimestampfield import instrumentation
+    >>> with instrumentation.measure() as stats:
+    ...     list(ModelA.objects.all())
+    >>> stats.as_dict()
+    {'app.ModelA.created': {'from_db_value': {'calls': 3, 'errors': 0, 'seconds': 1.2e-05}}}
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`Stats`
+
+Functions:
+
+* :func:`enable`
+* :func:`disable`
+* :func:`is_enabled`
+* :func:`get_stats`
+* :func:`reset_stats`
+* :func:`measure`
+
+Signals:
+
+* :data:`stats_collected`, sent with ``stats`` while leaving :func:`measure`
+* :data:`validation_failed`, sent with ``field``, ``method`` and ``error`` while instrumented
+
+Members
+-------
+
+"""
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+
+from django.core import exceptions
+from django.dispatch import Signal
+
+from .fields import TimestampPatchMixin, UnixTimeStampField
+
+INSTRUMENTED = (
+    (UnixTimeStampField, ('to_python', 'from_db_value', 'get_db_prep_value', 'pre_save')),
+    (TimestampPatchMixin, ('datetime_str_to_datetime', )),
+)
+
+stats_collected = Signal()
+validation_failed = Signal()
+
+
+class Stats(object):
+    """
+    Counters and timers of calls per field and method
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (label, method): [calls, errors, seconds]
+        self.counters = {}
+
+    def add(self, label, method, seconds, failed):
+        with self.lock:
+            counter = self.counters.get((label, method))
+            if counter is None:
+                counter = self.counters[(label, method)] = [0, 0, 0.0]
+            counter[0] += 1
+            counter[1] += failed
+            counter[2] += seconds
+
+    def as_dict(self):
+        """
+        return {label of field: {method: {'calls': n, 'errors': n, 'seconds': s}}}
+        """
+        with self.lock:
+            result = {}
+            for (label, method), (calls, errors, seconds) in self.counters.items():
+                result.setdefault(label, {})[method] = {'calls': calls, 'errors': errors, 'seconds': seconds}
+            return result
+
+    def reset(self):
+        with self.lock:
+            self.counters = {}
+
+
+_stats = Stats()
+_scopes = contextvars.ContextVar('unixtimestampfield_stats_scopes', default=())
+
+# global enabling and active measure() scopes, methods are wrapped while any
+_lock = threading.Lock()
+_enabled = False
+_users = 0
+_originals = []
+
+
+def get_label(field):
+    model = getattr(field, 'model', None)
+    if model is None:
+        return field.__class__.__name__
+    return '%s.%s' % (model._meta.label, field.name)
+
+
+def record(field, method, seconds, failed):
+    label = get_label(field)
+    if _enabled:
+        _stats.add(label, method, seconds, failed)
+    for stats in _scopes.get():
+        stats.add(label, method, seconds, failed)
+
+
+def instrument(method, func):
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _enabled and not _scopes.get():
+            # wrapped for measure() of other contexts
+            return func(self, *args, **kwargs)
+        failed = False
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        except exceptions.ValidationError as e:
+            failed = True
+            validation_failed.send(sender=self.__class__, field=self, method=method, error=e)
+            raise
+        finally:
+            record(self, method, time.perf_counter() - start, failed)
+    return wrapper
+
+
+def _acquire():
+    global _users
+    with _lock:
+        _users += 1
+        if _users > 1:
+            return
+        for cls, methods in INSTRUMENTED:
+            for method in methods:
+                original = cls.__dict__[method]
+                _originals.append((cls, method, original))
+                setattr(cls, method, instrument(method, original))
+
+
+def _release():
+    global _users
+    with _lock:
+        _users -= 1
+        if _users > 0:
+            return
+        while _originals:
+            cls, method, original = _originals.pop()
+            setattr(cls, method, original)
+
+
+def enable():
+    """
+    collect stats globally, see :func:`get_stats`
+    """
+    global _enabled
+    if not _enabled:
+        _enabled = True
+        _acquire()
+
+
+def disable():
+    global _enabled
+    if _enabled:
+        _enabled = False
+        _release()
+
+
+def is_enabled():
+    return _enabled
+
+
+def get_stats():
+    """
+    return stats collected globally since enabled or reset, see :meth:`Stats.as_dict`
+    """
+    return _stats.as_dict()
+
+
+def reset_stats():
+    _stats.reset()
+
+
+@contextlib.contextmanager
+def measure():
+    """
+    instrument within, yield :class:`Stats` of calls in this context only,
+    which is sent by :data:`stats_collected` while leaving
+
+    Methods are wrapped for the whole process while it's open, calls of other contexts pay
+    a check of context and an extra call, not timing.
+    """
+    stats = Stats()
+    token = _scopes.set(_scopes.get() + (stats, ))
+    _acquire()
+    try:
+        yield stats
+    finally:
+        _release()
+        _scopes.reset(token)
+        stats_collected.send(sender=Stats, stats=stats)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch iterators
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, iterate querysets in chunks with timestamp columns converted per chunk.
+
+
+Rows are fetched by ``values_list`` in chunks with columns of
+:class:`~unixtimestampfield.fields.UnixTimeStampField` selected as stored values, then each column
+is converted in one pass by converter resolved once, instead of ``from_db_value`` dispatching
+per value. Objects (or tuples of ``fields``) are yielded one by one.
+
+Converters are resolved before the first row, in a thread for :func:`abatch_iterator`, so that
+settings and timezone files are never read on the event loop:
+
+.. code-block:: python
+
+    >>> from unixtimestampfield.iterators import abatch_iterator
+    >>> async for obj in abatch_iterator(ModelA.objects.filter(...), chunk_size=2000):
+    ...     pass
+
+Objects are built from concrete fields, ``select_related``, ``only``, ``defer`` and
+annotations of queryset are not applied.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`DatetimeColumnConverter`
+
+Functions:
+
+* :func:`get_column_converter`
+* :func:`convert_rows`
+* :func:`batch_iterator`
+* :func:`abatch_iterator`
+
+Members
+-------
+
+"""
+import datetime
+import itertools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from . import submiddleware
+from .fields import EPOCH, EPOCH_UTC, LazyTimestamp, OrdinalField, UnixTimeStampField
+from .functions import RawEpoch
+from .submiddleware import USF_DATETIME, USF_DEFAULT, USF_TIMESTAMP
+from .transitions import get_table
+
+CHUNK_SIZE = 2000
+
+
+def get_column_converter(field, usf_format=None):
+    """
+    return converter of column of stored values into list of values of field, as ``from_db_value`` does
+    """
+    usf_format = usf_format or submiddleware.get_current_format()
+    convert = field.get_converter(usf_format, stored=True)
+    if field.lazy:
+        return lambda column: [convert(value) if value is None else LazyTimestamp(field, value) for value in column]
+
+    if usf_format == USF_DEFAULT:
+        usf_format = USF_TIMESTAMP if field.use_numeric else USF_DATETIME
+    if usf_format != USF_DATETIME or isinstance(field, OrdinalField):
+        return lambda column: list(map(convert, column))
+    return DatetimeColumnConverter(field, convert)
+
+
+class DatetimeColumnConverter(object):
+    """
+    Convert column of stored values into datetimes according to USE_TZ and TIME_ZONE resolved once,
+    offsets are looked up once per run of values in the same interval of transitions.
+    Values out of range or of other types go through ``convert``, the converter of field.
+    """
+
+    def __init__(self, field, convert):
+        self.convert = convert
+        if field.storage_scale is None:
+            self.kind, (self.low, self.high) = float, (field.MIN_TS, field.MAX_TS)
+            self.unit = 'seconds'
+        else:
+            self.kind, (self.low, self.high) = int, field.storage_range
+            self.unit, self.step = 'microseconds', 1000000 // field.storage_scale
+
+        self.base, self.table = EPOCH, None
+        if settings.USE_TZ:
+            if settings.TIME_ZONE == 'UTC':
+                self.base = EPOCH_UTC
+            else:
+                self.table = get_table(timezone.get_default_timezone())
+
+    def deltas(self, column):
+        """
+        yield (value, timedelta since epoch or None if value should go through converter of field)
+        """
+        kind, low, high, timedelta = self.kind, self.low, self.high, datetime.timedelta
+        if kind is float:
+            for value in column:
+                if value.__class__ is float and low <= value <= high:
+                    yield value, timedelta(seconds=value)
+                else:
+                    yield value, None
+        else:
+            step = self.step
+            for value in column:
+                if value.__class__ is int and low <= value <= high:
+                    yield value, timedelta(microseconds=value * step)
+                else:
+                    yield value, None
+
+    def __call__(self, column):
+        convert, results = self.convert, []
+        append = results.append
+
+        if self.table is None:
+            base = self.base
+            for value, delta in self.deltas(column):
+                append(convert(value) if delta is None else base + delta)
+            return results
+
+        table, tz = self.table, self.table.tz
+        start = end = datetime.timedelta(0)
+        local, fold = None, 0
+        for value, delta in self.deltas(column):
+            if delta is None:
+                append(convert(value))
+                continue
+            if not start <= delta < end:
+                interval = table.interval(EPOCH + delta)
+                if interval is None:
+                    start = end = datetime.timedelta(0)
+                    append(convert(value))
+                    continue
+                start, end, offset, fold = interval
+                start, end, local = start - EPOCH, end - EPOCH, (EPOCH + offset).replace(tzinfo=tz)
+            # datetime arithmetic resets fold
+            append((local + delta).replace(fold=1) if fold else local + delta)
+        return results
+
+
+class Plan(object):
+    """
+    Columns selected and converters of them for queryset
+    """
+
+    def __init__(self, queryset, fields=None, usf_format=None):
+        model = queryset.model
+        self.queryset, self.model, self.objects = queryset, model, fields is None
+        if fields is None:
+            fields = [field.attname for field in model._meta.concrete_fields]
+        self.names, selected, self.converters = list(fields), [], []
+        for i, name in enumerate(self.names):
+            field = model._meta.get_field(name)
+            if isinstance(field, UnixTimeStampField):
+                selected.append(RawEpoch(name))
+                self.converters.append((i, get_column_converter(field, usf_format)))
+            else:
+                selected.append(name)
+        self.values = queryset.values_list(*selected)
+        self.db = self.values.db
+
+    def build(self, rows):
+        """
+        convert chunk of rows, return objects or tuples
+        """
+        rows = convert_rows(rows, self.converters)
+        if not self.objects:
+            return rows
+        from_db, db, names = self.model.from_db, self.db, self.names
+        return [from_db(db, names, row) for row in rows]
+
+
+def convert_rows(rows, converters):
+    """
+    convert columns of rows by ``[(index, column converter)]``, one pass per column
+    """
+    if not rows or not converters:
+        return rows
+    columns = list(zip(*rows))
+    for i, convert in converters:
+        columns[i] = convert(columns[i])
+    return list(zip(*columns))
+
+
+def batch_iterator(queryset, chunk_size=CHUNK_SIZE, fields=None, usf_format=None):
+    """
+    yield objects of queryset, or tuples of ``fields`` if given, fetched and converted in chunks
+    """
+    plan = Plan(queryset, fields, usf_format)
+    chunk = []
+    for row in plan.values.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield from plan.build(chunk)
+            chunk = []
+    if chunk:
+        yield from plan.build(chunk)
+
+
+async def abatch_iterator(queryset, chunk_size=CHUNK_SIZE, fields=None, usf_format=None):
+    """
+    async version of :func:`batch_iterator`, queries and converters are resolved in a thread,
+    then chunks are fetched in it and converted on event loop
+    """
+    plan = await sync_to_async(Plan)(queryset, fields, usf_format)
+    rows = await sync_to_async(lambda: iter(plan.values.iterator(chunk_size=chunk_size)))()
+    fetch = sync_to_async(lambda: list(itertools.islice(rows, chunk_size)))
+    try:
+        while True:
+            chunk = await fetch()
+            if not chunk:
+                return
+            for obj in plan.build(chunk):
+                yield obj
+    finally:
+        # cursor is closed in the thread it's used
+        await sync_to_async(rows.close)()
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lookups and transforms
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, date part transforms computed in database.
+    Lookups on year, date, month and week are compared as timestamp ranges.
+    Comparisons with expressions are computed in storage of the field.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`EpochTransformMixin`
+* :class:`EpochRangeMixin`
+* :class:`EpochCompareMixin`
+
+Transforms of :class:`~unixtimestampfield.fields.UnixTimeStampField` and
+:class:`~unixtimestampfield.fields.OrdinalField`:
+
+``year``, ``iso_year``, ``quarter``, ``month``, ``day``, ``week``, ``week_day``,
+``iso_week_day``, ``hour``, ``minute``, ``second`` and ``date``.
+
+``exact``, ``gt``, ``gte``, ``lt`` and ``lte`` lookups of ``year``, ``iso_year`` and ``date``
+are rewritten into ranges of stored value, so are ``month`` and ``week`` with date value,
+which stands for the month or ISO week containing it.
+
+``exact``, ``gt``, ``gte``, ``lt`` and ``lte`` of the fields bind
+:class:`~unixtimestampfield.functions.EpochNow` and :class:`~unixtimestampfield.functions.Ago`
+to storage of the field, and convert timestamp expressions of other storage, e.g.
+``filter(ended__gt=EpochF('started') + timedelta(hours=1))`` of float and int64_ms fields.
+
+Members
+-------
+
+"""
+import datetime
+
+from django.conf import settings
+from django.core.exceptions import FieldError
+from django.db.models import DateField, FloatField, Func, Transform, functions, lookups
+from django.utils import timezone
+
+from .fields import UnixTimeStampField, OrdinalField
+from .functions import EpochNow, FromEpoch
+
+
+class EpochTransformMixin(object):
+    """
+    Apply datetime transform to stored timestamp, which is converted by :class:`FromEpoch` at first
+
+    Timestamps are converted in current timezone like DateTimeField, ordinals are treated as dates.
+    """
+
+    def __init__(self, expression, *args, **kwargs):
+        expression = FromEpoch(expression)
+        if expression.is_ordinal and self.lookup_name in ('hour', 'minute', 'second'):
+            raise ValueError(
+                "Cannot extract time component '%s' from OrdinalField '%s'."
+                % (self.lookup_name, expression.source_field.name)
+            )
+        super(EpochTransformMixin, self).__init__(expression, *args, **kwargs)
+
+    @property
+    def epoch_source(self):
+        return self.lhs.get_source_expressions()[0]
+
+
+class EpochExtractYear(EpochTransformMixin, functions.ExtractYear):
+    pass
+
+
+class EpochExtractIsoYear(EpochTransformMixin, functions.ExtractIsoYear):
+    pass
+
+
+class EpochExtractQuarter(EpochTransformMixin, functions.ExtractQuarter):
+    pass
+
+
+class EpochExtractMonth(EpochTransformMixin, functions.ExtractMonth):
+    pass
+
+
+class EpochExtractDay(EpochTransformMixin, functions.ExtractDay):
+    pass
+
+
+class EpochExtractWeek(EpochTransformMixin, functions.ExtractWeek):
+    pass
+
+
+class EpochExtractWeekDay(EpochTransformMixin, functions.ExtractWeekDay):
+    pass
+
+
+class EpochExtractIsoWeekDay(EpochTransformMixin, functions.ExtractIsoWeekDay):
+    pass
+
+
+class EpochExtractHour(EpochTransformMixin, functions.ExtractHour):
+    pass
+
+
+class EpochExtractMinute(EpochTransformMixin, functions.ExtractMinute):
+    pass
+
+
+class EpochExtractSecond(EpochTransformMixin, functions.ExtractSecond):
+    pass
+
+
+class EpochTruncDate(EpochTransformMixin, functions.TruncDate):
+    pass
+
+
+class OrdinalDate(Transform):
+    lookup_name = 'date'
+    output_field = DateField()
+
+    def as_sql(self, compiler, connection):
+        return compiler.compile(FromEpoch(self.lhs))
+
+    @property
+    def epoch_source(self):
+        return self.lhs
+
+
+class EpochRangeMixin(object):
+    """
+    Compare stored value with half-open range ``[start, end)`` of looked-up period
+
+    The column is compared directly instead of transformed, so index on it could be used.
+    Periods are in timezone of transform (current timezone by default) while USE_TZ is True.
+    Lookups of values without period, e.g. F expressions, fall back to compare transformed values.
+    Subclasses provide ``get_period(value)`` returning naive ``(start, end)`` datetimes of period
+    of value, or None if value isn't a period.
+    """
+    range_sql = {
+        'exact': ('(%(lhs)s >= %%s AND %(lhs)s < %%s)', ('start', 'end')),
+        'gt': ('%(lhs)s >= %%s', ('end', )),
+        'gte': ('%(lhs)s >= %%s', ('start', )),
+        'lt': ('%(lhs)s < %%s', ('start', )),
+        'lte': ('%(lhs)s < %%s', ('end', )),
+    }
+
+    def get_bounds(self, field):
+        period = self.get_period(self.rhs)
+        if period is None:
+            return None
+
+        start, end = period
+        if not isinstance(field, OrdinalField) and settings.USE_TZ:
+            tz = getattr(self.lhs, 'tzinfo', None) or timezone.get_current_timezone()
+            start, end = timezone.make_aware(start, tz), timezone.make_aware(end, tz)
+        return {'start': field.to_storage_bound(start), 'end': field.to_storage_bound(end)}
+
+    def as_sql(self, compiler, connection):
+        column = self.lhs.epoch_source
+        bounds = self.get_bounds(column.output_field) if self.rhs_is_direct_value() else None
+        if bounds is None:
+            return super(EpochRangeMixin, self).as_sql(compiler, connection)
+
+        lhs_sql, lhs_params = compiler.compile(column)
+        template, names = self.range_sql[self.lookup_name]
+        params = []
+        for name in names:
+            params.extend(lhs_params)
+            params.append(bounds[name])
+        return template % {'lhs': lhs_sql}, params
+
+
+def _period(start, get_end):
+    try:
+        return start, get_end()
+    except (ValueError, OverflowError):
+        return start, datetime.datetime.max
+
+
+class EpochYearRange(EpochRangeMixin):
+
+    def get_period(self, value):
+        year = int(value)
+        if isinstance(self.lhs, functions.ExtractIsoYear):
+            return _period(datetime.datetime.fromisocalendar(year, 1, 1),
+                           lambda: datetime.datetime.fromisocalendar(year + 1, 1, 1))
+        return _period(datetime.datetime(year, 1, 1), lambda: datetime.datetime(year + 1, 1, 1))
+
+
+class EpochDateRange(EpochRangeMixin):
+
+    def get_period(self, value):
+        start = datetime.datetime(value.year, value.month, value.day)
+        return _period(start, lambda: start + datetime.timedelta(days=1))
+
+
+class EpochCalendarRange(EpochRangeMixin):
+    """
+    Period of date value, integers fall back to compare extracted values
+    """
+
+    def get_prep_lookup(self):
+        if isinstance(self.rhs, datetime.date):
+            return self.rhs
+        return super(EpochCalendarRange, self).get_prep_lookup()
+
+
+class EpochMonthRange(EpochCalendarRange):
+
+    def get_period(self, value):
+        if not isinstance(value, datetime.date):
+            return None
+        return _period(datetime.datetime(value.year, value.month, 1),
+                       lambda: datetime.datetime(value.year + value.month // 12, value.month % 12 + 1, 1))
+
+
+class EpochWeekRange(EpochCalendarRange):
+
+    def get_period(self, value):
+        if not isinstance(value, datetime.date):
+            return None
+        start = datetime.datetime(value.year, value.month, value.day) - datetime.timedelta(days=value.weekday())
+        return _period(start, lambda: start + datetime.timedelta(days=7))
+
+
+class EpochYearExact(EpochYearRange, lookups.Exact):
+    pass
+
+
+class EpochYearGt(EpochYearRange, lookups.GreaterThan):
+    pass
+
+
+class EpochYearGte(EpochYearRange, lookups.GreaterThanOrEqual):
+    pass
+
+
+class EpochYearLt(EpochYearRange, lookups.LessThan):
+    pass
+
+
+class EpochYearLte(EpochYearRange, lookups.LessThanOrEqual):
+    pass
+
+
+class EpochDateExact(EpochDateRange, lookups.Exact):
+    pass
+
+
+class EpochDateGt(EpochDateRange, lookups.GreaterThan):
+    pass
+
+
+class EpochDateGte(EpochDateRange, lookups.GreaterThanOrEqual):
+    pass
+
+
+class EpochDateLt(EpochDateRange, lookups.LessThan):
+    pass
+
+
+class EpochDateLte(EpochDateRange, lookups.LessThanOrEqual):
+    pass
+
+
+class EpochMonthExact(EpochMonthRange, lookups.Exact):
+    pass
+
+
+class EpochMonthGt(EpochMonthRange, lookups.GreaterThan):
+    pass
+
+
+class EpochMonthGte(EpochMonthRange, lookups.GreaterThanOrEqual):
+    pass
+
+
+class EpochMonthLt(EpochMonthRange, lookups.LessThan):
+    pass
+
+
+class EpochMonthLte(EpochMonthRange, lookups.LessThanOrEqual):
+    pass
+
+
+class EpochWeekExact(EpochWeekRange, lookups.Exact):
+    pass
+
+
+class EpochWeekGt(EpochWeekRange, lookups.GreaterThan):
+    pass
+
+
+class EpochWeekGte(EpochWeekRange, lookups.GreaterThanOrEqual):
+    pass
+
+
+class EpochWeekLt(EpochWeekRange, lookups.LessThan):
+    pass
+
+
+class EpochWeekLte(EpochWeekRange, lookups.LessThanOrEqual):
+    pass
+
+
+class EpochCompareMixin(object):
+    """
+    Compare with expressions in storage of the field (lhs), ``EpochNow`` is bound to it
+    and timestamps of other storage are scaled
+    """
+
+    def get_prep_lookup(self):
+        field = self.lhs.output_field
+        if isinstance(self.rhs, EpochNow):
+            return self.rhs.bind(field)
+        rhs = super(EpochCompareMixin, self).get_prep_lookup()
+        try:
+            source = rhs.output_field if hasattr(rhs, 'resolve_expression') else None
+        except FieldError:
+            # e.g. numbers added to stored values, compared as they are
+            source = None
+        if not isinstance(source, UnixTimeStampField) or \
+                isinstance(source, OrdinalField) or isinstance(field, OrdinalField):
+            return rhs
+
+        from_scale, to_scale = source.storage_scale or 1, field.storage_scale or 1
+        if from_scale == to_scale:
+            return rhs
+        if from_scale < to_scale:
+            template = '(%%(expressions)s * %d)' % (to_scale // from_scale)
+        else:
+            template = '(%%(expressions)s / %r)' % float(from_scale // to_scale)
+        return Func(rhs, template=template, output_field=FloatField())
+
+
+class EpochExact(EpochCompareMixin, lookups.Exact):
+    pass
+
+
+class EpochGt(EpochCompareMixin, lookups.GreaterThan):
+    pass
+
+
+class EpochGte(EpochCompareMixin, lookups.GreaterThanOrEqual):
+    pass
+
+
+class EpochLt(EpochCompareMixin, lookups.LessThan):
+    pass
+
+
+class EpochLte(EpochCompareMixin, lookups.LessThanOrEqual):
+    pass
+
+
+# OrdinalField inherits these, time components raise ValueError on it
+UnixTimeStampField.register_lookup(EpochExtractYear)
+UnixTimeStampField.register_lookup(EpochExtractIsoYear)
+UnixTimeStampField.register_lookup(EpochExtractQuarter)
+UnixTimeStampField.register_lookup(EpochExtractMonth)
+UnixTimeStampField.register_lookup(EpochExtractDay)
+UnixTimeStampField.register_lookup(EpochExtractWeek)
+UnixTimeStampField.register_lookup(EpochExtractWeekDay)
+UnixTimeStampField.register_lookup(EpochExtractIsoWeekDay)
+UnixTimeStampField.register_lookup(EpochExtractHour)
+UnixTimeStampField.register_lookup(EpochExtractMinute)
+UnixTimeStampField.register_lookup(EpochExtractSecond)
+UnixTimeStampField.register_lookup(EpochTruncDate)
+UnixTimeStampField.register_lookup(EpochExact)
+UnixTimeStampField.register_lookup(EpochGt)
+UnixTimeStampField.register_lookup(EpochGte)
+UnixTimeStampField.register_lookup(EpochLt)
+UnixTimeStampField.register_lookup(EpochLte)
+OrdinalField.register_lookup(OrdinalDate)
+
+for transform, range_lookups in (
+    (EpochExtractYear, (EpochYearExact, EpochYearGt, EpochYearGte, EpochYearLt, EpochYearLte)),
+    (EpochExtractIsoYear, (EpochYearExact, EpochYearGt, EpochYearGte, EpochYearLt, EpochYearLte)),
+    (EpochTruncDate, (EpochDateExact, EpochDateGt, EpochDateGte, EpochDateLt, EpochDateLte)),
+    (OrdinalDate, (EpochDateExact, EpochDateGt, EpochDateGte, EpochDateLt, EpochDateLte)),
+    (EpochExtractMonth, (EpochMonthExact, EpochMonthGt, EpochMonthGte, EpochMonthLt, EpochMonthLte)),
+    (EpochExtractWeek, (EpochWeekExact, EpochWeekGt, EpochWeekGte, EpochWeekLt, EpochWeekLte)),
+):
+    for lookup in range_lookups:
+        transform.register_lookup(lookup)
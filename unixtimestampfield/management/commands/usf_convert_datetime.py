@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Convert DateTimeField into UnixTimeStampField in chunks, see :mod:`unixtimestampfield.backfill`
+
+.. versionadded:: 1.1.0
+
+    Initial
+"""
+from django.core import exceptions
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import backfill
+
+
+class Command(BaseCommand):
+    help = 'Copy values of DateTimeField into UnixTimeStampField of the same model, in resumable chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help='app_label.ModelName')
+        parser.add_argument('source', help='name of DateTimeField')
+        parser.add_argument('target', help='name of UnixTimeStampField')
+        parser.add_argument('--by', choices=(backfill.BY_PK, backfill.BY_TIME), default=backfill.BY_PK,
+                            help='chunk by ranges of primary keys or of source')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='primary keys per chunk')
+        parser.add_argument('--interval', type=int, default=86400, help='seconds of source per chunk')
+        parser.add_argument('--workers', type=int, default=1, help='processes running chunks')
+        parser.add_argument('--checkpoint', help='JSON file of chunks done, resumed from if exists')
+        parser.add_argument('--sleep', type=float, default=0, help='seconds to sleep after each chunk')
+        parser.add_argument('--naive-timezone', default='UTC', help='timezone of naive source values')
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--dry-run', action='store_true', help='print number of rows and chunks only')
+
+    def handle(self, *args, **options):
+        try:
+            job = backfill.Backfill(
+                options['model'], options['source'], options['target'], by=options['by'],
+                chunk_size=options['chunk_size'], interval=options['interval'], using=options['database'],
+                naive_timezone=options['naive_timezone'], sleep=options['sleep'])
+            checkpoint = backfill.Checkpoint(options['checkpoint'], job.params)
+        except (LookupError, ValueError, exceptions.FieldDoesNotExist) as e:
+            raise CommandError(e)
+
+        rows, chunks = job.estimate(checkpoint.done)
+        if options['dry_run']:
+            self.stdout.write('%s rows in %s chunks to convert' % (rows, chunks))
+            return
+
+        def progress(chunk, converted):
+            if options['verbosity'] > 1:
+                self.stdout.write('chunk [%s, %s): %s rows' % (chunk[0], chunk[1], converted))
+
+        converted = backfill.run(job, checkpoint, workers=options['workers'], callback=progress)
+        if options['verbosity'] > 0:
+            self.stdout.write('%s rows converted' % converted)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Export model as NDJSON or CSV, see :mod:`unixtimestampfield.export`
+
+.. versionadded:: 1.1.0
+
+    Initial
+"""
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import export
+
+
+class Command(BaseCommand):
+    help = 'Stream rows of model as NDJSON or CSV, timestamps are formatted from stored values.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help='app_label.ModelName')
+        parser.add_argument('--fields', help='comma separated field names, concrete fields by default')
+        parser.add_argument('--format', choices=export.FORMATS, default=export.FORMAT_NDJSON)
+        parser.add_argument('--timestamps', choices=export.TIMESTAMPS, default=export.TIMESTAMPS_NUMBER)
+        parser.add_argument('--chunk-size', type=int, default=export.CHUNK_SIZE)
+        parser.add_argument('--database', default='default')
+        parser.add_argument('-o', '--output', help='file path, stdout by default')
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        fields = options['fields'].split(',') if options['fields'] else None
+        for name in fields or ():
+            try:
+                model._meta.get_field(name)
+            except FieldDoesNotExist as e:
+                raise CommandError(e)
+
+        queryset = model._default_manager.using(options['database']).order_by('pk')
+        kwargs = {
+            'format': options['format'],
+            'fields': fields,
+            'timestamps': options['timestamps'],
+            'chunk_size': options['chunk_size'],
+        }
+
+        if options['output']:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as stream:
+                count = export.export(queryset, stream, **kwargs)
+        else:
+            count = export.export(queryset, self.stdout, **kwargs)
+
+        if options['verbosity'] > 1:
+            self.stderr.write('%s rows exported' % count)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rebuild rollups in range, see :mod:`unixtimestampfield.rollups`
+
+.. versionadded:: 1.1.0
+
+    Initial
+"""
+from django.core import exceptions
+from django.core.management.base import BaseCommand, CommandError
+
+from ...fields import TimestampPatchMixin
+from ... import rollups
+
+
+class Command(BaseCommand):
+    help = 'Recompute rollup rows of buckets in range from source rows, in chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='names of rollups, all registered ones by default')
+        parser.add_argument('--start', help='start of range, e.g. 2026-01-01 or epoch seconds')
+        parser.add_argument('--end', help='end of range, excluded, e.g. 2026-02-01 or epoch seconds')
+        parser.add_argument('--chunk', type=int, default=86400, help='seconds per chunk (transaction)')
+
+    def handle(self, *args, **options):
+        try:
+            targets = [rollups.get_rollup(name) for name in options['names']] or \
+                list(rollups.get_rollups().values())
+            converter = TimestampPatchMixin()
+            start, end = (
+                None if options[bound] is None else converter.to_timestamp(options[bound])
+                for bound in ('start', 'end'))
+        except (ValueError, exceptions.ValidationError) as e:
+            raise CommandError(e)
+
+        for rollup in targets:
+            written = rollup.rebuild(start, end, chunk=options['chunk'])
+            if options['verbosity'] > 0:
+                self.stdout.write('%s: %s rows written' % (rollup.name, written))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+QuerySet and Manager
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, stamp auto_now fields once per bulk_create and bulk_update.
+    Send :data:`bulk_created` after bulk_create.
+    Add batch_iterator and abatch_iterator, see :mod:`unixtimestampfield.iterators`.
+    Bind :class:`~unixtimestampfield.functions.EpochNow` of update to storage of fields.
+    Add usf_array, see :mod:`unixtimestampfield.arrays`.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`UnixTimeStampQuerySet`
+* :class:`UnixTimeStampManager`
+
+Signals:
+
+* :data:`bulk_created`, sent with ``objs`` and ``using`` after bulk_create, which doesn't send post_save
+
+Members
+-------
+
+"""
+from django.db import models
+from django.dispatch import Signal
+
+from . import arrays, iterators
+from .fields import UnixTimeStampField, stamp_batch
+from .functions import EpochNow
+
+bulk_created = Signal()
+
+
+class UnixTimeStampQuerySet(models.QuerySet):
+    """
+    QuerySet reading clock once per bulk_create or bulk_update, all objects of the call are stamped
+    with the same value, which is converted into value of field and stored value once.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with stamp_batch():
+            objs = super(UnixTimeStampQuerySet, self).bulk_create(objs, *args, **kwargs)
+        bulk_created.send(sender=self.model, objs=objs, using=self.db)
+        return objs
+
+    def update(self, **kwargs):
+        """
+        ``EpochNow()`` and ``Ago()`` of timestamp fields are computed in their storage, e.g. milliseconds
+        of int64_ms
+        """
+        for name, value in kwargs.items():
+            if isinstance(value, EpochNow):
+                kwargs[name] = value.bind(self.model._meta.get_field(name))
+        return super(UnixTimeStampQuerySet, self).update(**kwargs)
+
+    def batch_iterator(self, chunk_size=iterators.CHUNK_SIZE, fields=None, usf_format=None):
+        """
+        iterate objects, or tuples of ``fields``, with timestamps converted per chunk
+        """
+        return iterators.batch_iterator(self, chunk_size, fields, usf_format)
+
+    def abatch_iterator(self, chunk_size=iterators.CHUNK_SIZE, fields=None, usf_format=None):
+        """
+        async version of :meth:`batch_iterator`
+        """
+        return iterators.abatch_iterator(self, chunk_size, fields, usf_format)
+
+    def usf_array(self, name, dtype=arrays.DTYPE_DATETIME64, chunk_size=arrays.CHUNK_SIZE):
+        """
+        array of timestamp field ``name``, ``datetime64[us]`` or ``float64`` seconds, from stored values
+        """
+        return arrays.to_array(self, name, dtype, chunk_size)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """
+        auto_now fields in ``fields`` are stamped as well, which bulk_update of Django leaves as they are
+        """
+        stamped = [
+            field for field in (self.model._meta.get_field(name) for name in fields)
+            if isinstance(field, UnixTimeStampField) and field.auto_now
+        ]
+        if not stamped:
+            return super(UnixTimeStampQuerySet, self).bulk_update(objs, fields, *args, **kwargs)
+
+        objs = list(objs)
+        with stamp_batch():
+            stamps = [(field.attname, field.get_batch_stamp()) for field in stamped]
+            # stamps are saved as stored values, then objects get values of field
+            for attname, (_, stamp) in stamps:
+                for obj in objs:
+                    setattr(obj, attname, stamp)
+            try:
+                return super(UnixTimeStampQuerySet, self).bulk_update(objs, fields, *args, **kwargs)
+            finally:
+                for attname, (value, _) in stamps:
+                    for obj in objs:
+                        setattr(obj, attname, value)
+
+
+UnixTimeStampManager = models.Manager.from_queryset(UnixTimeStampQuerySet)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+Django middleware
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, freeze now of clocks per request.
+    Override USF_FORMAT per request by path prefixes of `USF_FORMAT_PATHS` setting.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`FrozenNowMiddleware`
+* :class:`FormatMiddleware`
+
+Members
+-------
+
+"""
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:  # asgiref < 3.6
+    import asyncio
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+from django.conf import settings
+
+from .clocks import frozen_now
+from .submiddleware import usf_format
+
+
+class FrozenNowMiddleware(object):
+    """
+    Read clock once per request, so that all auto_now fields saved while handling it agree
+
+    Add ``'unixtimestampfield.middleware.FrozenNowMiddleware'`` to MIDDLEWARE.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with frozen_now():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with frozen_now():
+            return await self.get_response(request)
+
+
+class FormatMiddleware(object):
+    """
+    Override USF_FORMAT while handling requests of which path starts with prefixes of `USF_FORMAT_PATHS`,
+    e.g. ``[('/api/', 'usf_timestamp')]``, first matched one is applied
+
+    Add ``'unixtimestampfield.middleware.FormatMiddleware'`` to MIDDLEWARE. Views decorated by
+    :class:`~unixtimestampfield.submiddleware.usf_format` override it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def get_format(self, request):
+        """
+        return USF_FORMAT of request, None if not overridden
+        """
+        for prefix, value in getattr(settings, 'USF_FORMAT_PATHS', ()):
+            if request.path_info.startswith(prefix):
+                return value
+        return None
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        value = self.get_format(request)
+        if value is None:
+            return self.get_response(request)
+        with usf_format(value):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        value = self.get_format(request)
+        if value is None:
+            return await self.get_response(request)
+        with usf_format(value):
+            return await self.get_response(request)
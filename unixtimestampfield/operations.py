@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Migration operations
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, convert DateTimeField columns into UnixTimeStampField columns and back in database.
+
+
+Each operation copies values of one field into another field of the same model by one ``UPDATE``
+computed in database, with :class:`~unixtimestampfield.functions.DateTimeToEpoch` and
+:class:`~unixtimestampfield.functions.EpochToDateTime` (SQLite, PostgreSQL and MySQL). Both are
+reversible, backwards copies the other way. ``DateField`` with
+:class:`~unixtimestampfield.fields.OrdinalField` converts day numbers.
+
+Fields are taken from migration state, so options of them (e.g. ``storage``) are the ones of
+``UnixTimeStampField.deconstruct()`` at that migration. To replace a DateTimeField, add the new field,
+convert, then remove the old one:
+
+.. code-block:: python
+
+    from unixtimestampfield.fields import UnixTimeStampField
+    from unixtimestampfield.operations import ConvertDateTimeToEpoch
+
+    operations = [
+        migrations.AddField('modela', 'created_ts', UnixTimeStampField(storage='int64_ms', default=0)),
+        ConvertDateTimeToEpoch('modela', 'created', 'created_ts'),
+        migrations.RemoveField('modela', 'created'),
+        migrations.RenameField('modela', 'created_ts', 'created'),
+    ]
+
+Rows of which source is NULL are left as they are. SQL of operations is shown by ``sqlmigrate``.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`ConvertDateTimeToEpoch`
+* :class:`ConvertEpochToDateTime`
+
+Members
+-------
+
+"""
+from django.db import models
+from django.db.migrations.operations.base import Operation
+from django.db.models.sql import UpdateQuery
+
+from .fields import OrdinalField, UnixTimeStampField
+from .functions import DateTimeToEpoch, EpochToDateTime
+
+
+class ConvertOperation(Operation):
+    """
+    Copy values of ``source`` into ``target`` of model in database, state is unchanged,
+    subclasses provide ``get_fields(model)`` returning (datetime field, timestamp field) of model
+    """
+    reversible = True
+    reduces_to_sql = True
+
+    def __init__(self, model_name, source, target):
+        self.model_name, self.source, self.target = model_name, source, target
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def check_fields(self, datetime_field, epoch_field):
+        if not isinstance(epoch_field, UnixTimeStampField):
+            raise ValueError('%s should be a UnixTimeStampField or OrdinalField' % epoch_field.name)
+        if isinstance(epoch_field, OrdinalField):
+            if not isinstance(datetime_field, models.DateField):
+                raise ValueError('%s should be a DateField or DateTimeField' % datetime_field.name)
+        elif not isinstance(datetime_field, models.DateTimeField):
+            raise ValueError('%s should be a DateTimeField' % datetime_field.name)
+
+    def copy(self, schema_editor, model, source, target, value):
+        """
+        execute ``UPDATE model SET target = value WHERE source IS NOT NULL``
+        """
+        query = UpdateQuery(model)
+        query.add_update_values({target.name: value})
+        query.add_q(models.Q(**{'%s__isnull' % source.name: False}))
+        sql, params = query.get_compiler(connection=schema_editor.connection).as_sql()
+        schema_editor.execute(sql, params)
+
+    def to_epoch(self, app_label, schema_editor, state):
+        model = state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            datetime_field, epoch_field = self.get_fields(model)
+            self.copy(schema_editor, model, datetime_field, epoch_field, DateTimeToEpoch(
+                datetime_field.name, epoch_field))
+
+    def to_datetime(self, app_label, schema_editor, state):
+        model = state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            datetime_field, epoch_field = self.get_fields(model)
+            output_field = models.DateTimeField() if isinstance(datetime_field, models.DateTimeField) else \
+                models.DateField()
+            self.copy(schema_editor, model, epoch_field, datetime_field, EpochToDateTime(
+                epoch_field.name, output_field=output_field))
+
+    @property
+    def migration_name_fragment(self):
+        return 'convert_%s_%s_%s' % (self.model_name.lower(), self.source.lower(), self.target.lower())
+
+
+class ConvertDateTimeToEpoch(ConvertOperation):
+    """
+    Copy ``source`` DateTimeField (or DateField for OrdinalField) into ``target`` UnixTimeStampField
+    """
+
+    def get_fields(self, model):
+        fields = model._meta.get_field(self.source), model._meta.get_field(self.target)
+        self.check_fields(*fields)
+        return fields
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self.to_epoch(app_label, schema_editor, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self.to_datetime(app_label, schema_editor, to_state)
+
+    def describe(self):
+        return 'Convert %s.%s into timestamps of %s' % (self.model_name, self.source, self.target)
+
+
+class ConvertEpochToDateTime(ConvertOperation):
+    """
+    Copy ``source`` UnixTimeStampField into ``target`` DateTimeField (or DateField for OrdinalField)
+    """
+
+    def get_fields(self, model):
+        fields = model._meta.get_field(self.target), model._meta.get_field(self.source)
+        self.check_fields(*fields)
+        return fields
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self.to_datetime(app_label, schema_editor, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self.to_epoch(app_label, schema_editor, to_state)
+
+    def describe(self):
+        return 'Convert timestamps of %s.%s into %s' % (self.model_name, self.source, self.target)
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rollups
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, counts and sums per time bucket maintained incrementally.
+
+
+A rollup model keeps count (and sums of fields) of rows of a source model per bucket of
+timestamp field, one row per bucket size and bucket start. Rollups are updated on ``post_save``,
+``post_delete`` and :data:`~unixtimestampfield.managers.bulk_created` of
+:class:`~unixtimestampfield.managers.UnixTimeStampQuerySet`:
+
+.. code-block:: python
+
+    >>> from unixtimestampfield.rollups import Rollup, RollupModel, register
+    >>> class EventRollup(RollupModel):
+    ...     amount = models.FloatField(default=0)
+    >>> register(Rollup(EventRollup, Event, 'created', sizes=(60, 3600), sums={'amount': 'amount'}))
+    >>> EventRollup.objects.filter(size=3600).values_list('bucket', 'count', 'amount')
+
+Changes which send no signals, e.g. ``QuerySet.update``, ``bulk_update``, raw SQL or
+``bulk_create`` with ``ignore_conflicts``, are not followed. Rebuild ranges touched by them with
+:meth:`Rollup.rebuild` or management command ``usf_rebuild_rollups``.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`RollupModel`
+* :class:`Rollup`
+
+Functions:
+
+* :func:`register`
+* :func:`get_rollup`
+* :func:`get_rollups`
+
+Members
+-------
+
+"""
+import datetime
+import math
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .fields import EPOCH_UTC, UnixTimeStampField, to_seconds
+from .functions import RawEpoch, TimeBucket
+from .managers import bulk_created
+
+_rollups = {}
+
+
+class RollupModel(models.Model):
+    """
+    Base of rollup models, rows of ``size`` seconds buckets starting at ``bucket``,
+    add fields of sums in subclasses
+    """
+    size = models.IntegerField()
+    bucket = UnixTimeStampField()
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        unique_together = (('size', 'bucket'), )
+
+
+class Rollup(object):
+    """
+    Rollup of rows of ``source`` per buckets of ``sizes`` seconds of timestamp field ``field_name``
+    into ``model`` (subclass of :class:`RollupModel`), ``sums`` maps fields of model to fields of source.
+    Every size should divide the largest one.
+    """
+
+    def __init__(self, model, source, field_name, sizes=(60, 3600), sums=None, name=None):
+        self.model, self.source, self.field_name = model, source, field_name
+        self.sizes = tuple(int(size) for size in sizes)
+        if not self.sizes or min(self.sizes) <= 0:
+            raise ValueError('sizes of buckets must be positive: %s' % (sizes, ))
+        if any(max(self.sizes) % size for size in self.sizes):
+            # rebuild chunks by largest size, a bucket of other size must not cross chunks
+            raise ValueError('sizes of buckets must divide largest size: %s' % (sizes, ))
+        self.sums = dict(sums or {})
+        self.name = name or model._meta.label_lower
+        self.state_attr = '_rollup_%s' % self.name.replace('.', '_')
+
+    @property
+    def field(self):
+        return self.source._meta.get_field(self.field_name)
+
+    def connect(self):
+        uid = 'unixtimestampfield.rollups.%s' % self.name
+        pre_save.connect(self.on_pre_save, sender=self.source, dispatch_uid=uid)
+        post_save.connect(self.on_post_save, sender=self.source, dispatch_uid=uid)
+        post_delete.connect(self.on_post_delete, sender=self.source, dispatch_uid=uid)
+        bulk_created.connect(self.on_bulk_created, sender=self.source, dispatch_uid=uid)
+
+    def disconnect(self):
+        uid = 'unixtimestampfield.rollups.%s' % self.name
+        for signal in (pre_save, post_save, post_delete, bulk_created):
+            signal.disconnect(sender=self.source, dispatch_uid=uid)
+
+    def get_contribution(self, stored, sums):
+        """
+        return (seconds, [sums]) of row by stored value of field and values of summed fields,
+        None if value of field is None
+        """
+        if stored is None:
+            return None
+        return self.field.stored_to_seconds(stored), [value or 0 for value in sums]
+
+    def contribution_of(self, instance):
+        field = self.field
+        value = getattr(instance, field.attname)
+        stored = None if value is None else field.get_prep_value(value)
+        return self.get_contribution(stored, [getattr(instance, name) for name in self.sums.values()])
+
+    def add(self, deltas, contribution, sign=1):
+        """
+        add contribution into deltas {(size, bucket): [count, sums...]}
+        """
+        if contribution is None:
+            return
+        seconds, sums = contribution
+        for size in self.sizes:
+            key = (size, math.floor(seconds / size) * size)
+            delta = deltas.get(key)
+            if delta is None:
+                delta = deltas[key] = [0] * (len(sums) + 1)
+            delta[0] += sign
+            for i, value in enumerate(sums, 1):
+                delta[i] += sign * value
+
+    def apply(self, deltas):
+        """
+        add deltas {(size, bucket): [count, sums...]} into rows of rollup model
+        """
+        names = list(self.sums)
+        manager = self.model._default_manager
+        for (size, bucket), delta in deltas.items():
+            if not any(delta):
+                continue
+            changes = dict(zip(['count'] + names, delta))
+            updates = {name: F(name) + value for name, value in changes.items() if value}
+            if manager.filter(size=size, bucket=bucket).update(**updates):
+                continue
+            try:
+                with transaction.atomic(using=manager.db):
+                    manager.create(size=size, bucket=bucket, **changes)
+            except IntegrityError:
+                # created by another one in the meantime
+                manager.filter(size=size, bucket=bucket).update(**updates)
+
+    def get_stored_contribution(self, instance):
+        """
+        contribution of instance as saved in database, None if not found
+        """
+        row = self.source._default_manager.using(instance._state.db).filter(pk=instance.pk).values_list(
+            RawEpoch(self.field_name), *self.sums.values()).first()
+        if row is None:
+            return None
+        return self.get_contribution(row[0], row[1:])
+
+    def on_pre_save(self, sender, instance, raw=False, update_fields=None, **kwargs):
+        if raw or instance._state.adding or instance.pk is None:
+            return
+        tracked = {self.field.name, self.field.attname}.union(self.sums.values())
+        if update_fields is not None and not tracked.intersection(update_fields):
+            return
+        setattr(instance, self.state_attr, self.get_stored_contribution(instance))
+
+    def on_post_save(self, sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+        if raw:
+            return
+        deltas = {}
+        if not created:
+            if not hasattr(instance, self.state_attr):
+                return
+            self.add(deltas, getattr(instance, self.state_attr), -1)
+            delattr(instance, self.state_attr)
+        self.add(deltas, self.contribution_of(instance))
+        self.apply(deltas)
+
+    def on_post_delete(self, sender, instance, **kwargs):
+        deltas = {}
+        self.add(deltas, self.contribution_of(instance), -1)
+        self.apply(deltas)
+
+    def on_bulk_created(self, sender, objs, **kwargs):
+        deltas = {}
+        for obj in objs:
+            self.add(deltas, self.contribution_of(obj))
+        self.apply(deltas)
+
+    def rebuild(self, start=None, end=None, chunk=86400):
+        """
+        recompute rows of buckets in ``[start, end)`` (datetimes or epoch seconds, whole source by default)
+        in chunks of ``chunk`` seconds, one transaction per chunk, return number of rows written
+
+        Range is extended to buckets of largest size.
+        """
+        field, largest = self.field, max(self.sizes)
+        manager = self.source._default_manager
+        if start is None or end is None:
+            bounds = manager.aggregate(
+                low=models.Min(RawEpoch(self.field_name)), high=models.Max(RawEpoch(self.field_name)))
+            if bounds['low'] is None:
+                return 0
+            start = field.stored_to_seconds(bounds['low']) if start is None else start
+            end = field.stored_to_seconds(bounds['high']) + 1 if end is None else end
+
+        start = math.floor(to_seconds(start) / largest) * largest
+        end = math.ceil(to_seconds(end) / largest) * largest
+        chunk = max(int(math.ceil(chunk / largest)), 1) * largest
+
+        written = 0
+        for chunk_start in range(int(start), int(end), chunk):
+            written += self.rebuild_chunk(chunk_start, min(chunk_start + chunk, int(end)))
+        return written
+
+    def rebuild_chunk(self, start, end):
+        field = self.field
+        rows = []
+        source = self.source._default_manager.filter(**{
+            '%s__gte' % self.field_name: EPOCH_UTC + datetime.timedelta(seconds=start),
+            '%s__lt' % self.field_name: EPOCH_UTC + datetime.timedelta(seconds=end),
+        })
+        for size in self.sizes:
+            aggregates = {'_count': Count('pk')}
+            aggregates.update({'_sum_%s' % name: Sum(source_name) for name, source_name in self.sums.items()})
+            buckets = source.values(_bucket=RawEpoch(TimeBucket(self.field_name, size))).annotate(
+                **aggregates).order_by()
+            for bucket in buckets:
+                values = {name: bucket['_sum_%s' % name] or 0 for name in self.sums}
+                rows.append(self.model(
+                    size=size, bucket=field.stored_to_seconds(bucket['_bucket']), count=bucket['_count'], **values))
+
+        manager = self.model._default_manager
+        with transaction.atomic(using=manager.db):
+            manager.filter(size__in=self.sizes, bucket__gte=start, bucket__lt=end).delete()
+            manager.bulk_create(rows)
+        return len(rows)
+
+
+def register(rollup):
+    """
+    register rollup by name and connect its signals, return rollup
+    """
+    _rollups[rollup.name] = rollup
+    rollup.connect()
+    return rollup
+
+
+def get_rollup(name):
+    try:
+        return _rollups[name]
+    except KeyError:
+        raise ValueError('rollup: %s is not registered, registered: %s' % (name, ', '.join(sorted(_rollups))))
+
+
+def get_rollups():
+    return dict(_rollups)
@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+
+"""
+Partitions by time range
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, route rows into databases by time range of timestamp field.
+
+
+Rows of a model are split into databases by value of a
+:class:`~unixtimestampfield.fields.UnixTimeStampField`, e.g. one database per month.
+:class:`PartitionScheme` maps ranges of epoch seconds to database aliases,
+:class:`PartitionedManager` declares the scheme on model:
+
+.. code-block:: python
+
+    >>> from unixtimestampfield.routers import PartitionScheme, PartitionedManager
+    >>> class Event(models.Model):
+    ...     created = UnixTimeStampField(auto_now_add=True)
+    ...     objects = PartitionedManager('created', PartitionScheme.monthly('events_%Y_%m', (2026, 1), (2027, 1)))
+
+and :class:`TimeRangeRouter` in ``DATABASE_ROUTERS`` routes saves of instances into their partitions.
+
+Querysets not pinned by ``using()`` are pruned by filters on the field (``exact``, ``in``, ``gt``,
+``gte``, ``lt``, ``lte``, ``range`` and ``year``/``date``/``month``/``week`` lookups of ANDed conditions),
+then run on partitions touched only and merged. Results ordered by the field are concatenated in order
+of partitions, other orderings of model instances or values are merged by ordered fields.
+``count``, ``exists``, ``update``, ``delete`` and ``aggregate`` of Count, Sum, Min and Max are
+combined across partitions, ``create``, ``bulk_create`` and ``bulk_update`` route objects into partitions.
+``update`` of the field, and saving or deleting an instance whose value of the field moved into
+another partition, raise NotSupportedError, as rows would stay in partitions of old values.
+
+Value of ``auto_now`` fields is read while routing, save within
+:func:`~unixtimestampfield.clocks.frozen_now` (e.g. by ``FrozenNowMiddleware``)
+to get the same value on save.
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`PartitionScheme`
+* :class:`TimeRangeRouter`
+* :class:`PartitionedQuerySet`
+* :class:`PartitionedManager`
+
+Functions:
+
+* :func:`get_partitioning`
+
+Members
+-------
+
+"""
+import bisect
+import datetime
+import heapq
+import itertools
+import math
+import operator
+
+from django.core import exceptions
+from django.db import NotSupportedError, models
+from django.db.models import Count, Max, Min, Sum, lookups
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import Col
+from django.db.models.query import ModelIterable, ValuesIterable
+from django.db.models.sql.where import AND, WhereNode
+from django.utils.functional import cached_property
+
+from .clocks import frozen_now
+from .fields import stamp_batch, to_seconds
+from .lookups import EpochRangeMixin
+from .managers import UnixTimeStampQuerySet
+
+_partitioned = {}
+
+
+class PartitionScheme(object):
+    """
+    Partitions of time ranges, ``partitions`` are ``(start, alias)`` in order,
+    start is epoch seconds or datetime (naive in UTC), each partition ends at start of next one.
+    Values before start of first partition are out of scheme.
+    """
+
+    def __init__(self, partitions):
+        partitions = sorted((to_seconds(start), alias) for start, alias in partitions)
+        self.starts = [start for start, _ in partitions]
+        self.aliases = [alias for _, alias in partitions]
+
+    @classmethod
+    def monthly(cls, alias_format, start, end):
+        """
+        monthly partitions from (year, month) start to (year, month) end, excluded,
+        aliases are formatted by strftime, e.g. ``'events_%Y_%m'``
+        """
+        (year, month), partitions = start, []
+        while (year, month) < tuple(end):
+            value = datetime.datetime(year, month, 1)
+            partitions.append((value, value.strftime(alias_format)))
+            year, month = year + month // 12, month % 12 + 1
+        return cls(partitions)
+
+    def alias_for(self, seconds):
+        i = bisect.bisect_right(self.starts, seconds) - 1
+        if i < 0:
+            raise ValueError('%s is before first partition %s' % (seconds, self.aliases[0]))
+        return self.aliases[i]
+
+    def aliases_between(self, low=None, high=None):
+        """
+        aliases of partitions overlapping ``[low, high]`` in order, None for unbounded
+        """
+        first = 0 if low is None else max(bisect.bisect_right(self.starts, low) - 1, 0)
+        last = len(self.starts) if high is None else bisect.bisect_right(self.starts, high)
+        return self.aliases[first:last]
+
+
+class Partitioning(object):
+    """
+    Field and scheme of partitioned model
+    """
+
+    def __init__(self, model, field_name, scheme):
+        self.model, self.field_name, self.scheme = model, field_name, scheme
+
+    @cached_property
+    def field(self):
+        return self.model._meta.get_field(self.field_name)
+
+    def value_of(self, instance):
+        """
+        epoch seconds of instance, ``auto_now`` fields are stamped
+        """
+        field = self.field
+        if field.auto_now or (field.auto_now_add and instance._state.adding):
+            value = field.pre_save(instance, instance._state.adding)
+        else:
+            value = getattr(instance, field.attname)
+        return field.stored_to_seconds(field.get_prep_value(value))
+
+    def alias_for(self, instance):
+        return self.scheme.alias_for(self.value_of(instance))
+
+
+def get_partitioning(model):
+    """
+    return :class:`Partitioning` of model declared by :class:`PartitionedManager`, None if not partitioned
+    """
+    partitioning = _partitioned.get(model._meta.label_lower)
+    if partitioning is None:
+        partitioning = _partitioned.get(model._meta.concrete_model._meta.label_lower)
+    return partitioning
+
+
+class TimeRangeRouter(object):
+    """
+    Route saves of partitioned models by value of field, add
+    ``'unixtimestampfield.routers.TimeRangeRouter'`` to DATABASE_ROUTERS.
+
+    Other models are left to other routers.
+    """
+
+    def db_for_write(self, model, **hints):
+        partitioning, instance = get_partitioning(model), hints.get('instance')
+        if partitioning is None or instance is None:
+            return None
+        alias = partitioning.alias_for(instance)
+        if not instance._state.adding and instance._state.db and alias != instance._state.db:
+            raise NotSupportedError(
+                '%s of %s in %s belongs to %s, moving rows across partitions is not supported' % (
+                    partitioning.field_name, instance._meta.label, instance._state.db, alias))
+        return alias
+
+    def db_for_read(self, model, **hints):
+        partitioning, instance = get_partitioning(model), hints.get('instance')
+        if partitioning is None or instance is None or not instance._state.db:
+            return None
+        return instance._state.db
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        model = hints.get('model')
+        partitioning = get_partitioning(model) if model is not None else None
+        if partitioning is None:
+            return None
+        return db in partitioning.scheme.aliases
+
+
+# finest stored unit, upper bounds less than value are value - MICROSECOND inclusive
+MICROSECOND = 0.000001
+
+# lookups of field into inclusive (low, high) seconds of stored rhs
+BOUNDS = {
+    'exact': lambda rhs: (rhs, rhs),
+    'gt': lambda rhs: (rhs, None),
+    'gte': lambda rhs: (rhs, None),
+    'lt': lambda rhs: (None, rhs - MICROSECOND),
+    'lte': lambda rhs: (None, rhs),
+    'range': lambda rhs: (rhs[0], rhs[1]),
+}
+# lookups of period into inclusive (low, high) seconds of [start, end)
+PERIOD_BOUNDS = {
+    'exact': lambda start, end: (start, end - MICROSECOND),
+    'gt': lambda start, end: (end, None),
+    'gte': lambda start, end: (start, None),
+    'lt': lambda start, end: (None, start - MICROSECOND),
+    'lte': lambda start, end: (None, end - MICROSECOND),
+}
+
+AGGREGATES = {
+    Count: sum,
+    Sum: sum,
+    Min: min,
+    Max: max,
+}
+
+
+class PartitionedQuerySet(UnixTimeStampQuerySet):
+    """
+    QuerySet running on partitions touched by filters, see :mod:`unixtimestampfield.routers`
+    """
+
+    @property
+    def partitioning(self):
+        return get_partitioning(self.model)
+
+    def get_bounds(self, node=None):
+        """
+        return [low, high] seconds of field from ANDed filters, None for unbounded,
+        and set of seconds of ``exact``/``in`` values or None if any
+        """
+        partitioning = self.partitioning
+        node = self.query.where if node is None else node
+        low, high, values = None, None, None
+        if node.negated or (node.connector != AND and len(node.children) > 1):
+            return low, high, values
+
+        for child in node.children:
+            if isinstance(child, WhereNode):
+                bounds = self.get_bounds(child)
+            else:
+                bounds = self.get_lookup_bounds(child, partitioning)
+                if bounds is None:
+                    continue
+            child_low, child_high, child_values = bounds
+            if child_low is not None:
+                low = child_low if low is None else max(low, child_low)
+            if child_high is not None:
+                high = child_high if high is None else min(high, child_high)
+            if child_values is not None:
+                values = child_values if values is None else values & child_values
+        return low, high, values
+
+    def get_lookup_bounds(self, lookup, partitioning):
+        if isinstance(lookup, EpochRangeMixin):
+            source = lookup.lhs.epoch_source
+            if not (isinstance(source, Col) and source.target is partitioning.field):
+                return None
+            if not lookup.rhs_is_direct_value() or lookup.lookup_name not in PERIOD_BOUNDS:
+                return None
+            bounds = lookup.get_bounds(partitioning.field)
+            if bounds is None:
+                return None
+            start, end = (partitioning.field.stored_to_seconds(bounds[name]) for name in ('start', 'end'))
+            return PERIOD_BOUNDS[lookup.lookup_name](start, end) + (None, )
+
+        if not isinstance(lookup, lookups.Lookup) or not lookup.rhs_is_direct_value():
+            return None
+        if not (isinstance(lookup.lhs, Col) and lookup.lhs.target is partitioning.field):
+            return None
+        if lookup.lookup_name == 'in':
+            values = {partitioning.field.stored_to_seconds(value) for value in lookup.rhs if value is not None}
+            return (min(values), max(values), values) if values else None
+        bound = BOUNDS.get(lookup.lookup_name)
+        if bound is None or lookup.rhs is None:
+            return None
+        if lookup.lookup_name == 'range':
+            rhs = [partitioning.field.stored_to_seconds(value) for value in lookup.rhs]
+        else:
+            rhs = partitioning.field.stored_to_seconds(lookup.rhs)
+        low, high = bound(rhs)
+        return low, high, {low} if lookup.lookup_name == 'exact' else None
+
+    def get_partitions(self):
+        """
+        return aliases of partitions touched by filters in order, alias only if pinned by ``using()``
+        """
+        if self._db is not None:
+            return [self._db]
+        scheme = self.partitioning.scheme
+        low, high, values = self.get_bounds()
+        if values is None:
+            return scheme.aliases_between(low, high)
+
+        aliases = set()
+        for value in values:
+            if (low is None or value >= low) and (high is None or value <= high) and math.isfinite(value):
+                try:
+                    aliases.add(scheme.alias_for(value))
+                except ValueError:
+                    pass
+        return [alias for alias in scheme.aliases if alias in aliases]
+
+    def get_ordering(self):
+        if self.query.order_by:
+            return list(self.query.order_by)
+        if self.query.default_ordering:
+            return list(self.model._meta.ordering)
+        return []
+
+    def fan_out(self, aliases, fetch):
+        """
+        merge rows of partitions fetched by ``fetch(queryset)`` according to ordering and limits
+        """
+        low, high = self.query.low_mark, self.query.high_mark
+        clones = []
+        for alias in aliases:
+            clone = self.using(alias)
+            clone.query.clear_limits()
+            if high is not None:
+                clone.query.set_limits(0, high)
+            clones.append(clone)
+
+        ordering = self.get_ordering()
+        first = ordering[0] if ordering and isinstance(ordering[0], str) else None
+        reverse = first is not None and first.startswith('-')
+        field = self.partitioning.field
+
+        if not ordering or (first is not None and first.lstrip('-') in (field.name, field.attname)):
+            # partitions are disjoint ranges of field in order
+            rows = itertools.chain.from_iterable(
+                fetch(clone) for clone in (reversed(clones) if reverse else clones))
+            return itertools.islice(rows, low, high)
+
+        names = self.get_ordering_names(ordering)
+        if any(name.startswith('-') != reverse for name in ordering):
+            raise NotSupportedError('Mixed ordering across partitions is not supported.')
+        if self._iterable_class is ModelIterable:
+            rows = heapq.merge(*[fetch(clone) for clone in clones], key=operator.attrgetter(*names), reverse=reverse)
+        elif self._iterable_class is ValuesIterable:
+            rows = heapq.merge(*[fetch(clone) for clone in clones], key=operator.itemgetter(*names), reverse=reverse)
+        else:
+            raise NotSupportedError(
+                'Ordering of %s across partitions is not supported.' % self._iterable_class.__name__)
+        return itertools.islice(rows, low, high)
+
+    def get_ordering_names(self, ordering):
+        """
+        names of fields in ordering, only names of local non-relational fields can be merged
+        """
+        names, selected = [], self.query.values_select
+        for name in ordering:
+            if not isinstance(name, str) or LOOKUP_SEP in name or name.lstrip('-') in ('?', ''):
+                raise NotSupportedError('Ordering by %s across partitions is not supported.' % (name, ))
+            name = name.lstrip('-')
+            try:
+                field = self.model._meta.pk if name == 'pk' else self.model._meta.get_field(name)
+            except exceptions.FieldDoesNotExist:
+                field = None
+            if field is None or field.is_relation or (selected and name not in selected):
+                raise NotSupportedError('Ordering by %s across partitions is not supported.' % name)
+            names.append(name)
+        return names
+
+    def _fetch_all(self):
+        if self._result_cache is None and self._db is None:
+            aliases = self.get_partitions()
+            if len(aliases) == 1:
+                self._db = aliases[0]
+            else:
+                self._result_cache = list(self.fan_out(aliases, list))
+        super(PartitionedQuerySet, self)._fetch_all()
+
+    def iterator(self, chunk_size=None):
+        aliases = self.get_partitions()
+        if len(aliases) == 1:
+            return super(PartitionedQuerySet, self.using(aliases[0])).iterator(chunk_size=chunk_size)
+        return self.fan_out(aliases, lambda clone: clone.iterator(chunk_size=chunk_size))
+
+    def count(self):
+        if self._result_cache is not None or self.query.is_sliced:
+            return len(self)
+        return sum(super(PartitionedQuerySet, self.using(alias)).count() for alias in self.get_partitions())
+
+    def exists(self):
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        return any(super(PartitionedQuerySet, self.using(alias)).exists() for alias in self.get_partitions())
+
+    def aggregate(self, *args, **kwargs):
+        aliases = self.get_partitions()
+        if len(aliases) == 1:
+            return super(PartitionedQuerySet, self.using(aliases[0])).aggregate(*args, **kwargs)
+
+        for arg in args:
+            kwargs[arg.default_alias] = arg
+        combines = {}
+        for name, aggregate in kwargs.items():
+            combine = AGGREGATES.get(aggregate.__class__)
+            if combine is None or aggregate.distinct or aggregate.filter is not None:
+                raise NotSupportedError('%s across partitions is not supported.' % aggregate.__class__.__name__)
+            combines[name] = combine
+
+        results = [super(PartitionedQuerySet, self.using(alias)).aggregate(**kwargs) for alias in aliases]
+        combined = {}
+        for name, combine in combines.items():
+            values = [result[name] for result in results if result[name] is not None]
+            combined[name] = combine(values) if values else None
+        return combined
+
+    def update(self, **kwargs):
+        field = self.partitioning.field
+        if field.name in kwargs or field.attname in kwargs:
+            # rows would be left in partitions of their old values
+            raise NotSupportedError(
+                'Updating %s, field of partitions, is not supported, save instances instead.' % field.name)
+        return sum(super(PartitionedQuerySet, self.using(alias)).update(**kwargs) for alias in self.get_partitions())
+
+    def delete(self):
+        deleted, rows = 0, {}
+        for alias in self.get_partitions():
+            count, per_model = super(PartitionedQuerySet, self.using(alias)).delete()
+            deleted += count
+            for label, n in per_model.items():
+                rows[label] = rows.get(label, 0) + n
+        return deleted, rows
+
+    def create(self, **kwargs):
+        if self._db is not None:
+            return super(PartitionedQuerySet, self).create(**kwargs)
+        with frozen_now():
+            obj = self.model(**kwargs)
+            obj.save(force_insert=True, using=self.partitioning.alias_for(obj))
+        return obj
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if self._db is not None:
+            return super(PartitionedQuerySet, self).bulk_update(objs, fields, *args, **kwargs)
+
+        partitioning, groups = self.partitioning, {}
+        moving = partitioning.field_name in fields or partitioning.field.attname in fields
+        for obj in objs:
+            alias = obj._state.db or partitioning.alias_for(obj)
+            if moving and obj._state.db and alias != partitioning.alias_for(obj):
+                raise NotSupportedError(
+                    'moving rows across partitions by bulk_update of %s is not supported' % partitioning.field_name)
+            groups.setdefault(alias, []).append(obj)
+        return sum(
+            super(PartitionedQuerySet, self.using(alias)).bulk_update(group, fields, *args, **kwargs)
+            for alias, group in groups.items()
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        if self._db is not None:
+            return super(PartitionedQuerySet, self).bulk_create(objs, *args, **kwargs)
+
+        partitioning, objs = self.partitioning, list(objs)
+        with stamp_batch():
+            groups = {}
+            for obj in objs:
+                groups.setdefault(partitioning.alias_for(obj), []).append(obj)
+            # objects are created in place, returned in order of input
+            for alias, group in groups.items():
+                super(PartitionedQuerySet, self.using(alias)).bulk_create(group, *args, **kwargs)
+        return objs
+
+
+class PartitionedManager(models.Manager.from_queryset(PartitionedQuerySet)):
+    """
+    Manager declaring model partitioned by field of ``field_name`` into ``scheme``
+    """
+
+    def __init__(self, field_name, scheme):
+        super(PartitionedManager, self).__init__()
+        self.field_name, self.scheme = field_name, scheme
+
+    def contribute_to_class(self, cls, name):
+        super(PartitionedManager, self).contribute_to_class(cls, name)
+        if not cls._meta.abstract:
+            _partitioned[cls._meta.label_lower] = Partitioning(cls, self.field_name, self.scheme)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Django REST framework serializers
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, serialize stored values as numbers or ISO 8601 strings.
+
+
+Requires `Django REST framework <https://www.django-rest-framework.org/>`_.
+
+:class:`UnixTimeStampSerializerField` emits stored values without building datetimes, e.g. values of
+fields with ``lazy=True`` or selected by :class:`~unixtimestampfield.functions.RawEpoch`.
+Input is parsed into stored value by the field, which is saved back as it is.
+
+.. code-block:: python
+
+    >>> class ModelASerializer(UnixTimeStampModelSerializer):
+    ...     class Meta:
+    ...         model = ModelA
+    ...         fields = ('created', )
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`UnixTimeStampSerializerField`
+* :class:`UnixTimeStampModelSerializer`
+
+Members
+-------
+
+"""
+import datetime
+
+from django.core import exceptions
+from rest_framework import serializers
+
+from .export import format_iso
+from .fields import LazyTimestamp, OrdinalField, UnixTimeStampField
+
+OUTPUT_NUMBER = 'number'
+OUTPUT_ISO = 'iso'
+
+
+class UnixTimeStampSerializerField(serializers.Field):
+    """
+    Serializer field of :class:`~unixtimestampfield.fields.UnixTimeStampField` and
+    :class:`~unixtimestampfield.fields.OrdinalField`
+
+    ``output`` is ``'number'`` (seconds, or days of ordinal) or ``'iso'`` (UTC, or date of ordinal).
+    ``model_field`` is looked up from model of parent serializer by source if not given,
+    which is required for sources of :class:`~unixtimestampfield.functions.RawEpoch`, along with
+    ``stored=True`` so that numbers of source are taken as stored values. Otherwise numbers are seconds
+    (or days of ordinal), as values of attributes.
+    """
+    default_error_messages = {
+        'invalid': 'Invalid timestamp: {error}',
+    }
+
+    def __init__(self, output=OUTPUT_NUMBER, model_field=None, stored=False, **kwargs):
+        if output not in (OUTPUT_NUMBER, OUTPUT_ISO):
+            raise ValueError('output: %s should be one of %s, %s' % (output, OUTPUT_NUMBER, OUTPUT_ISO))
+        self.output, self.model_field, self.stored = output, model_field, stored
+        super(UnixTimeStampSerializerField, self).__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super(UnixTimeStampSerializerField, self).bind(field_name, parent)
+        if self.model_field is not None:
+            return
+        model = getattr(getattr(parent, 'Meta', None), 'model', None)
+        try:
+            field = model._meta.get_field(self.source)
+        except (AttributeError, exceptions.FieldDoesNotExist):
+            return
+        if isinstance(field, UnixTimeStampField):
+            self.model_field = field
+
+    def to_stored(self, value):
+        """
+        from value of attribute to stored value
+        """
+        if value.__class__ is LazyTimestamp:
+            if value.field is self.model_field or self.model_field is None:
+                return value.raw
+            value = value.resolve()
+        field = self.model_field
+        if self.stored and isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        if field is None:
+            raise TypeError('Unable to serialize %r without model field' % value)
+        return field.to_storage(value)
+
+    def to_representation(self, value):
+        stored = self.to_stored(value)
+        field = self.model_field
+        if field is None and value.__class__ is LazyTimestamp:
+            # raw value is stored by field of lazy value
+            field = value.field
+        ordinal = isinstance(field, OrdinalField)
+        scale = getattr(field, 'storage_scale', None)
+
+        if self.output == OUTPUT_NUMBER:
+            if ordinal:
+                return int(stored)
+            if scale is None or scale == 1:
+                return stored
+            return stored / scale
+
+        if ordinal:
+            return datetime.date.fromordinal(int(stored)).isoformat()
+        if scale is None:
+            return format_iso(round(stored * 1000000))
+        return format_iso(stored * (1000000 // scale))
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool) or not isinstance(data, (int, float, str)):
+            self.fail('invalid', error='%r is neither number nor string' % (data, ))
+        field = self.model_field
+        if field is None:
+            raise exceptions.ImproperlyConfigured(
+                '%s of %s requires model_field' % (self.__class__.__name__, self.field_name))
+        try:
+            stored = field.to_storage(data)
+            # only integer storages are range checked by to_storage
+            field.from_stored(stored)
+            return LazyTimestamp(field, stored)
+        except exceptions.ValidationError as e:
+            self.fail('invalid', error=' '.join(e.messages))
+        except (ValueError, OverflowError) as e:
+            self.fail('invalid', error=e)
+
+
+class UnixTimeStampModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer mapping :class:`~unixtimestampfield.fields.UnixTimeStampField` and
+    :class:`~unixtimestampfield.fields.OrdinalField` to :class:`UnixTimeStampSerializerField`
+    """
+    serializer_field_mapping = dict(serializers.ModelSerializer.serializer_field_mapping)
+    serializer_field_mapping.update({
+        UnixTimeStampField: UnixTimeStampSerializerField,
+        OrdinalField: UnixTimeStampSerializerField,
+    })
@@ -5,6 +5,11 @@ Sub middleware
 
 release |release|, version |version|
 
+.. versionadded:: 1.1.0
+
+    Dispatch through per-field converters and cache USF_FORMAT until setting changed
+    Override USF_FORMAT in current context by :class:`usf_format`
+
 .. versionadded:: 0.3.8
 
     Bugs fixed: Apply submiddleware to auto_now field and check format in submiddleware
@@ -18,11 +23,30 @@ release |release|, version |version|
     Initial
 
 
+USF_FORMAT of settings is for the whole process, :class:`usf_format` overrides it in current context
+(thread or asyncio task) only, as context manager or decorator of views:
+
+.. code-block:: python
+
+    >>> with usf_format(USF_TIMESTAMP):
+    ...     m = ModelB.objects.get(pk=1)
+    >>> m.dt_field
+    0.0
+
+Values converted inside keep their format outside, lazy ones are converted as they are resolved.
+
+
 Contents
 --------
 
+Classes:
+
+* :class:`usf_format`
+
 Functions:
 
+* :func:`get_format`
+* :func:`get_current_format`
 * :func:`field_value_middleware`
 
 Variables:
@@ -36,14 +60,25 @@ Members
 -------
 
 """
+import contextvars
+import functools
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:  # asgiref < 3.6
+    from asyncio import iscoroutinefunction
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 USF_DATETIME, USF_TIMESTAMP, USF_DEFAULT = 'usf_datetime', 'usf_timestamp', 'usf_default'
+USF_FORMATS = (USF_DATETIME, USF_TIMESTAMP, USF_DEFAULT)
 
 
 def get_format():
     usf_format = getattr(settings, 'USF_FORMAT', USF_DEFAULT)
-    if usf_format not in [USF_DATETIME, USF_TIMESTAMP, USF_DEFAULT]:
+    if usf_format not in USF_FORMATS:
         usf_format = USF_DEFAULT
     return usf_format
 
@@ -51,18 +86,63 @@ def get_format():
 USF_FORMAT = get_format()
 
 
-def field_value_middleware(field, value, usf_format=None):
+@receiver(setting_changed)
+def reset_format(setting, **kwargs):
+    """
+    USF_FORMAT is resolved once, refresh it while settings are overridden
+    """
+    global USF_FORMAT
+    if setting == 'USF_FORMAT':
+        USF_FORMAT = get_format()
 
-    if usf_format is None:
-        usf_format = get_format()
 
-    if usf_format == USF_DEFAULT:
-        return field.to_timestamp(value) if field.use_numeric else field.to_datetime(value)
+_format = contextvars.ContextVar('unixtimestampfield_format', default=None)
 
-    if usf_format == USF_DATETIME:
-        return field.to_datetime(value)
 
-    if usf_format == USF_TIMESTAMP:
-        return field.to_timestamp(value)
+class usf_format(object):
+    """
+    override USF_FORMAT within, in current context only, usable as decorator of sync and async functions
+    """
+
+    def __init__(self, value):
+        if value not in USF_FORMATS:
+            raise ValueError('USF_FORMAT: %s should be one of %s' % (value, ', '.join(USF_FORMATS)))
+        self.value, self.tokens = value, []
+
+    def __enter__(self):
+        self.tokens.append(_format.set(self.value))
+        return self.value
+
+    def __exit__(self, *exc_info):
+        _format.reset(self.tokens.pop())
+
+    def __call__(self, func):
+        value = self.value
+
+        # each call sets its own token, calls may run concurrently
+        if iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def inner(*args, **kwargs):
+                with usf_format(value):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                with usf_format(value):
+                    return func(*args, **kwargs)
+        return inner
+
+
+def get_current_format():
+    """
+    USF_FORMAT overridden in current context, or of settings
+    """
+    return _format.get() or USF_FORMAT
+
+
+def field_value_middleware(field, value, usf_format=None, stored=False):
+
+    if usf_format is None:
+        usf_format = _format.get() or USF_FORMAT
 
-    raise ValueError('USF_FORMAT: %s should not in optional values')
+    return field.get_converter(usf_format, stored)(value)
@@ -5,6 +5,11 @@ UnixTimeStampField template tags
 release |release|, version |version|
 
 
+.. versionadded:: 1.1.0
+
+    Add usf_format filter, format timestamps with date parts cached per day.
+    Accept int and Decimal, only conversion errors are rendered as empty string.
+
 .. versionadded:: 0.3.4
 
     Add extra function param
@@ -21,35 +26,57 @@ Functions:
 
 * :func:`to_datetime`
 * :func:`to_timestamp`
+* :func:`usf_format`
 
 Members
 -------
 
 """
-import time
+import collections
 import datetime
+import decimal
+import threading
+import time
 
-from django.template import Library
-from django.utils import timezone
 from django.conf import settings
+from django.core import exceptions
+from django.template import Library
+from django.utils import formats, timezone, translation
+from django.utils.dateformat import DateFormat, re_escaped, re_formatchars
+
+from ..fields import EPOCH, LazyTimestamp, TimestampPatchMixin
+from ..transitions import get_table
 
 register = Library()
 
+CONVERSION_ERRORS = (ValueError, TypeError, OverflowError, exceptions.ValidationError)
+NUMBERS = (int, float, decimal.Decimal)
+
+_converter = TimestampPatchMixin()
+
 
 @register.filter('to_datetime')
 def to_datetime(field):
+    """
+    datetime of timestamp in default timezone, or aware in UTC without USE_TZ
+    """
+    if field.__class__ is LazyTimestamp:
+        field = field.resolve()
     try:
-        if type(field) in (float, str):
-            field = timezone.datetime.fromtimestamp(field, datetime.timezone.utc)
+        if isinstance(field, NUMBERS + (str, )) and not isinstance(field, bool):
             if settings.USE_TZ:
-                field = timezone.localtime(field, timezone.get_default_timezone())
+                field = _converter.to_datetime(field)
+            else:
+                field = _converter.to_utc_datetime(field)
         return field
-    except:
+    except CONVERSION_ERRORS:
         return ""
 
 
 @register.filter('to_timestamp')
 def to_timestamp(field):
+    if field.__class__ is LazyTimestamp:
+        field = field.resolve()
     try:
         if type(field) == timezone.datetime:
             if settings.USE_TZ and timezone.is_aware(field):
@@ -60,5 +87,127 @@ def to_timestamp(field):
             return time.mktime(field.timetuple()) + field.microsecond * 0.00001
 
         return field
-    except:
+    except CONVERSION_ERRORS:
         return ""
+
+
+# format characters rendered per value, others depend on date only,
+# timezone ones are included since they're blank for ambiguous times
+TIME_CHARS = frozenset('aAfgGhHiPsucrUeIOTZ')
+TIME_FORMATS = {
+    'G': lambda v: str(v.hour),
+    'H': lambda v: '%02d' % v.hour,
+    'g': lambda v: str(v.hour % 12 or 12),
+    'h': lambda v: '%02d' % (v.hour % 12 or 12),
+    'i': lambda v: '%02d' % v.minute,
+    's': lambda v: '%02d' % v.second,
+    'u': lambda v: '%06d' % v.microsecond,
+}
+
+DAY_CACHE_SIZE = 1024
+
+_day_parts = collections.OrderedDict()
+_day_parts_lock = threading.Lock()
+
+
+def get_day_parts(value, format_string):
+    """
+    return parts of format_string for day of value, date parts are rendered and time characters are kept
+
+    cached per (day, language, format), least recently used ones are dropped
+    """
+    key = (value.date(), translation.get_language(), format_string)
+    with _day_parts_lock:
+        try:
+            _day_parts.move_to_end(key)
+            return _day_parts[key]
+        except KeyError:
+            pass
+
+    parts, literal, date_format = [], [], None
+    for i, piece in enumerate(re_formatchars.split(format_string)):
+        if not i % 2:
+            literal.append(re_escaped.sub(r'\1', piece))
+        elif piece in TIME_CHARS:
+            parts.append(''.join(literal))
+            parts.append(piece)
+            literal = []
+        else:
+            date_format = date_format or DateFormat(value)
+            literal.append(str(date_format.format(piece)))
+    parts.append(''.join(literal))
+    parts = tuple(parts)
+
+    with _day_parts_lock:
+        _day_parts[key] = parts
+        if len(_day_parts) > DAY_CACHE_SIZE:
+            _day_parts.popitem(last=False)
+    return parts
+
+
+def to_local_datetime(value):
+    """
+    convert value into datetime in current timezone (naive while USE_TZ is False) for formatting
+    """
+    if value.__class__ is LazyTimestamp:
+        value = value.resolve()
+
+    if isinstance(value, datetime.datetime):
+        if settings.USE_TZ and timezone.is_aware(value):
+            return timezone.localtime(value)
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time())
+
+    if isinstance(value, bool):
+        raise TypeError('Unable to format %r' % value)
+    if isinstance(value, NUMBERS):
+        value = EPOCH + datetime.timedelta(seconds=float(value))
+    elif isinstance(value, str):
+        value = _converter.to_naive_datetime(value)
+        if timezone.is_aware(value):
+            value = timezone.make_naive(value, datetime.timezone.utc)
+    else:
+        raise TypeError('Unable to format %r' % value)
+
+    if settings.USE_TZ:
+        return get_table(timezone.get_current_timezone()).fromutc(value)
+    return value
+
+
+@register.filter('usf_format', is_safe=False)
+def usf_format(value, format_string=None):
+    """
+    format timestamp (number, string, datetime, lazy value) in current timezone like date filter,
+    e.g. {{ value|usf_format:"Y-m-d H:i:s" }}, DATETIME_FORMAT by default
+
+    Date parts are rendered once per day and reused across values.
+    """
+    if value in (None, ''):
+        return ''
+    try:
+        value = to_local_datetime(value)
+    except CONVERSION_ERRORS:
+        return ''
+
+    if format_string is None:
+        format_string = 'DATETIME_FORMAT'
+    if format_string in formats.FORMAT_SETTINGS:
+        format_string = formats.get_format(format_string)
+
+    parts = get_day_parts(value, format_string)
+    if len(parts) == 1:
+        return parts[0]
+
+    rendered, time_format = [], None
+    for i, part in enumerate(parts):
+        if not i % 2:
+            rendered.append(part)
+            continue
+        render = TIME_FORMATS.get(part)
+        if render is not None:
+            rendered.append(render(value))
+        else:
+            time_format = time_format or DateFormat(value)
+            rendered.append(str(time_format.format(part)))
+    return ''.join(rendered)
@@ -1,16 +1,34 @@
 import logging
 import datetime
+import decimal
+import unittest
 from zoneinfo import ZoneInfo
 
-from django.test import TestCase, override_settings
+from asgiref.sync import sync_to_async
+from django.test import TestCase, TransactionTestCase, override_settings
 
-from django.db import models
-from django.utils import timezone
+from django.db import NotSupportedError, models
+from django.db.models import F
+from django.utils import timezone, translation
 from django import forms
 from django.core import exceptions
 from django.template import Template, Context
 
-from .fields import UnixTimeStampField, OrdinalField, TimestampPatchMixin, OrdinalPatchMixin
+from .fields import EPOCH_UTC, UnixTimeStampField, OrdinalField, TimestampPatchMixin, OrdinalPatchMixin
+from .functions import Ago, EpochF, EpochNow
+from .managers import UnixTimeStampManager
+from .rollups import Rollup, RollupModel, register as register_rollup
+from .routers import PartitionedManager, PartitionScheme
+
+try:
+    import rest_framework
+except ImportError:
+    rest_framework = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 unix_0 = timezone.datetime(1970, 1, 1)
 unix_0_utc = timezone.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -803,3 +821,1887 @@ class SubmiddlewareTest(TestCase):
 
         self.assertEqual(t.datetime, expected)
         self.assertEqual(t.numeric, 0)
+
+
+class ConverterTest(TestCase):
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_cached(self):
+        f = UnixTimeStampField()
+
+        self.assertIs(f.get_converter('usf_datetime'), f.get_converter('usf_datetime'))
+        self.assertIs(f.get_converter('usf_timestamp'), f.get_converter('usf_timestamp'))
+        self.assertRaises(ValueError, f.get_converter, 'invalid')
+
+    def test_rebuilt_while_settings_changed(self):
+        f = UnixTimeStampField()
+
+        with self.settings(USE_TZ=True, TIME_ZONE='UTC'):
+            self.assertEqual(f.to_python(0), unix_0_utc)
+            self.assertEqual(f.to_python(0).utcoffset(), datetime.timedelta(0))
+        with self.settings(USE_TZ=True, TIME_ZONE='Asia/Taipei'):
+            self.assertEqual(f.to_python(0), unix_0_utc)
+            self.assertEqual(f.to_python(0).utcoffset(), datetime.timedelta(hours=8))
+        with self.settings(USE_TZ=False):
+            self.assertEqual(f.to_python(0), unix_0)
+        with self.settings(USF_FORMAT='usf_timestamp'):
+            self.assertEqual(f.to_python(3), 3.0)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_copy_and_pickle(self):
+        import copy
+        import pickle
+
+        f = UnixTimeStampField(use_numeric=True)
+        f.to_python(0)
+
+        self.assertNotIn('_converters', copy.copy(f).__dict__)
+        self.assertEqual(pickle.loads(pickle.dumps(f)).to_python('1.5'), 1.5)
+
+
+class ParserTest(TestCase):
+
+    expected = datetime.datetime(2026, 1, 1, 12, 34, 56, 123456)
+
+    def test_iso_format(self):
+        ts = TimestampPatchMixin()
+
+        self.assertEqual(self.expected, ts.datetime_str_to_datetime('2026-01-01T12:34:56.123456Z'))
+        self.assertEqual(self.expected, ts.datetime_str_to_datetime('2026-01-01 12:34:56.123456'))
+        self.assertEqual(self.expected, ts.datetime_str_to_datetime(' 2026-01-01T12:34:56.123456+00:00 '))
+        self.assertEqual(self.expected, ts.datetime_str_to_datetime('2026-01-01T20:34:56.123456+08:00'))
+        self.assertEqual(self.expected.replace(microsecond=0), ts.datetime_str_to_datetime('2026-01-01T12:34:56Z'))
+        self.assertEqual(datetime.datetime(2026, 1, 1), ts.datetime_str_to_datetime('2026-01-01'))
+        self.assertRaises(exceptions.ValidationError, ts.datetime_str_to_datetime, 'hello')
+        self.assertRaises(exceptions.ValidationError, ts.datetime_str_to_datetime, '')
+
+    def test_input_formats(self):
+        ts = TimestampPatchMixin()
+
+        self.assertRaises(exceptions.ValidationError, ts.datetime_str_to_datetime, '01/01/2026 12:34')
+        with self.settings(USF_INPUT_FORMATS=['%m/%d/%Y %H:%M', '%d.%m.%Y']):
+            self.assertEqual(datetime.datetime(2026, 1, 1, 12, 34),
+                             ts.datetime_str_to_datetime('01/01/2026 12:34'))
+            self.assertEqual(datetime.datetime(2026, 1, 31), ts.datetime_str_to_datetime('31.01.2026'))
+
+    def test_looks_numeric(self):
+        from .fields import looks_numeric
+
+        for value in ('0', '-1', '+1.5', '.5', '1767270896.123456', '1e5', '1E-5', '-1.5e-05'):
+            self.assertTrue(looks_numeric(value), value)
+        for value in ('2026-01-01', '12:34', '2026-01-01T12:34:56Z', '1e5-1'):
+            self.assertFalse(looks_numeric(value), value)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_field(self):
+        f = UnixTimeStampField()
+        f_us = UnixTimeStampField(storage='int64_us')
+        value = '2026-01-01T20:34:56.123456+08:00'
+
+        self.assertEqual(self.expected.replace(tzinfo=datetime.timezone.utc), f.to_python(value))
+        self.assertEqual(1767270896.123456, f.get_prep_value(value))
+        self.assertEqual(1767270896123456, f_us.get_prep_value(value))
+        self.assertEqual(-0.00001, f.get_prep_value('-1e-05'))
+        self.assertEqual(-10, f_us.get_prep_value('-1e-05'))
+
+
+class TransitionTableTest(TestCase):
+
+    def assertSameLocal(self, table, value):
+        expected = value.replace(tzinfo=datetime.timezone.utc).astimezone(table.tz)
+        result = table.fromutc(value)
+        self.assertEqual(result, expected)
+        self.assertEqual(result.replace(tzinfo=None), expected.replace(tzinfo=None))
+        self.assertEqual(result.fold, expected.fold)
+
+    def test_around_transitions(self):
+        from .transitions import get_table
+
+        for name in ('America/Chicago', 'Australia/Lord_Howe', 'Europe/London', 'Asia/Taipei'):
+            table = get_table(ZoneInfo(name))
+            self.assertIs(table, get_table(ZoneInfo(name)))
+            for year in (1947, 1979, 2000, 2026):
+                starts, _, _ = table.build(year)
+                for start in starts[1:]:
+                    for minutes in range(-150, 150, 15):
+                        self.assertSameLocal(table, start + datetime.timedelta(minutes=minutes))
+                    self.assertSameLocal(table, start - datetime.timedelta(microseconds=1))
+
+    def test_fold(self):
+        from .transitions import get_table
+
+        table = get_table(ZoneInfo('America/Chicago'))
+        # 2026/11/01 01:30 CDT and CST
+        first = table.fromutc(datetime.datetime(2026, 11, 1, 6, 30))
+        second = table.fromutc(datetime.datetime(2026, 11, 1, 7, 30))
+        self.assertEqual(first.replace(tzinfo=None), second.replace(tzinfo=None))
+        self.assertEqual((first.fold, second.fold), (0, 1))
+
+    def test_out_of_range(self):
+        from .transitions import get_table
+
+        self.assertSameLocal(get_table(ZoneInfo('Asia/Taipei')), datetime.datetime.min)
+        self.assertSameLocal(get_table(ZoneInfo('America/Chicago')), datetime.datetime.max)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='America/Chicago')
+    def test_converter(self):
+        f = UnixTimeStampField()
+
+        self.assertEqual(f.to_python(1793518200.0).fold, 1)
+        self.assertEqual(f.to_python(1793514600.0).utcoffset(), datetime.timedelta(hours=-5))
+        self.assertEqual(f.to_python(1793518200.0).utcoffset(), datetime.timedelta(hours=-6))
+        self.assertEqual(f.to_python(unix_0_utc).utcoffset(), datetime.timedelta(hours=-6))
+        self.assertEqual(f.to_python('2026-11-01T07:30:00Z').fold, 1)
+
+
+class ForStorageTestModel(models.Model):
+
+    float_ts = UnixTimeStampField(default=0.0)
+    int32_s = UnixTimeStampField(storage='int32_s', default=0)
+    int64_ms = UnixTimeStampField(storage='int64_ms', default=0)
+    int64_us = UnixTimeStampField(storage='int64_us', default=0)
+    numeric_us = UnixTimeStampField(storage='int64_us', use_numeric=True, default=0)
+
+
+class StorageTest(TestCase):
+
+    def test_internal_type(self):
+        self.assertEqual(UnixTimeStampField().get_internal_type(), 'FloatField')
+        self.assertEqual(UnixTimeStampField(storage='int32_s').get_internal_type(), 'IntegerField')
+        self.assertEqual(UnixTimeStampField(storage='int64_ms').get_internal_type(), 'BigIntegerField')
+        self.assertEqual(UnixTimeStampField(storage='int64_us').get_internal_type(), 'BigIntegerField')
+        self.assertRaises(ValueError, UnixTimeStampField, storage='int8')
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = UnixTimeStampField().deconstruct()
+        self.assertNotIn('storage', kwargs)
+        _, _, _, kwargs = UnixTimeStampField(storage='int64_ms').deconstruct()
+        self.assertEqual(kwargs['storage'], 'int64_ms')
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_prep_value(self):
+        f = UnixTimeStampField(storage='int64_us')
+        last = timezone.datetime(9999, 12, 31, 15, 59, 59, 999000, tzinfo=datetime.timezone.utc)  # MAX_TS
+
+        self.assertEqual(f.get_prep_value(last), 253402271999999000)
+        self.assertEqual(f.get_prep_value('253402271999.999'), 253402271999999000)
+        self.assertEqual(f.get_prep_value(3.1111116), 3111112)
+        self.assertEqual(f.get_prep_value(3), 3000000)
+        self.assertEqual(UnixTimeStampField(storage='int64_ms').get_prep_value(3.1116), 3112)
+        self.assertEqual(UnixTimeStampField(storage='int32_s').get_prep_value(unix_0_utc), 0)
+        self.assertRaises(exceptions.ValidationError,
+                          UnixTimeStampField(storage='int32_s').get_prep_value, 1 << 31)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_round_trip(self):
+        last = timezone.datetime(9999, 12, 31, 15, 59, 59, 999000, tzinfo=datetime.timezone.utc)  # MAX_TS
+        value = timezone.datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc)
+        t = ForStorageTestModel.objects.create(
+            float_ts=value, int32_s=value, int64_ms=value, int64_us=last, numeric_us=value)
+        t.refresh_from_db()
+
+        self.assertEqual(t.float_ts, value)
+        self.assertEqual(t.int32_s, value.replace(microsecond=0))
+        self.assertEqual(t.int64_ms, value.replace(microsecond=123000))
+        self.assertEqual(t.int64_us, last)
+        self.assertEqual(t.numeric_us, 1767323045.123456)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_lookup(self):
+        ForStorageTestModel.objects.create(int64_ms=1.5)
+        ForStorageTestModel.objects.create(int64_ms=2.5)
+
+        qs = ForStorageTestModel.objects.filter(
+            int64_ms__gt=timezone.datetime(1970, 1, 1, 0, 0, 2, tzinfo=datetime.timezone.utc))
+        self.assertEqual(qs.count(), 1)
+        self.assertEqual(ForStorageTestModel.objects.filter(int64_ms__lte=1.5).count(), 1)
+
+
+class ForTransformTestModel(models.Model):
+
+    ts = UnixTimeStampField(default=0.0)
+    ts_ms = UnixTimeStampField(storage='int64_ms', default=0)
+    od = OrdinalField(default=1)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class TransformTest(TestCase):
+
+    def setUp(self):
+        # 2026/03/01 18:30:15 UTC, 2026/03/02 02:30:15 in Taipei, Monday
+        value = timezone.datetime(2026, 3, 1, 18, 30, 15, tzinfo=datetime.timezone.utc)
+        ForTransformTestModel.objects.create(ts=value, ts_ms=value, od=value)
+        ForTransformTestModel.objects.create()
+
+    def test_extract_utc(self):
+        qs = ForTransformTestModel.objects.all()
+
+        self.assertEqual(qs.filter(ts__year=2026).count(), 1)
+        self.assertEqual(qs.filter(ts_ms__year=2026).count(), 1)
+        self.assertEqual(qs.filter(ts__year__lt=2000).count(), 1)
+        self.assertEqual(qs.filter(ts__month=3, ts__day=1, ts__hour=18).count(), 1)
+        self.assertEqual(qs.filter(ts__week_day=1).count(), 1)  # Sunday
+        self.assertEqual(
+            list(qs.order_by('ts').values_list('ts__hour', 'ts_ms__minute', 'ts__second')),
+            [(0, 0, 0), (18, 30, 15)]
+        )
+
+    @override_settings(USE_TZ=True, TIME_ZONE='Asia/Taipei')
+    def test_extract_with_tz(self):
+        qs = ForTransformTestModel.objects.all()
+
+        self.assertEqual(qs.filter(ts__day=2, ts__hour=2).count(), 1)
+        self.assertEqual(qs.filter(ts_ms__iso_week_day=1).count(), 1)  # Monday
+        self.assertEqual(list(qs.order_by('ts').values_list('ts__hour', flat=True)), [8, 2])
+
+    @override_settings(USE_TZ=False)
+    def test_extract_without_tz(self):
+        qs = ForTransformTestModel.objects.all()
+
+        self.assertEqual(qs.filter(ts__day=1, ts__hour=18).count(), 1)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='Asia/Taipei')
+    def test_extract_ordinal(self):
+        qs = ForTransformTestModel.objects.all()
+
+        self.assertEqual(qs.filter(od__year=2026, od__month=3, od__day=1).count(), 1)
+        self.assertEqual(list(qs.order_by('od').values_list('od__year', 'od__quarter')), [(1, 1), (2026, 1)])
+        self.assertRaises(ValueError, qs.values_list, 'od__hour')
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='Asia/Taipei')
+class RangeLookupTest(TestCase):
+
+    def setUp(self):
+        # 2025/12/31 16:30:00 UTC, 2026/01/01 00:30:00 in Taipei, Thursday
+        value = timezone.datetime(2025, 12, 31, 16, 30, tzinfo=datetime.timezone.utc)
+        ForTransformTestModel.objects.create(ts=value, ts_ms=value, od=value)
+        ForTransformTestModel.objects.create()
+
+    def assertRange(self, count, **lookups):
+        qs = ForTransformTestModel.objects.filter(**lookups)
+        self.assertNotIn('django_', str(qs.query))
+        self.assertEqual(qs.count(), count)
+
+    def test_year(self):
+        self.assertRange(1, ts__year=2026)
+        self.assertRange(1, ts_ms__year='2026')
+        self.assertRange(0, ts__year__gt=2026)
+        self.assertRange(1, ts__year__gte=2026)
+        self.assertRange(1, ts__year__lt=2026)
+        self.assertRange(2, ts__year__lte=2026)
+        self.assertRange(1, ts__iso_year=2026)
+        self.assertRange(1, ts__iso_year__lt=2026)
+        self.assertRange(1, od__year=2025)
+
+    def test_year_with_timezone(self):
+        with timezone.override(datetime.timezone.utc):
+            self.assertRange(1, ts__year=2025)
+            self.assertRange(0, ts__year=2026)
+        self.assertRange(1, ts__year=2026)
+
+    def test_date(self):
+        self.assertRange(1, ts__date=datetime.date(2026, 1, 1))
+        self.assertRange(1, ts_ms__date='2026-01-01')
+        self.assertRange(0, ts__date__gt=datetime.date(2026, 1, 1))
+        self.assertRange(1, ts__date__lt=datetime.date(2026, 1, 1))
+        self.assertRange(1, od__date=datetime.date(2025, 12, 31))
+        self.assertEqual(
+            list(ForTransformTestModel.objects.order_by('ts').values_list('ts__date', 'od__date')),
+            [(datetime.date(1970, 1, 1), datetime.date(1, 1, 1)),
+             (datetime.date(2026, 1, 1), datetime.date(2025, 12, 31))]
+        )
+
+    def test_month_and_week(self):
+        self.assertRange(1, ts__month=datetime.date(2026, 1, 20))
+        self.assertRange(0, ts__month=datetime.date(2025, 12, 20))
+        self.assertRange(1, ts__month__lt=datetime.date(2026, 1, 20))
+        self.assertRange(1, ts__week=datetime.date(2025, 12, 29))
+        self.assertRange(0, ts__week=datetime.date(2026, 1, 5))
+        self.assertRange(1, od__month=datetime.date(2025, 12, 1))
+
+    def test_fallback(self):
+        qs = ForTransformTestModel.objects.all()
+
+        self.assertEqual(qs.filter(ts__month=1).count(), 2)
+        self.assertEqual(qs.filter(ts__year=models.F('ts_ms__year')).count(), 2)
+
+
+class ForBucketTestModel(models.Model):
+
+    ts = UnixTimeStampField(default=0.0)
+    ts_ms = UnixTimeStampField(storage='int64_ms', default=0)
+    numeric = UnixTimeStampField(use_numeric=True, default=0.0)
+    od = OrdinalField(default=1)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class TruncAndBucketTest(TestCase):
+
+    def setUp(self):
+        for minute in (10, 20, 70, 75, 130):
+            value = timezone.datetime(2026, 1, 1, 15, 0, tzinfo=datetime.timezone.utc) + \
+                datetime.timedelta(minutes=minute, seconds=0.5)
+            ForBucketTestModel.objects.create(ts=value, ts_ms=value, numeric=value, od=value)
+
+    def test_trunc(self):
+        from .functions import TruncEpoch
+
+        rows = ForBucketTestModel.objects.values(bucket=TruncEpoch('ts', 'hour')).annotate(
+            n=models.Count('id')).order_by('bucket')
+        hour = timezone.datetime(2026, 1, 1, 15, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            [(r['bucket'], r['n']) for r in rows],
+            [(hour, 2), (hour + datetime.timedelta(hours=1), 2), (hour + datetime.timedelta(hours=2), 1)]
+        )
+        numeric = ForBucketTestModel.objects.annotate(
+            bucket=TruncEpoch('numeric', 'day')).values_list('bucket', flat=True)
+        self.assertEqual(set(numeric), {1767225600.0})
+        od = ForBucketTestModel.objects.annotate(
+            bucket=TruncEpoch('od', 'month')).values_list('bucket', flat=True)
+        self.assertEqual(set(od), {timezone.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)})
+
+    @override_settings(TIME_ZONE='Asia/Taipei')
+    def test_trunc_with_tz(self):
+        from .functions import TruncEpoch
+
+        days = ForBucketTestModel.objects.annotate(
+            bucket=TruncEpoch('ts_ms', 'day')).values_list('bucket', flat=True)
+        self.assertEqual(set(days), {timezone.datetime(2025, 12, 31, 16, tzinfo=datetime.timezone.utc),
+                                     timezone.datetime(2026, 1, 1, 16, tzinfo=datetime.timezone.utc)})
+        days = ForBucketTestModel.objects.annotate(
+            bucket=TruncEpoch('ts_ms', 'day', tzinfo=datetime.timezone.utc)).values_list('bucket', flat=True)
+        self.assertEqual(set(days), {timezone.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)})
+
+    def test_bucket(self):
+        from .functions import TimeBucket
+
+        for field in ('ts', 'ts_ms'):
+            rows = ForBucketTestModel.objects.values(bucket=TimeBucket(field, 1800)).annotate(
+                n=models.Count('id')).order_by('bucket')
+            start = timezone.datetime(2026, 1, 1, 15, tzinfo=datetime.timezone.utc)
+            self.assertEqual(
+                [(r['bucket'], r['n']) for r in rows],
+                [(start, 2), (start + datetime.timedelta(minutes=60), 2), (start + datetime.timedelta(minutes=120), 1)]
+            )
+
+        numeric = ForBucketTestModel.objects.annotate(
+            bucket=TimeBucket('numeric', datetime.timedelta(hours=1), origin=1800)).values_list('bucket', flat=True)
+        self.assertEqual(sorted(set(numeric)), [1767277800.0, 1767281400.0, 1767285000.0])
+        for field in ('numeric', 'ts_ms'):
+            decimals = ForBucketTestModel.objects.annotate(
+                bucket=TimeBucket(field, decimal.Decimal('3600'), origin=decimal.Decimal('1800')))
+            self.assertEqual(
+                sorted(set(ForBucketTestModel._meta.get_field(field).to_timestamp(bucket)
+                           for bucket in decimals.values_list('bucket', flat=True))),
+                [1767277800.0, 1767281400.0, 1767285000.0])
+        weeks = ForBucketTestModel.objects.annotate(
+            bucket=TimeBucket('od', datetime.timedelta(days=7))).values_list('bucket', flat=True)
+        self.assertEqual(set(weeks), {timezone.datetime(2025, 12, 29, tzinfo=datetime.timezone.utc)})
+        self.assertRaises(ValueError, TimeBucket, 'ts', 0)
+
+    def test_bucket_compare(self):
+        from .functions import TimeBucket
+
+        qs = ForBucketTestModel.objects.filter(ts_ms=TimeBucket('ts_ms', 0.001))
+        self.assertEqual(qs.count(), 5)
+        qs = ForBucketTestModel.objects.filter(ts__gt=TimeBucket('ts', 3600) + 3600)
+        self.assertEqual(qs.count(), 0)
+
+
+class ForLazyTestModel(models.Model):
+
+    ts = UnixTimeStampField(lazy=True, default=0.0)
+    ts_ms = UnixTimeStampField(lazy=True, storage='int64_ms', default=0)
+    numeric = UnixTimeStampField(lazy=True, use_numeric=True, default=0.0)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class LazyTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        ForLazyTestModel.objects.create(ts=self.value, ts_ms=self.value, numeric=self.value)
+        ForLazyTestModel.objects.create(ts=0, ts_ms=0, numeric=0)
+
+    def test_loaded_lazy(self):
+        from .fields import LazyTimestamp
+
+        t = ForLazyTestModel.objects.order_by('id')[0]
+
+        self.assertIsInstance(t.ts, LazyTimestamp)
+        self.assertEqual(t.ts.raw, 1767270896.123)
+        self.assertEqual(t.ts_ms.raw, 1767270896123)
+        self.assertEqual(t.ts, self.value)
+        self.assertEqual(self.value, t.ts_ms)
+        self.assertEqual(t.ts.year, 2026)
+        self.assertEqual(t.ts - datetime.timedelta(days=1), self.value - datetime.timedelta(days=1))
+        self.assertEqual(t.numeric, 1767270896.123)
+        self.assertEqual(t.ts_ms.resolve(), self.value)
+        self.assertIs(t.ts_ms.resolve(), t.ts_ms.resolve())
+        self.assertEqual(str(t.ts), str(self.value))
+        self.assertEqual(hash(t.ts), hash(self.value))
+        self.assertRaises(AttributeError, lambda: t.ts.missing)
+
+    def test_compare_without_conversion(self):
+        rows = sorted(ForLazyTestModel.objects.all(), key=lambda t: t.ts)
+
+        self.assertEqual([t.ts.raw for t in rows], [0.0, 1767270896.123])
+        self.assertLess(rows[0].ts, rows[1].ts)
+        self.assertTrue(all(t.ts._value is t.ts.__class__ for t in rows))
+        self.assertLess(rows[0].ts, self.value)
+        self.assertGreater(rows[1].ts, unix_0_utc)
+
+    def test_saved_back(self):
+        t = ForLazyTestModel.objects.order_by('id')[0]
+        t.save()
+
+        self.assertEqual(t.ts._value, t.ts.__class__)
+        self.assertEqual(ForLazyTestModel._meta.get_field('ts_ms').get_prep_value(t.ts_ms), 1767270896123)
+        self.assertEqual(ForLazyTestModel._meta.get_field('ts').get_prep_value(t.ts_ms), 1767270896.123)
+        self.assertEqual(ForLazyTestModel.objects.filter(ts__gte=t.ts).count(), 1)
+        self.assertEqual(ForLazyTestModel.objects.get(pk=t.pk).ts, self.value)
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = UnixTimeStampField(lazy=True).deconstruct()
+        self.assertTrue(kwargs['lazy'])
+        _, _, _, kwargs = UnixTimeStampField().deconstruct()
+        self.assertNotIn('lazy', kwargs)
+
+
+class ForBatchTestModel(models.Model):
+
+    created = UnixTimeStampField(auto_now_add=True)
+    modified = UnixTimeStampField(auto_now=True, storage='int64_us')
+    numeric = UnixTimeStampField(auto_now=True, use_numeric=True)
+    od = OrdinalField(auto_now_add=True)
+    name = models.CharField(max_length=8, default='')
+
+    objects = UnixTimeStampManager()
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='Asia/Taipei')
+class BatchStampTest(TestCase):
+
+    def test_bulk_create(self):
+        objs = ForBatchTestModel.objects.bulk_create([ForBatchTestModel() for _ in range(50)])
+
+        self.assertEqual(len({o.created for o in objs}), 1)
+        self.assertEqual({o.created for o in objs}, {o.modified for o in objs})
+        self.assertEqual(objs[0].numeric, objs[0].created.timestamp())
+        self.assertEqual(objs[0].created.utcoffset(), datetime.timedelta(hours=8))
+
+        rows = list(ForBatchTestModel.objects.all())
+        self.assertEqual(len({(o.created, o.modified, o.numeric, o.od) for o in rows}), 1)
+        self.assertEqual(rows[0].created, objs[0].created)
+        self.assertEqual(rows[0].modified, objs[0].modified)
+        self.assertEqual(rows[0].od.date(), objs[0].created.astimezone(datetime.timezone.utc).date())
+
+    def test_bulk_create_batches_share_clock(self):
+        objs = ForBatchTestModel.objects.bulk_create([ForBatchTestModel() for _ in range(10)], batch_size=3)
+        self.assertEqual(len({o.created for o in objs}), 1)
+
+    def test_bulk_update(self):
+        objs = ForBatchTestModel.objects.bulk_create([ForBatchTestModel() for _ in range(5)])
+        created = objs[0].created
+        for i, obj in enumerate(objs):
+            obj.name = str(i)
+
+        ForBatchTestModel.objects.bulk_update(objs, ['name', 'modified'])
+
+        self.assertGreater(objs[0].modified, created)
+        self.assertEqual(len({o.modified for o in objs}), 1)
+        self.assertIsInstance(objs[0].modified, datetime.datetime)
+        rows = ForBatchTestModel.objects.order_by('id')
+        self.assertEqual([(o.name, o.modified) for o in rows], [(o.name, o.modified) for o in objs])
+        self.assertEqual({o.numeric for o in rows}, {objs[0].numeric})
+
+    def test_outside_batch(self):
+        from .fields import stamp_batch
+
+        field = ForBatchTestModel._meta.get_field('created')
+        self.assertIsNone(field.get_batch_stamp())
+        with stamp_batch():
+            value, stamp = field.get_batch_stamp()
+            with stamp_batch():
+                self.assertIs(field.get_batch_stamp()[0], value)
+            self.assertEqual(field.get_prep_value(stamp), field.to_timestamp(value))
+        self.assertIsNone(field.get_batch_stamp())
+
+
+class ForClockTestModel(models.Model):
+
+    created = UnixTimeStampField(auto_now_add=True, clock='test')
+    modified = UnixTimeStampField(auto_now=True)
+    od = OrdinalField(auto_now=True, clock='test')
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class ClockTest(TestCase):
+
+    start = timezone.datetime(2026, 1, 1, 12)
+
+    def setUp(self):
+        from .clocks import TestClock, register_clock
+        self.clock = register_clock('test', TestClock(self.start))
+
+    def test_field_clock(self):
+        t = ForClockTestModel.objects.create()
+
+        self.assertEqual(t.created, self.start.replace(tzinfo=datetime.timezone.utc))
+        self.assertEqual(t.od, self.start.replace(hour=0, tzinfo=datetime.timezone.utc))
+        self.assertGreater(t.modified.year, 2025)
+
+        self.clock.advance(days=1)
+        t.save()
+        self.assertEqual(t.created, self.start.replace(tzinfo=datetime.timezone.utc))
+        self.assertEqual(t.od.day, 2)
+        self.assertEqual(ForClockTestModel._meta.get_field('created').get_timestampnow(), 1767355200.0)
+
+    def test_default_clock(self):
+        with self.settings(USF_CLOCK='test'):
+            t = ForClockTestModel.objects.create()
+            self.assertEqual(t.modified, t.created)
+        self.assertNotEqual(ForClockTestModel.objects.create().modified, t.created)
+
+        self.assertRaises(ValueError, UnixTimeStampField(clock='missing').get_utcnow)
+        self.assertEqual(UnixTimeStampField(clock=lambda: self.start).get_utcnow(), self.start)
+        _, _, _, kwargs = UnixTimeStampField(clock='test').deconstruct()
+        self.assertEqual(kwargs['clock'], 'test')
+
+    def test_frozen_now(self):
+        from .clocks import frozen_now, now
+
+        with frozen_now():
+            t1 = ForClockTestModel.objects.create()
+            self.clock.advance(seconds=5)
+            with frozen_now():
+                t2 = ForClockTestModel.objects.create()
+        self.assertEqual(t1.modified, t2.modified)
+        self.assertEqual(t2.created, self.start.replace(tzinfo=datetime.timezone.utc))
+        self.assertNotEqual(t1.modified, t1.created)
+        self.assertEqual(now('test'), self.start + datetime.timedelta(seconds=5))
+
+        @frozen_now()
+        def read_twice():
+            first = now()
+            return first, now()
+        first, second = read_twice()
+        self.assertIs(first, second)
+
+    def test_frozen_per_clock(self):
+        from .clocks import frozen_now, now
+
+        for order in (('test', 'system'), ('system', 'test')):
+            with frozen_now():
+                values = {name: now(name) for name in order}
+                self.clock.advance(seconds=5)
+                self.assertEqual(values['test'], self.clock.value - datetime.timedelta(seconds=5))
+                self.assertGreater(values['system'], values['test'])
+                self.assertIs(now('test'), values['test'])
+                self.assertIs(now('system'), values['system'])
+
+    def test_frozen_async(self):
+        import asyncio
+        from .clocks import frozen_now, now
+
+        @frozen_now()
+        async def read_twice():
+            first = now()
+            await asyncio.sleep(0)
+            return first, now()
+
+        first, second = asyncio.run(read_twice())
+        self.assertIs(first, second)
+
+    def test_coarse_clock(self):
+        from .clocks import CoarseClock
+
+        clock = CoarseClock(resolution=60)
+        self.assertIs(clock(), clock())
+        clock = CoarseClock(resolution=0)
+        self.assertLessEqual(clock(), clock())
+
+    def test_middleware(self):
+        import asyncio
+        from .clocks import now
+        from .middleware import FrozenNowMiddleware
+
+        def view(request):
+            return now(), now('system')
+
+        first, second = FrozenNowMiddleware(view)(None)
+        self.assertIs(first, second)
+
+        async def async_view(request):
+            return now(), now('system')
+
+        middleware = FrozenNowMiddleware(async_view)
+        first, second = asyncio.run(middleware(None))
+        self.assertIs(first, second)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class InstrumentationTest(TestCase):
+
+    def test_measure(self):
+        from . import instrumentation
+
+        original = UnixTimeStampField.to_python
+        collected = []
+
+        def receiver(sender, stats, **kwargs):
+            collected.append(stats)
+        instrumentation.stats_collected.connect(receiver)
+        self.addCleanup(instrumentation.stats_collected.disconnect, receiver)
+
+        with instrumentation.measure() as stats:
+            self.assertIsNot(UnixTimeStampField.to_python, original)
+            ForTestModel.objects.create(str_ini='2026-01-01 00:00:00')
+            list(ForTestModel.objects.all())
+            with instrumentation.measure() as inner:
+                UnixTimeStampField().to_python('1')
+        self.assertIs(UnixTimeStampField.to_python, original)
+        self.assertEqual(collected, [inner, stats])
+
+        result = stats.as_dict()
+        self.assertEqual(result['unixtimestampfield.ForTestModel.str_ini']['pre_save']['calls'], 1)
+        self.assertEqual(result['unixtimestampfield.ForTestModel.str_ini']['from_db_value']['calls'], 1)
+        # parsed by pre_save, then by get_db_prep_value from value returned by pre_save
+        self.assertEqual(result['unixtimestampfield.ForTestModel.str_ini']['datetime_str_to_datetime']['calls'], 2)
+        self.assertEqual(result['unixtimestampfield.ForTestModel.modified']['get_db_prep_value']['errors'], 0)
+        self.assertGreater(result['unixtimestampfield.ForTestModel.modified']['pre_save']['seconds'], 0)
+        self.assertEqual(result['UnixTimeStampField']['to_python']['calls'], 1)
+        self.assertEqual(inner.as_dict(), {'UnixTimeStampField': result['UnixTimeStampField']})
+
+    def test_other_contexts(self):
+        import contextvars
+        from . import instrumentation
+
+        with instrumentation.measure() as stats:
+            # wrapped, but calls of other contexts are not counted
+            contextvars.Context().run(UnixTimeStampField().to_python, 0)
+            self.assertTrue(hasattr(UnixTimeStampField.to_python, '__wrapped__'))
+        self.assertEqual(stats.as_dict(), {})
+
+    def test_validation_failed(self):
+        from . import instrumentation
+
+        failures = []
+
+        def receiver(sender, field, method, error, **kwargs):
+            failures.append((field, method))
+        instrumentation.validation_failed.connect(receiver)
+        self.addCleanup(instrumentation.validation_failed.disconnect, receiver)
+
+        field = UnixTimeStampField()
+        with instrumentation.measure() as stats:
+            self.assertRaises(exceptions.ValidationError, field.to_python, 'hello')
+        self.assertEqual(failures, [(field, 'datetime_str_to_datetime'), (field, 'to_python')])
+        self.assertEqual(stats.as_dict()['UnixTimeStampField']['to_python']['errors'], 1)
+
+    def test_enable(self):
+        from . import instrumentation
+
+        self.assertFalse(instrumentation.is_enabled())
+        instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+        instrumentation.reset_stats()
+        UnixTimeStampField().to_python(0)
+        with instrumentation.measure():
+            UnixTimeStampField().to_python(0)
+        self.assertEqual(instrumentation.get_stats()['UnixTimeStampField']['to_python']['calls'], 2)
+        self.assertTrue(hasattr(UnixTimeStampField.to_python, '__wrapped__'))
+
+        instrumentation.disable()
+        UnixTimeStampField().to_python(0)
+        self.assertEqual(instrumentation.get_stats()['UnixTimeStampField']['to_python']['calls'], 2)
+        self.assertFalse(hasattr(UnixTimeStampField.to_python, '__wrapped__'))
+
+
+class FormatFilterTest(TestCase):
+
+    formats = ('Y-m-d H:i:s', 'D, j M Y g:i:s.u A', r'\Y\e\a\r: Y, N jS \a\t P', 'c', 'r', 'U', 'W l e O T Z I')
+
+    def assertSameAsDateFilter(self, value, format_string):
+        from django.template.defaultfilters import date
+        from .templatetags.unixtimestampfield import usf_format
+
+        dt = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+        expected = date(timezone.localtime(dt) if timezone.get_current_timezone_name() != 'UTC' else dt,
+                        format_string)
+        self.assertEqual(usf_format(value, format_string), expected, (value, format_string))
+
+    @override_settings(USE_TZ=True, TIME_ZONE='America/Chicago')
+    def test_same_as_date_filter(self):
+        # around 2026/11/01 repeated hour of Chicago
+        for value in range(1793512800, 1793523600, 1234):
+            for format_string in self.formats:
+                self.assertSameAsDateFilter(value + 0.25, format_string)
+        with timezone.override('Asia/Taipei'):
+            for format_string in self.formats:
+                self.assertSameAsDateFilter(0, format_string)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_values(self):
+        import decimal
+        from .templatetags.unixtimestampfield import usf_format
+
+        expected = '2026-01-01 12:34:56'
+        for value in (1767270896, 1767270896.5, decimal.Decimal('1767270896.5'), '1767270896',
+                      '2026-01-01T12:34:56Z', timezone.datetime(2026, 1, 1, 12, 34, 56, tzinfo=datetime.timezone.utc),
+                      timezone.datetime(2026, 1, 1, 12, 34, 56)):
+            self.assertEqual(usf_format(value, 'Y-m-d H:i:s'), expected, value)
+        self.assertEqual(usf_format(datetime.date(2026, 1, 1), 'Y-m-d H:i'), '2026-01-01 00:00')
+        for value in (None, '', 'hello', True, [], 1e20, float('nan')):
+            self.assertEqual(usf_format(value, 'Y-m-d'), '', value)
+        self.assertEqual(usf_format(0), 'Jan. 1, 1970, midnight')
+        self.assertEqual(usf_format(0, 'SHORT_DATE_FORMAT'), '01/01/1970')
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_render(self):
+        t = ForTestModel(float_ini=1767270896.5)
+        template = Template(
+            '{% load unixtimestampfield %}{{ t.float_ini|usf_format:"Y-m-d H:i:s.u" }} '
+            '{{ ts|usf_format:"H:i" }} {{ ts|to_datetime|date:"Y" }} {{ "x"|to_datetime }}|')
+        rendered = template.render(Context({'t': t, 'ts': 3600}))
+        self.assertEqual(rendered, '2026-01-01 12:34:56.500000 01:00 1970 |')
+
+    @override_settings(USE_TZ=False)
+    def test_without_tz(self):
+        from .templatetags.unixtimestampfield import usf_format, to_datetime
+
+        self.assertEqual(usf_format(1767270896, 'Y-m-d H:i:s'), '2026-01-01 12:34:56')
+        # aware in UTC as before, not naive like values of fields
+        expected = timezone.datetime(2026, 1, 1, 12, 34, 56, tzinfo=datetime.timezone.utc)
+        self.assertEqual(to_datetime(1767270896), expected)
+        self.assertEqual(to_datetime('1767270896'), expected)
+        self.assertIs(to_datetime(1767270896.0).tzinfo, datetime.timezone.utc)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_day_cache(self):
+        from .templatetags import unixtimestampfield as tags
+
+        tags.usf_format(1767270896, 'l, Y-m-d H:i')
+        with translation.override('fr'):
+            self.assertEqual(tags.usf_format(1767270900, 'l, Y-m-d H:i'), 'jeudi, 2026-01-01 12:35')
+        self.assertEqual(tags.usf_format(1767270900, 'l, Y-m-d H:i'), 'Thursday, 2026-01-01 12:35')
+
+        self.addCleanup(setattr, tags, 'DAY_CACHE_SIZE', tags.DAY_CACHE_SIZE)
+        tags.DAY_CACHE_SIZE = 2
+        for day in range(5):
+            tags.usf_format(day * 86400, 'Y-m-d')
+        self.assertEqual(len(tags._day_parts), 2)
+
+
+class ForRawTestModel(models.Model):
+
+    ts = UnixTimeStampField(default=0.0)
+    ts_ms = UnixTimeStampField(storage='int64_ms', default=0)
+    lazy_ms = UnixTimeStampField(storage='int64_ms', lazy=True, default=0)
+    od = OrdinalField(default=1)
+    auto = UnixTimeStampField(auto_now_add=True)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class RawEpochTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def test_raw(self):
+        from .functions import RawEpoch
+
+        ForRawTestModel.objects.create(ts=self.value, ts_ms=self.value, od=self.value)
+        row = ForRawTestModel.objects.values(
+            ts_raw=RawEpoch('ts'), ms_raw=RawEpoch('ts_ms'), od_raw=RawEpoch('od')).get()
+        self.assertEqual(row['ts_raw'], 1767270896.123)
+        self.assertEqual(row['ms_raw'], 1767270896123)
+        self.assertEqual(row['od_raw'], self.value.toordinal())
+
+
+@unittest.skipIf(rest_framework is None, 'Django REST framework is not installed')
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class SerializerTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def get_serializer_class(self, **extra):
+        from .serializers import UnixTimeStampModelSerializer
+
+        class Serializer(UnixTimeStampModelSerializer):
+            class Meta:
+                model = ForRawTestModel
+                fields = ('ts', 'ts_ms', 'lazy_ms', 'od', 'auto')
+                extra_kwargs = extra
+
+        return Serializer
+
+    def test_mapping(self):
+        from .serializers import UnixTimeStampSerializerField
+
+        fields = self.get_serializer_class()().fields
+        for name in ('ts', 'ts_ms', 'lazy_ms', 'od', 'auto'):
+            self.assertIsInstance(fields[name], UnixTimeStampSerializerField)
+            self.assertIs(fields[name].model_field, ForRawTestModel._meta.get_field(name))
+        self.assertTrue(fields['auto'].read_only)
+
+    def test_representation(self):
+        ForRawTestModel.objects.create(ts=self.value, ts_ms=self.value, lazy_ms=self.value, od=self.value)
+        t = ForRawTestModel.objects.get()
+
+        data = self.get_serializer_class()(t).data
+        self.assertEqual(data['ts'], 1767270896.123)
+        self.assertEqual(data['ts_ms'], 1767270896.123)
+        self.assertEqual(data['lazy_ms'], 1767270896.123)
+        self.assertEqual(data['od'], self.value.toordinal())
+        # lazy value is emitted from stored value without conversion
+        self.assertIs(t.lazy_ms._value, t.lazy_ms.__class__)
+
+        iso = {'output': 'iso'}
+        data = self.get_serializer_class(ts=iso, ts_ms=iso, lazy_ms=iso, od=iso)(t).data
+        self.assertEqual(data['ts'], '2026-01-01T12:34:56.123000Z')
+        self.assertEqual(data['ts_ms'], '2026-01-01T12:34:56.123000Z')
+        self.assertEqual(data['lazy_ms'], '2026-01-01T12:34:56.123000Z')
+        self.assertEqual(data['od'], '2026-01-01')
+
+    def test_raw_source(self):
+        from rest_framework import serializers
+
+        from .functions import RawEpoch
+        from .serializers import UnixTimeStampSerializerField
+
+        class Serializer(serializers.Serializer):
+            ms = UnixTimeStampSerializerField(model_field=ForRawTestModel._meta.get_field('ts_ms'), stored=True)
+
+        ForRawTestModel.objects.create(ts_ms=self.value)
+        rows = ForRawTestModel.objects.values(ms=RawEpoch('ts_ms'))
+        self.assertEqual(Serializer(rows, many=True).data[0]['ms'], 1767270896.123)
+
+    def test_without_model_field(self):
+        from rest_framework import serializers
+
+        from .serializers import UnixTimeStampSerializerField
+
+        class Serializer(serializers.Serializer):
+            lazy_ms = UnixTimeStampSerializerField()
+            lazy_iso = UnixTimeStampSerializerField(output='iso', source='lazy_ms')
+
+        ForRawTestModel.objects.create(lazy_ms=self.value)
+        data = Serializer(ForRawTestModel.objects.get()).data
+        self.assertEqual(data['lazy_ms'], 1767270896.123)
+        self.assertEqual(data['lazy_iso'], '2026-01-01T12:34:56.123000Z')
+
+    def test_seconds(self):
+        t = ForRawTestModel(ts=1767270896, ts_ms=1767270896, lazy_ms=1767270896.123, od=self.value.toordinal())
+
+        data = self.get_serializer_class()(t).data
+        self.assertEqual(data['ts'], 1767270896)
+        self.assertEqual(data['ts_ms'], 1767270896)
+        self.assertEqual(data['lazy_ms'], 1767270896.123)
+        self.assertEqual(data['od'], self.value.toordinal())
+
+        iso = {'output': 'iso'}
+        data = self.get_serializer_class(ts_ms=iso, lazy_ms=iso, od=iso)(t).data
+        self.assertEqual(data['ts_ms'], '2026-01-01T12:34:56Z')
+        self.assertEqual(data['lazy_ms'], '2026-01-01T12:34:56.123000Z')
+        self.assertEqual(data['od'], '2026-01-01')
+
+    def test_internal_value(self):
+        serializer = self.get_serializer_class()(data={
+            'ts': '2026-01-01T12:34:56.123Z', 'ts_ms': 1767270896.123,
+            'lazy_ms': '2026-01-01 12:34:56.123', 'od': 739617,
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['ts_ms'].raw, 1767270896123)
+
+        t = serializer.save()
+        t = ForRawTestModel.objects.get(pk=t.pk)
+        self.assertEqual(t.ts, self.value)
+        self.assertEqual(t.ts_ms, self.value)
+        self.assertEqual(t.lazy_ms, self.value)
+        self.assertEqual(t.od, timezone.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc))
+
+    def test_invalid(self):
+        for value in ('hello', True, [1], 2 ** 62):
+            serializer = self.get_serializer_class()(data={'ts_ms': value})
+            self.assertFalse(serializer.is_valid())
+            self.assertIn('ts_ms', serializer.errors)
+
+        for name, value in (('ts', 1e30), ('ts', -1e30), ('od', 0), ('od', 3652060), ('od', '0')):
+            serializer = self.get_serializer_class()(data={name: value})
+            self.assertFalse(serializer.is_valid())
+            self.assertIn(name, serializer.errors)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class ExportTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        self.pk = ForRawTestModel.objects.create(ts=self.value, ts_ms=self.value, lazy_ms=0, od=self.value).pk
+
+    def test_format_iso(self):
+        from .export import format_iso
+
+        for value in (0, -1, 1767270896123000, 1767270896000000, -62135596800000000, 253402300799999999):
+            self.assertEqual(
+                format_iso(value),
+                (unix_0 + datetime.timedelta(microseconds=value)).isoformat() + 'Z')
+
+    def test_rows(self):
+        from .export import iter_rows
+
+        rows = list(iter_rows(ForRawTestModel.objects.all(), fields=['ts', 'ts_ms', 'lazy_ms', 'od']))
+        self.assertEqual(rows, [[1767270896.123, 1767270896.123, 0.0, self.value.toordinal()]])
+
+        rows = list(iter_rows(ForRawTestModel.objects.all(), fields=['ts', 'ts_ms', 'od'], timestamps='iso'))
+        self.assertEqual(rows, [['2026-01-01T12:34:56.123000Z', '2026-01-01T12:34:56.123000Z', '2026-01-01']])
+
+        self.assertRaises(ValueError, list, iter_rows(ForRawTestModel.objects.all(), timestamps='date'))
+
+    def test_export(self):
+        import io
+        import json
+
+        from .export import export
+
+        stream = io.StringIO()
+        self.assertEqual(export(ForRawTestModel.objects.all(), stream, fields=['id', 'ts_ms']), 1)
+        self.assertEqual(json.loads(stream.getvalue()), {'id': self.pk, 'ts_ms': 1767270896.123})
+
+        stream = io.StringIO()
+        self.assertEqual(
+            export(ForRawTestModel.objects.all(), stream, format='csv', fields=['ts', 'od'], timestamps='iso'), 1)
+        self.assertEqual(stream.getvalue(), 'ts,od\n2026-01-01T12:34:56.123000Z,2026-01-01\n')
+
+    def test_command(self):
+        import io
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        stdout = io.StringIO()
+        call_command('usf_export', 'unixtimestampfield.ForRawTestModel', fields='ts,auto', format='csv',
+                     stdout=stdout)
+        header, row = stdout.getvalue().splitlines()
+        self.assertEqual(header, 'ts,auto')
+        self.assertEqual(row.split(',')[0], '1767270896.123')
+
+        self.assertRaises(CommandError, call_command, 'usf_export', 'unixtimestampfield.ForRawTestModel',
+                          fields='missing')
+
+
+class ForPartitionTestModel(models.Model):
+
+    ts = UnixTimeStampField(default=0.0)
+    n = models.IntegerField(default=0)
+
+    objects = PartitionedManager('ts', PartitionScheme.monthly('partition_%Y_%m', (2026, 1), (2026, 3)))
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC', DATABASE_ROUTERS=['unixtimestampfield.routers.TimeRangeRouter'])
+class PartitionTest(TestCase):
+
+    databases = {'default', 'partition_2026_01', 'partition_2026_02'}
+
+    jan = timezone.datetime(2026, 1, 10, tzinfo=datetime.timezone.utc)
+    feb = timezone.datetime(2026, 2, 10, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        for i, value in enumerate((self.jan, self.feb, self.jan + datetime.timedelta(days=1))):
+            ForPartitionTestModel.objects.create(ts=value, n=i)
+
+    def test_scheme(self):
+        scheme = PartitionScheme.monthly('p_%Y_%m', (2025, 12), (2026, 3))
+        self.assertEqual(scheme.aliases, ['p_2025_12', 'p_2026_01', 'p_2026_02'])
+        self.assertEqual(scheme.alias_for(self.jan.timestamp()), 'p_2026_01')
+        self.assertEqual(scheme.alias_for(self.feb.timestamp() * 2), 'p_2026_02')
+        self.assertRaises(ValueError, scheme.alias_for, 0)
+        self.assertEqual(scheme.aliases_between(self.jan.timestamp()), ['p_2026_01', 'p_2026_02'])
+        self.assertEqual(scheme.aliases_between(None, self.jan.timestamp()), ['p_2025_12', 'p_2026_01'])
+
+    def test_routing(self):
+        self.assertEqual(ForPartitionTestModel.objects.using('partition_2026_01').count(), 2)
+        self.assertEqual(ForPartitionTestModel.objects.using('partition_2026_02').count(), 1)
+
+        t = ForPartitionTestModel(ts=self.feb + datetime.timedelta(days=1), n=3)
+        t.save()
+        self.assertEqual(t._state.db, 'partition_2026_02')
+        t.n = 4
+        t.save()
+        self.assertEqual(ForPartitionTestModel.objects.using('partition_2026_02').get(n=4).pk, t.pk)
+        t.ts = self.jan
+        self.assertRaises(NotSupportedError, t.save)
+        self.assertEqual(ForPartitionTestModel.objects.get(n=4).ts, self.feb + datetime.timedelta(days=1))
+        self.assertRaises(NotSupportedError, ForPartitionTestModel.objects.bulk_update, [t], ['ts'])
+
+        objs = [ForPartitionTestModel(ts=self.feb, n=5), ForPartitionTestModel(ts=self.jan, n=6),
+                ForPartitionTestModel(ts=self.feb, n=7)]
+        created = ForPartitionTestModel.objects.bulk_create(objs)
+        self.assertEqual(created, objs)
+        self.assertEqual([obj.n for obj in created], [5, 6, 7])
+        self.assertEqual([obj._state.db for obj in created],
+                         ['partition_2026_02', 'partition_2026_01', 'partition_2026_02'])
+        self.assertEqual(ForPartitionTestModel.objects.count(), 7)
+
+    def test_pruning(self):
+        objects = ForPartitionTestModel.objects
+        self.assertEqual(objects.all().get_partitions(), ['partition_2026_01', 'partition_2026_02'])
+        self.assertEqual(objects.filter(ts__gte=self.feb).get_partitions(), ['partition_2026_02'])
+        feb_1 = timezone.datetime(2026, 2, 1, tzinfo=datetime.timezone.utc)
+        self.assertEqual(objects.filter(ts__lt=feb_1, n=1).get_partitions(), ['partition_2026_01'])
+        self.assertEqual(objects.filter(ts__lte=feb_1, n=1).get_partitions(), ['partition_2026_01', 'partition_2026_02'])
+        self.assertEqual(objects.filter(ts__month=self.jan.date()).get_partitions(), ['partition_2026_01'])
+        self.assertEqual(objects.filter(ts__range=(self.jan, self.jan)).get_partitions(), ['partition_2026_01'])
+        self.assertEqual(objects.filter(ts=self.feb).get_partitions(), ['partition_2026_02'])
+        self.assertEqual(objects.filter(ts__in=[self.jan]).get_partitions(), ['partition_2026_01'])
+        self.assertEqual(objects.filter(ts__date=self.feb.date()).get_partitions(), ['partition_2026_02'])
+        self.assertEqual(objects.filter(ts__year=2025).get_partitions(), [])
+        self.assertEqual(objects.filter(ts__gte=self.feb, ts__lt=self.jan).get_partitions(), [])
+        self.assertEqual(
+            objects.filter(models.Q(ts__gte=self.feb) | models.Q(n=0)).get_partitions(),
+            ['partition_2026_01', 'partition_2026_02'])
+        self.assertEqual(
+            objects.exclude(ts__gte=self.feb).get_partitions(), ['partition_2026_01', 'partition_2026_02'])
+
+        self.assertEqual([t.n for t in objects.filter(ts__gte=self.feb)], [1])
+        self.assertEqual(objects.get(ts=self.feb).n, 1)
+        self.assertFalse(objects.filter(ts__year=2025).exists())
+
+    def test_fan_out(self):
+        objects = ForPartitionTestModel.objects
+        self.assertEqual([t.n for t in objects.order_by('ts')], [0, 2, 1])
+        self.assertEqual([t.n for t in objects.order_by('-ts')], [1, 2, 0])
+        self.assertEqual([t.n for t in objects.order_by('n')], [0, 1, 2])
+        self.assertEqual([t.n for t in objects.order_by('-n')[:2]], [2, 1])
+        self.assertEqual([t.n for t in objects.order_by('ts')[1:]], [2, 1])
+        self.assertEqual([row['n'] for row in objects.order_by('n').values('n')], [0, 1, 2])
+        self.assertEqual([t.n for t in objects.order_by('ts').iterator(chunk_size=1)], [0, 2, 1])
+        self.assertEqual([t.n for t in objects.order_by('ts', models.F('n').desc())], [0, 2, 1])
+        for ordering in (models.F('n').desc(), 'pk__id', '?'):
+            self.assertRaises(NotSupportedError, list, objects.order_by(ordering))
+        self.assertRaises(NotSupportedError, list, objects.annotate(m=models.F('n')).order_by('m'))
+        self.assertRaises(NotSupportedError, list, objects.order_by('n').values('ts'))
+        self.assertEqual([t.n for t in objects.order_by('-n', '-pk')], [2, 1, 0])
+
+        self.assertEqual(objects.count(), 3)
+        self.assertTrue(objects.filter(n=1).exists())
+        self.assertEqual(
+            objects.aggregate(models.Count('id'), total=models.Sum('n'), first=models.Min('ts')),
+            {'id__count': 3, 'total': 3, 'first': self.jan})
+        self.assertRaises(exceptions.MultipleObjectsReturned, objects.get, n__gte=1)
+
+        self.assertEqual(objects.filter(n__gte=1).update(n=models.F('n') + 10), 2)
+        self.assertEqual(sorted(objects.values_list('n', flat=True)), [0, 11, 12])
+        self.assertRaises(NotSupportedError, objects.filter(n=0).update, ts=self.feb)
+        self.assertRaises(NotSupportedError, objects.using('partition_2026_01').update, ts=self.feb)
+        self.assertEqual(objects.filter(n__gte=10).delete()[0], 2)
+        self.assertEqual(objects.count(), 1)
+
+
+class ForRollupSourceModel(models.Model):
+
+    ts = UnixTimeStampField(default=0.0)
+    amount = models.FloatField(null=True)
+
+    objects = UnixTimeStampManager()
+
+
+class ForRollupTestModel(RollupModel):
+
+    amount = models.FloatField(default=0)
+
+
+ROLLUP = register_rollup(Rollup(ForRollupTestModel, ForRollupSourceModel, 'ts', sizes=(60, 3600),
+                                sums={'amount': 'amount'}))
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class RollupTest(TestCase):
+
+    start = timezone.datetime(2026, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+    def rows(self, size):
+        return list(ForRollupTestModel.objects.filter(size=size).order_by('bucket').values_list(
+            'bucket', 'count', 'amount'))
+
+    def at(self, **kwargs):
+        return self.start + datetime.timedelta(**kwargs)
+
+    def test_incremental(self):
+        t = ForRollupSourceModel.objects.create(ts=self.at(seconds=10), amount=1.5)
+        ForRollupSourceModel.objects.create(ts=self.at(seconds=50), amount=None)
+        ForRollupSourceModel.objects.create(ts=self.at(minutes=1), amount=2)
+        self.assertEqual(self.rows(60), [(self.start, 2, 1.5), (self.at(minutes=1), 1, 2.0)])
+        self.assertEqual(self.rows(3600), [(self.start, 3, 3.5)])
+
+        t.ts, t.amount = self.at(minutes=1, seconds=1), 3
+        t.save()
+        self.assertEqual(self.rows(60), [(self.start, 1, 0.0), (self.at(minutes=1), 2, 5.0)])
+        self.assertEqual(self.rows(3600), [(self.start, 3, 5.0)])
+
+        t.save(update_fields=[])
+        t.delete()
+        self.assertEqual(self.rows(60), [(self.start, 1, 0.0), (self.at(minutes=1), 1, 2.0)])
+        self.assertEqual(self.rows(3600), [(self.start, 2, 2.0)])
+
+    def test_bulk_create(self):
+        ForRollupSourceModel.objects.bulk_create([
+            ForRollupSourceModel(ts=self.at(minutes=i), amount=i) for i in range(3)])
+        ForRollupSourceModel.objects.create(ts=self.at(hours=1), amount=10)
+        self.assertEqual(
+            self.rows(60),
+            [(self.start, 1, 0.0), (self.at(minutes=1), 1, 1.0), (self.at(minutes=2), 1, 2.0),
+             (self.at(hours=1), 1, 10.0)])
+        self.assertEqual(self.rows(3600), [(self.start, 3, 3.0), (self.at(hours=1), 1, 10.0)])
+
+    def test_rebuild(self):
+        ROLLUP.disconnect()
+        try:
+            for i in range(5):
+                ForRollupSourceModel.objects.create(ts=self.at(minutes=i * 40), amount=i)
+        finally:
+            ROLLUP.connect()
+        self.assertEqual(self.rows(3600), [])
+
+        self.assertEqual(ROLLUP.rebuild(chunk=3600), 5 + 3)
+        self.assertEqual(self.rows(3600), [(self.start, 2, 1.0), (self.at(hours=1), 1, 2.0),
+                                           (self.at(hours=2), 2, 7.0)])
+        self.assertEqual(len(self.rows(60)), 5)
+
+        # rebuilding range replaces rows of it only
+        ForRollupSourceModel.objects.filter(amount=4).update(amount=8)
+        ROLLUP.rebuild(self.at(hours=2), self.at(hours=3))
+        self.assertEqual(self.rows(3600), [(self.start, 2, 1.0), (self.at(hours=1), 1, 2.0),
+                                           (self.at(hours=2), 2, 11.0)])
+
+    def test_sizes(self):
+        self.assertRaises(ValueError, Rollup, ForRollupTestModel, ForRollupSourceModel, 'ts', sizes=(3600, 5400))
+        self.assertRaises(ValueError, Rollup, ForRollupTestModel, ForRollupSourceModel, 'ts', sizes=(0, 60))
+        self.assertEqual(Rollup(ForRollupTestModel, ForRollupSourceModel, 'ts', sizes=(900, 60, 3600)).sizes,
+                         (900, 60, 3600))
+
+    def test_command(self):
+        import io
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        ForRollupSourceModel.objects.create(ts=self.at(minutes=1), amount=1)
+        ForRollupTestModel.objects.all().delete()
+        stdout = io.StringIO()
+        call_command('usf_rebuild_rollups', ROLLUP.name, start='2026-01-01 12:00:00', end='2026-01-01 13:00:00',
+                     stdout=stdout)
+        self.assertEqual(stdout.getvalue(), '%s: 2 rows written\n' % ROLLUP.name)
+        self.assertEqual(self.rows(3600), [(self.start, 1, 1.0)])
+
+        self.assertRaises(CommandError, call_command, 'usf_rebuild_rollups', 'missing')
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='Asia/Taipei')
+class BatchIteratorTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        ForRollupSourceModel.objects.bulk_create([
+            ForRollupSourceModel(ts=self.value + datetime.timedelta(days=i), amount=i) for i in range(5)])
+        ForLazyTestModel.objects.create(ts=self.value, ts_ms=self.value, numeric=self.value)
+
+    def expected(self):
+        return [(obj.pk, obj.ts, obj.amount) for obj in ForRollupSourceModel.objects.order_by('pk')]
+
+    def test_objects(self):
+        objs = list(ForRollupSourceModel.objects.order_by('pk').batch_iterator(chunk_size=2))
+        self.assertEqual([(obj.pk, obj.ts, obj.amount) for obj in objs], self.expected())
+        self.assertEqual(objs[0].ts.tzinfo, ZoneInfo('Asia/Taipei'))
+        self.assertFalse(objs[0]._state.adding)
+        self.assertEqual(objs[0]._state.db, 'default')
+
+    def test_tuples(self):
+        from .iterators import batch_iterator
+
+        rows = list(batch_iterator(ForRollupSourceModel.objects.order_by('pk'), 3, fields=['id', 'ts', 'amount']))
+        self.assertEqual(rows, self.expected())
+        rows = list(batch_iterator(ForRollupSourceModel.objects.order_by('pk'), fields=['ts'],
+                                   usf_format='usf_timestamp'))
+        self.assertEqual(rows[0], (self.value.timestamp(), ))
+
+    def test_lazy(self):
+        from .fields import LazyTimestamp
+        from .iterators import batch_iterator
+
+        obj = list(batch_iterator(ForLazyTestModel.objects.all()))[0]
+        self.assertIsInstance(obj.ts, LazyTimestamp)
+        self.assertEqual(obj.ts_ms.raw, 1767270896123)
+        self.assertEqual(obj.ts, self.value)
+
+    def test_column_converter(self):
+        from .iterators import get_column_converter
+
+        # 2026/11/01 01:30 CDT, local times repeat after end of DST at 02:00
+        fold = 1793514600.0
+        column = [fold + i * 600 for i in range(-12, 12)] + [0.0, -1.5, None, 1e20, 1767270896.123]
+        for settings_ in ({'USE_TZ': False}, {'TIME_ZONE': 'UTC'}, {'TIME_ZONE': 'America/Chicago'}):
+            with self.settings(**settings_):
+                for field in (UnixTimeStampField(), UnixTimeStampField(storage='int64_ms')):
+                    values = column if field.storage_scale is None else \
+                        [v if v is None or v == 1e20 else int(v * 1000) for v in column]
+                    expected = []
+                    for value in values:
+                        try:
+                            expected.append(field.from_db_value(value, None, None))
+                        except exceptions.ValidationError:
+                            expected.append(exceptions.ValidationError)
+                    converter = get_column_converter(field)
+                    results = []
+                    for value in values:
+                        try:
+                            results.extend(converter([value]))
+                        except exceptions.ValidationError:
+                            results.append(exceptions.ValidationError)
+                    self.assertEqual(results, expected)
+                    self.assertEqual([getattr(v, 'fold', None) for v in results],
+                                     [getattr(v, 'fold', None) for v in expected])
+                    valid = [v for v, e in zip(values, expected) if e is not exceptions.ValidationError]
+                    self.assertEqual(converter(valid), [e for e in expected if e is not exceptions.ValidationError])
+
+    async def test_async(self):
+        objs = [obj async for obj in ForRollupSourceModel.objects.order_by('pk').abatch_iterator(chunk_size=2)]
+        expected = await sync_to_async(self.expected)()
+        self.assertEqual([(obj.pk, obj.ts, obj.amount) for obj in objs], expected)
+        rows = [row async for row in ForRollupSourceModel.objects.order_by('pk').abatch_iterator(fields=['ts'])]
+        self.assertEqual(rows, [(ts, ) for _, ts, _ in expected])
+
+
+class ForBackfillTestModel(models.Model):
+
+    created = models.DateTimeField(null=True)
+    created_ts = UnixTimeStampField(storage='int64_ms', default=0)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class BackfillTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+    label = 'unixtimestampfield.ForBackfillTestModel'
+
+    def setUp(self):
+        ForBackfillTestModel.objects.bulk_create(
+            [ForBackfillTestModel(created=self.value + datetime.timedelta(hours=i * 10)) for i in range(10)] +
+            [ForBackfillTestModel(created=None)])
+
+    def assertConverted(self):
+        # rows of which source is NULL are left as default
+        epoch = timezone.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        for obj in ForBackfillTestModel.objects.all():
+            self.assertEqual(obj.created_ts, obj.created or epoch)
+
+    def test_by_pk(self):
+        from .backfill import Backfill, run
+
+        job = Backfill(self.label, 'created', 'created_ts', chunk_size=3)
+        self.assertEqual(len(job.get_chunks()), 4)
+        self.assertEqual(job.estimate(), (10, 4))
+        self.assertEqual(run(job), 10)
+        self.assertConverted()
+        self.assertEqual(ForBackfillTestModel.objects.filter(created_ts=self.value).count(), 1)
+
+    def test_by_time(self):
+        from .backfill import Backfill, run
+
+        chunks = []
+        job = Backfill(self.label, 'created', 'created_ts', by='time', interval=86400)
+        self.assertEqual(run(job, callback=lambda chunk, rows: chunks.append(rows)), 10)
+        self.assertEqual(chunks, [2, 2, 2, 3, 1])
+        self.assertConverted()
+
+        with self.settings(USE_TZ=False):
+            ForBackfillTestModel.objects.update(created_ts=0)
+            job = Backfill(self.label, 'created', 'created_ts', by='time', naive_timezone='UTC')
+            self.assertEqual(run(job), 10)
+        self.assertConverted()
+
+    def test_checkpoint(self):
+        import os
+        import tempfile
+
+        from .backfill import Backfill, Checkpoint, run
+
+        job = Backfill(self.label, 'created', 'created_ts', chunk_size=4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.json')
+            checkpoint = Checkpoint(path, job.params)
+            first = job.get_chunks()[0]
+            job.run_chunk(first)
+            checkpoint.add(first)
+
+            checkpoint = Checkpoint(path, job.params)
+            self.assertEqual(checkpoint.done, {first})
+            self.assertEqual(job.estimate(checkpoint.done), (6, 2))
+            self.assertEqual(job.estimate(set(job.get_chunks()[1:])), (4, 1))
+            self.assertEqual(run(job, checkpoint), 6)
+            self.assertEqual(len(Checkpoint(path, job.params).done), 3)
+            self.assertConverted()
+
+            other = Backfill(self.label, 'created', 'created_ts', chunk_size=5)
+            self.assertRaises(ValueError, Checkpoint, path, other.params)
+
+    def test_check(self):
+        from .backfill import Backfill
+
+        self.assertRaises(ValueError, Backfill, self.label, 'created_ts', 'created_ts')
+        self.assertRaises(ValueError, Backfill, self.label, 'created', 'created')
+        self.assertRaises(ValueError, Backfill, self.label, 'created', 'created_ts', by='month')
+
+    def test_command(self):
+        import io
+        import os
+        import tempfile
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        from .backfill import Backfill, Checkpoint
+
+        stdout = io.StringIO()
+        call_command('usf_convert_datetime', self.label, 'created', 'created_ts', chunk_size=4, dry_run=True,
+                     stdout=stdout)
+        self.assertEqual(stdout.getvalue().strip(), '10 rows in 3 chunks to convert')
+        self.assertFalse(ForBackfillTestModel.objects.exclude(created_ts=0).exists())
+
+        stdout = io.StringIO()
+        call_command('usf_convert_datetime', self.label, 'created', 'created_ts', by='time', verbosity=2,
+                     stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[-1], '10 rows converted')
+        self.assertConverted()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.json')
+            job = Backfill(self.label, 'created', 'created_ts', chunk_size=4)
+            Checkpoint(path, job.params).add(job.get_chunks()[0])
+            stdout = io.StringIO()
+            call_command('usf_convert_datetime', self.label, 'created', 'created_ts', chunk_size=4, dry_run=True,
+                         checkpoint=path, stdout=stdout)
+            self.assertEqual(stdout.getvalue().strip(), '6 rows in 2 chunks to convert')
+
+        self.assertRaises(CommandError, call_command, 'usf_convert_datetime', self.label, 'missing', 'created_ts')
+        self.assertRaises(CommandError, call_command, 'usf_convert_datetime', 'unixtimestampfield.Missing',
+                          'created', 'created_ts')
+
+
+class ForOperationTestModel(models.Model):
+
+    created = models.DateTimeField(null=True)
+    day = models.DateField(null=True)
+    ts = UnixTimeStampField(default=0.0)
+    ts_s = UnixTimeStampField(storage='int32_s', default=0)
+    ts_ms = UnixTimeStampField(storage='int64_ms', default=0)
+    ts_us = UnixTimeStampField(storage='int64_us', default=0)
+    od = OrdinalField(default=1)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class OperationTest(TransactionTestCase):
+
+    values = [
+        timezone.datetime(2026, 1, 1, 12, 34, 56, 123456, tzinfo=datetime.timezone.utc),
+        timezone.datetime(2026, 1, 1, 12, 34, 56, tzinfo=datetime.timezone.utc),
+        timezone.datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=datetime.timezone.utc),
+        timezone.datetime(1969, 12, 25, 0, 0, 0, 1, tzinfo=datetime.timezone.utc),
+    ]
+
+    def setUp(self):
+        ForOperationTestModel.objects.bulk_create(
+            [ForOperationTestModel(created=value, day=value.date()) for value in self.values] +
+            [ForOperationTestModel(created=None, day=None)])
+
+    def state(self):
+        from django.db.migrations.state import ModelState, ProjectState
+
+        state = ProjectState()
+        state.add_model(ModelState.from_model(ForOperationTestModel))
+        return state
+
+    def forwards(self, operation, backwards=False):
+        from django.db import connection
+
+        state = self.state()
+        with connection.schema_editor() as editor:
+            if backwards:
+                operation.database_backwards('unixtimestampfield', editor, state, state)
+            else:
+                operation.database_forwards('unixtimestampfield', editor, state, state)
+
+    def stored(self, name):
+        from .functions import RawEpoch
+
+        return list(ForOperationTestModel.objects.order_by('pk').values_list(RawEpoch(name), flat=True))
+
+    def test_to_epoch(self):
+        from .operations import ConvertDateTimeToEpoch
+
+        for name in ('ts', 'ts_s', 'ts_ms', 'ts_us'):
+            field = ForOperationTestModel._meta.get_field(name)
+            self.forwards(ConvertDateTimeToEpoch('foroperationtestmodel', 'created', name))
+            self.assertEqual(self.stored(name), [field.to_storage(value) for value in self.values] + [0])
+
+        self.forwards(ConvertDateTimeToEpoch('foroperationtestmodel', 'day', 'od'))
+        self.assertEqual(self.stored('od'), [value.toordinal() for value in self.values] + [1])
+
+    def test_to_datetime(self):
+        from .operations import ConvertDateTimeToEpoch, ConvertEpochToDateTime
+
+        # milliseconds last, which drops microseconds of created
+        for name in ('ts', 'ts_us', 'ts_ms'):
+            self.forwards(ConvertDateTimeToEpoch('foroperationtestmodel', 'created', name))
+            ForOperationTestModel.objects.update(created=None)
+            self.forwards(ConvertEpochToDateTime('foroperationtestmodel', name, 'created'))
+            rows = list(ForOperationTestModel.objects.order_by('pk').values_list('created', name))
+            self.assertEqual([created for created, value in rows], [value for created, value in rows])
+            if name != 'ts_ms':
+                self.assertEqual([created for created, value in rows], self.values + [EPOCH_UTC])
+
+        self.forwards(ConvertDateTimeToEpoch('foroperationtestmodel', 'day', 'od'))
+        ForOperationTestModel.objects.update(day=None, created=None)
+        self.forwards(ConvertDateTimeToEpoch('foroperationtestmodel', 'day', 'od'), backwards=True)
+        self.assertEqual(list(ForOperationTestModel.objects.order_by('pk').values_list('day', flat=True)),
+                         [value.date() for value in self.values] + [datetime.date(1, 1, 1)])
+        self.forwards(ConvertEpochToDateTime('foroperationtestmodel', 'od', 'created'))
+        self.assertEqual(list(ForOperationTestModel.objects.order_by('pk').values_list('created', flat=True))[0],
+                         timezone.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc))
+
+    def test_check(self):
+        from .operations import ConvertDateTimeToEpoch, ConvertEpochToDateTime
+
+        self.assertRaises(ValueError, self.forwards, ConvertDateTimeToEpoch('foroperationtestmodel', 'day', 'ts'))
+        self.assertRaises(ValueError, self.forwards, ConvertDateTimeToEpoch('foroperationtestmodel', 'ts', 'ts_ms'))
+        self.assertRaises(ValueError, self.forwards, ConvertEpochToDateTime('foroperationtestmodel', 'created', 'ts'))
+
+    def test_sql_and_deconstruct(self):
+        from django.db import connection
+        from django.db.migrations.writer import OperationWriter
+
+        from .operations import ConvertDateTimeToEpoch
+
+        operation = ConvertDateTimeToEpoch('foroperationtestmodel', 'created', 'ts_ms')
+        state = self.state()
+        with connection.schema_editor(collect_sql=True) as editor:
+            operation.database_forwards('unixtimestampfield', editor, state, state)
+        self.assertEqual(len(editor.collected_sql), 1)
+        self.assertTrue(editor.collected_sql[0].startswith('UPDATE'))
+        self.assertFalse(ForOperationTestModel.objects.exclude(ts_ms=0).exists())
+
+        self.assertEqual(operation.deconstruct(), (
+            'ConvertDateTimeToEpoch', ('foroperationtestmodel', 'created', 'ts_ms'), {}))
+        written, imports = OperationWriter(operation).serialize()
+        self.assertIn('unixtimestampfield.operations.ConvertDateTimeToEpoch(', written)
+        self.assertIn('import unixtimestampfield.operations', imports)
+
+        field = UnixTimeStampField(round_to=3, use_numeric=True, storage='int64_ms')
+        self.assertEqual(field.deconstruct()[3], {'round_to': 3, 'use_numeric': True, 'storage': 'int64_ms'})
+        self.assertEqual(OrdinalField(use_numeric=True).deconstruct()[3], {'use_numeric': True})
+
+
+class ForDbNowTestModel(models.Model):
+
+    created = UnixTimeStampField(auto_now_add=True, db_default=EpochNow(), clock='test')
+    created_ms = UnixTimeStampField(storage='int64_ms', db_default=EpochNow())
+    modified = UnixTimeStampField(default=0.0)
+    od = OrdinalField(default=1)
+
+    objects = UnixTimeStampManager()
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class DbNowTest(TestCase):
+
+    def setUp(self):
+        from .clocks import TestClock, register_clock
+        # far from now of database, which stamps created
+        register_clock('test', TestClock(timezone.datetime(2000, 1, 1)))
+
+    def assertNow(self, value, delta=60):
+        self.assertLess(abs(value - timezone.now()), datetime.timedelta(seconds=delta))
+
+    def test_create(self):
+        t = ForDbNowTestModel.objects.create()
+        self.assertNow(t.created)
+        self.assertNow(t.created_ms)
+        self.assertEqual(t.created_ms.microsecond % 1000, 0)
+
+        # auto_now_add stamps though value is given
+        t = ForDbNowTestModel.objects.create(created=0)
+        self.assertNow(t.created)
+        t = ForDbNowTestModel.objects.create(created_ms=0)
+        self.assertEqual(t.created_ms, EPOCH_UTC)
+
+        created = t.created
+        t.save()
+        t.refresh_from_db()
+        self.assertEqual(t.created, created)
+
+    def test_bulk_create(self):
+        objs = ForDbNowTestModel.objects.bulk_create([ForDbNowTestModel() for _ in range(3)])
+        stored = list(ForDbNowTestModel.objects.values_list('created', flat=True))
+        self.assertEqual(len(set(stored)), 1)
+        self.assertNow(stored[0])
+        self.assertEqual([obj.created for obj in objs], stored)
+
+    def test_refresh(self):
+        from unittest import mock
+
+        from django.db import connection
+
+        with mock.patch.object(connection.features, 'can_return_columns_from_insert', False):
+            t = ForDbNowTestModel.objects.create()
+        self.assertNow(t.created)
+        self.assertNow(t.created_ms)
+
+    def test_update(self):
+        ForDbNowTestModel.objects.bulk_create([ForDbNowTestModel(created_ms=0) for _ in range(3)])
+        self.assertEqual(ForDbNowTestModel.objects.update(modified=EpochNow(), created_ms=EpochNow()), 3)
+        rows = list(ForDbNowTestModel.objects.values_list('modified', 'created_ms'))
+        self.assertEqual(len(set(rows)), 1)
+        self.assertNow(rows[0][0])
+        self.assertNow(rows[0][1])
+        self.assertRaises(ValueError, ForDbNowTestModel.objects.update, od=EpochNow())
+
+    def test_deconstruct(self):
+        field = ForDbNowTestModel._meta.get_field('created_ms')
+        self.assertEqual(field.deconstruct()[3]['db_default'], EpochNow('int64_ms'))
+        self.assertEqual(ForDbNowTestModel._meta.get_field('created').deconstruct()[3]['db_default'], EpochNow())
+        self.assertEqual(field.check(), [])
+        self.assertRaises(ValueError, EpochNow, 'int16')
+
+
+class ForShiftTestModel(models.Model):
+
+    started = UnixTimeStampField(default=0.0)
+    ended = UnixTimeStampField(storage='int64_ms', default=0)
+    duration = models.DurationField(default=datetime.timedelta(0))
+    od = OrdinalField(default=1)
+
+    objects = UnixTimeStampManager()
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class ShiftTest(TestCase):
+
+    value = timezone.datetime(2026, 1, 1, 12, 34, 56, 123000, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        hour = datetime.timedelta(hours=1)
+        self.short = ForShiftTestModel.objects.create(
+            started=self.value, ended=self.value + hour / 2, duration=hour / 4, od=self.value)
+        self.long = ForShiftTestModel.objects.create(
+            started=self.value, ended=self.value + hour * 2, duration=hour * 3, od=self.value)
+
+    def test_compare(self):
+        hour = datetime.timedelta(hours=1)
+        self.assertEqual(list(ForShiftTestModel.objects.filter(ended__gt=EpochF('started') + hour)), [self.long])
+        self.assertEqual(list(ForShiftTestModel.objects.filter(ended__lt=hour + EpochF('started'))), [self.short])
+        self.assertEqual(list(ForShiftTestModel.objects.filter(started__lt=EpochF('ended') - 3600)), [self.long])
+        self.assertEqual(list(ForShiftTestModel.objects.filter(ended__gt=EpochF('started') + F('duration'))),
+                         [self.short])
+        self.assertEqual(ForShiftTestModel.objects.filter(ended=EpochF('started') + hour * 2).get(), self.long)
+        self.assertEqual(ForShiftTestModel.objects.filter(ended__gte=F('started')).count(), 2)
+
+    def test_annotate(self):
+        hour = datetime.timedelta(hours=1)
+        t = ForShiftTestModel.objects.annotate(
+            later=EpochF('started') + hour / 2,
+            earlier=EpochF('ended') - F('duration'),
+            chained=EpochF('ended') + hour - 60,
+            day=EpochF('od') + datetime.timedelta(days=1),
+        ).get(pk=self.long.pk)
+        self.assertEqual(t.later, self.value + hour / 2)
+        self.assertEqual(t.earlier, self.value - hour)
+        self.assertEqual(t.chained, self.value + hour * 3 - datetime.timedelta(minutes=1))
+        self.assertEqual(t.day, timezone.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc))
+
+        self.assertRaises(ValueError, list, ForShiftTestModel.objects.annotate(day=EpochF('od') + hour))
+        self.assertRaises(ValueError, list, ForShiftTestModel.objects.annotate(x=EpochF('started') + F('ended')))
+
+    def test_update(self):
+        ForShiftTestModel.objects.update(ended=EpochF('ended') + datetime.timedelta(milliseconds=1500))
+        self.long.refresh_from_db()
+        self.assertEqual(self.long.ended, self.value + datetime.timedelta(hours=2, milliseconds=1500))
+
+    def test_ago(self):
+        now = timezone.now()
+        ForShiftTestModel.objects.update(started=now - datetime.timedelta(minutes=10))
+        ForShiftTestModel.objects.filter(pk=self.long.pk).update(ended=now - datetime.timedelta(hours=1))
+        ForShiftTestModel.objects.filter(pk=self.short.pk).update(ended=now - datetime.timedelta(seconds=10))
+
+        self.assertEqual(ForShiftTestModel.objects.filter(started__gte=Ago(1800)).count(), 2)
+        self.assertEqual(ForShiftTestModel.objects.filter(started__lt=Ago(300)).count(), 2)
+        self.assertEqual(list(ForShiftTestModel.objects.filter(ended__gte=Ago(datetime.timedelta(minutes=30)))),
+                         [self.short])
+        self.assertEqual(ForShiftTestModel.objects.filter(ended__lt=EpochNow()).count(), 2)
+        self.assertRaises(ValueError, ForShiftTestModel.objects.filter, od__gte=Ago(86400))
+
+
+class ForOrdinalStorageTestModel(models.Model):
+
+    od = OrdinalField(storage='int32_d', default=1)
+    day = OrdinalField(storage='int32_d', use_date=True, default=1)
+    created = OrdinalField(storage='int32_d', use_date=True, auto_now_add=True)
+
+
+class OrdinalStorageTest(TransactionTestCase):
+
+    value = datetime.date(2026, 1, 2)
+
+    def test_internal_type(self):
+        self.assertEqual(OrdinalField().get_internal_type(), 'FloatField')
+        self.assertEqual(OrdinalField(storage='int32_d').get_internal_type(), 'IntegerField')
+        self.assertRaises(ValueError, OrdinalField, storage='int64_ms')
+
+    def test_deconstruct(self):
+        self.assertEqual(OrdinalField(storage='int32_d', use_date=True).deconstruct()[3],
+                         {'storage': 'int32_d', 'use_date': True})
+        self.assertEqual(OrdinalField().deconstruct()[3], {})
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_to_python(self):
+        field = ForOrdinalStorageTestModel._meta.get_field('day')
+        self.assertEqual(field.to_python(self.value.toordinal()), self.value)
+        self.assertEqual(field.to_python(float(self.value.toordinal())), self.value)
+        self.assertEqual(field.to_python('2026-01-02'), self.value)
+        self.assertEqual(field.to_python(self.value), self.value)
+        self.assertEqual(field.to_python(timezone.datetime(2026, 1, 2, 8, tzinfo=ZoneInfo('Asia/Taipei'))),
+                         datetime.date(2026, 1, 2))
+        self.assertEqual(field.get_prep_value(self.value), self.value.toordinal())
+        self.assertRaises(exceptions.ValidationError, field.to_python, 0)
+
+        field = ForOrdinalStorageTestModel._meta.get_field('od')
+        self.assertEqual(field.to_python(self.value), timezone.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc))
+
+    @override_settings(USE_TZ=True, TIME_ZONE='America/New_York')
+    def test_round_trip(self):
+        from .functions import RawEpoch
+
+        today = timezone.now().astimezone(datetime.timezone.utc).date()
+        t = ForOrdinalStorageTestModel.objects.create(od=self.value, day=self.value)
+        self.assertEqual(t.day, self.value)
+        self.assertEqual(t.created, today)
+
+        t.refresh_from_db()
+        self.assertEqual(t.day, self.value)
+        self.assertEqual(t.created, today)
+        self.assertEqual(t.od, timezone.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc))
+
+        stored = ForOrdinalStorageTestModel.objects.values_list(RawEpoch('day'), flat=True).get()
+        self.assertIs(stored.__class__, int)
+        self.assertEqual(stored, self.value.toordinal())
+        self.assertEqual(ForOrdinalStorageTestModel.objects.filter(day__gte=self.value).count(), 1)
+        self.assertEqual(ForOrdinalStorageTestModel.objects.filter(day__gt=self.value).count(), 0)
+
+    @override_settings(USE_TZ=True, TIME_ZONE='UTC')
+    def test_alter_float_column(self):
+        from django.db import connection, migrations
+        from django.db.migrations.state import ModelState, ProjectState
+        from .functions import RawEpoch
+
+        state = ProjectState()
+        state.add_model(ModelState.from_model(ForOrdinalStorageTestModel))
+        to_float = migrations.AlterField('forordinalstoragetestmodel', 'day', OrdinalField(default=1))
+        to_int = migrations.AlterField(
+            'forordinalstoragetestmodel', 'day', OrdinalField(storage='int32_d', use_date=True, default=1))
+        float_state = state.clone()
+        to_float.state_forwards('unixtimestampfield', float_state)
+        int_state = float_state.clone()
+        to_int.state_forwards('unixtimestampfield', int_state)
+
+        with connection.schema_editor() as editor:
+            to_float.database_forwards('unixtimestampfield', editor, state, float_state)
+        model = float_state.apps.get_model('unixtimestampfield', 'forordinalstoragetestmodel')
+        model.objects.create(day=self.value)
+        model.objects.create(day=timezone.datetime(1, 1, 1))
+        stored = list(model.objects.order_by('pk').values_list(RawEpoch('day'), flat=True))
+        self.assertEqual(stored, [self.value.toordinal(), 1])
+        self.assertIs(stored[0].__class__, float)
+
+        with connection.schema_editor() as editor:
+            to_int.database_forwards('unixtimestampfield', editor, float_state, int_state)
+        stored = list(ForOrdinalStorageTestModel.objects.order_by('pk').values_list(RawEpoch('day'), flat=True))
+        self.assertEqual(stored, [self.value.toordinal(), 1])
+        self.assertIs(stored[0].__class__, int)
+        self.assertEqual(list(ForOrdinalStorageTestModel.objects.order_by('pk').values_list('day', flat=True)),
+                         [self.value, datetime.date(1, 1, 1)])
+
+
+class ForArrayTestModel(models.Model):
+
+    ts = UnixTimeStampField(null=True, default=0.0)
+    ms = UnixTimeStampField(storage='int64_ms', null=True, default=0)
+    od = OrdinalField(storage='int32_d', default=1)
+
+    objects = UnixTimeStampManager()
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class ArrayTest(TestCase):
+
+    values = [
+        timezone.datetime(2026, 1, 1, 12, 34, 56, 123456, tzinfo=datetime.timezone.utc),
+        timezone.datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=datetime.timezone.utc),
+        timezone.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc),
+    ]
+
+    def setUp(self):
+        from django.db import connection
+
+        ForArrayTestModel.objects.bulk_create(
+            [ForArrayTestModel(ts=value, ms=value, od=value) for value in self.values])
+        last = ForArrayTestModel.objects.order_by('pk').last()
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE %s SET ts = NULL, ms = NULL WHERE id = %%s' % ForArrayTestModel._meta.db_table,
+                           [last.pk])
+
+    def test_float64(self):
+        import array
+        import math
+        from . import arrays
+
+        qs = ForArrayTestModel.objects.order_by('pk')
+        ts = list(qs.usf_array('ts', dtype='float64', chunk_size=2))
+        self.assertEqual(ts[:2], [1767270896.123456, -0.5])
+        self.assertTrue(math.isnan(ts[2]))
+        ms = list(qs.usf_array('ms', dtype='float64'))
+        self.assertEqual(ms[:2], [1767270896.123, -0.5])
+        self.assertTrue(math.isnan(ms[2]))
+        self.assertEqual(list(qs.usf_array('od', dtype='float64')), [1767225600.0, -86400.0, 1767312000.0])
+        self.assertEqual(len(qs.filter(pk__lt=0).usf_array('ts', dtype='float64')), 0)
+
+        self.assertRaises(ValueError, qs.usf_array, 'id', dtype='float64')
+        self.assertRaises(ValueError, qs.usf_array, 'ts', dtype='int64')
+        if arrays.numpy is None:
+            self.assertIsInstance(qs.usf_array('ts', dtype='float64'), array.array)
+            self.assertRaises(ImportError, qs.usf_array, 'ts')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_datetime64(self):
+        qs = ForArrayTestModel.objects.order_by('pk')
+        ts = qs.usf_array('ts', chunk_size=2)
+        self.assertEqual(ts.dtype, numpy.dtype('datetime64[us]'))
+        self.assertEqual(list(ts[:2]), [numpy.datetime64('2026-01-01T12:34:56.123456'),
+                                        numpy.datetime64('1969-12-31T23:59:59.500000')])
+        self.assertTrue(numpy.isnat(ts[2]))
+        ms = qs.usf_array('ms')
+        self.assertEqual(ms[0], numpy.datetime64('2026-01-01T12:34:56.123'))
+        self.assertTrue(numpy.isnat(ms[2]))
+        self.assertEqual(list(qs.usf_array('od')), [numpy.datetime64('2026-01-01'), numpy.datetime64('1969-12-31'),
+                                                    numpy.datetime64('2026-01-02')])
+        self.assertEqual(qs.usf_array('ms', dtype='float64').dtype, numpy.float64)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE='UTC')
+class FormatOverrideTest(TestCase):
+
+    expected = timezone.datetime(1970, 1, 1, 0, 0, 3, tzinfo=datetime.timezone.utc)
+
+    def setUp(self):
+        self.pk = SubmiddlewareModel.objects.create(datetime=3, numeric=3).pk
+
+    def get(self):
+        t = SubmiddlewareModel.objects.get(pk=self.pk)
+        return t.datetime, t.numeric
+
+    def test_context(self):
+        from .submiddleware import get_current_format, usf_format
+
+        self.assertEqual(self.get(), (self.expected, 3))
+        with usf_format('usf_timestamp'):
+            self.assertEqual(get_current_format(), 'usf_timestamp')
+            self.assertEqual(self.get(), (3, 3))
+            with usf_format('usf_datetime'):
+                self.assertEqual(self.get(), (self.expected, self.expected))
+            self.assertEqual(self.get(), (3, 3))
+        self.assertEqual(self.get(), (self.expected, 3))
+        self.assertEqual(get_current_format(), 'usf_default')
+        self.assertRaises(ValueError, usf_format, 'invalid')
+
+        with override_settings(USF_FORMAT='usf_datetime'), usf_format('usf_default'):
+            self.assertEqual(self.get(), (self.expected, 3))
+
+    def test_decorator(self):
+        from .submiddleware import usf_format
+
+        @usf_format('usf_timestamp')
+        def view():
+            return self.get()
+
+        self.assertEqual(view(), (3, 3))
+        self.assertEqual(self.get(), (self.expected, 3))
+
+    async def test_async_decorator(self):
+        import asyncio
+        from .submiddleware import usf_format
+
+        @usf_format('usf_timestamp')
+        async def view():
+            return await sync_to_async(self.get)()
+
+        # tasks run in copies of context, overrides don't leak between them
+        results = await asyncio.gather(view(), sync_to_async(self.get)())
+        self.assertEqual(results, [(3, 3), (self.expected, 3)])
+        self.assertEqual(await sync_to_async(self.get)(), (self.expected, 3))
+
+    def test_threads(self):
+        import threading
+        from .submiddleware import usf_format
+
+        field = SubmiddlewareModel._meta.get_field('datetime')
+        results, entered, done = {}, threading.Event(), threading.Event()
+
+        def other():
+            entered.wait()
+            results['other'] = field.to_python(3)
+            done.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        with usf_format('usf_timestamp'):
+            entered.set()
+            done.wait()
+            results['inside'] = field.to_python(3)
+        thread.join()
+        self.assertEqual(results, {'other': self.expected, 'inside': 3})
+
+    def test_iterators(self):
+        from .iterators import batch_iterator
+        from .submiddleware import usf_format
+
+        with usf_format('usf_timestamp'):
+            rows = list(batch_iterator(SubmiddlewareModel.objects.filter(pk=self.pk), fields=['datetime']))
+        self.assertEqual(rows, [(3, )])
+
+    @override_settings(USF_FORMAT_PATHS=[('/api/', 'usf_timestamp'), ('/', 'usf_datetime')])
+    def test_middleware(self):
+        from django.test import RequestFactory
+        from .middleware import FormatMiddleware
+
+        factory = RequestFactory()
+        middleware = FormatMiddleware(lambda request: self.get())
+        self.assertEqual(middleware(factory.get('/api/a')), (3, 3))
+        self.assertEqual(middleware(factory.get('/a')), (self.expected, self.expected))
+        with override_settings(USF_FORMAT_PATHS=[]):
+            self.assertEqual(middleware(factory.get('/api/a')), (self.expected, 3))
+
+    @override_settings(USF_FORMAT_PATHS=[('/api/', 'usf_timestamp')])
+    async def test_async_middleware(self):
+        from django.test import RequestFactory
+        from .middleware import FormatMiddleware
+
+        async def view(request):
+            return await sync_to_async(self.get)()
+
+        middleware = FormatMiddleware(view)
+        self.assertEqual(await middleware(RequestFactory().get('/api/a')), (3, 3))
+        self.assertEqual(await middleware(RequestFactory().get('/a')), (self.expected, 3))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""
+UTC offset transitions
+
+release |release|, version |version|
+
+.. versionadded:: 1.1.0
+
+    Initial, cache UTC offset transitions of timezones for fast UTC to local conversion
+
+
+Contents
+--------
+
+Classes:
+
+* :class:`TransitionTable`
+
+Functions:
+
+* :func:`get_table`
+
+Members
+-------
+
+"""
+import bisect
+import datetime
+
+PROBE = datetime.timedelta(hours=6)
+ONE_DAY = datetime.timedelta(days=1)
+
+
+class TransitionTable(object):
+    """
+    UTC offsets of a timezone, built lazily per UTC year as bisectable arrays of transitions
+
+    Offsets are probed every 6 hours and transitions are located to the second by bisection,
+    so transitions closer than that to each other might be missed.
+    """
+
+    def __init__(self, tz):
+        self.tz = tz
+        self.years = {}
+
+    def fromutc(self, value):
+        """
+        from naive UTC datetime to aware datetime in timezone, as value.replace(tzinfo=utc).astimezone(tz)
+        """
+        try:
+            starts, offsets, fold_untils = self.years[value.year]
+        except KeyError:
+            starts, offsets, fold_untils = self.years[value.year] = self.build(value.year)
+
+        if starts is None:
+            return value.replace(tzinfo=datetime.timezone.utc).astimezone(self.tz)
+
+        i = bisect.bisect_right(starts, value) - 1
+        local = (value + offsets[i]).replace(tzinfo=self.tz)
+        if fold_untils[i] is not None and value < fold_untils[i]:
+            return local.replace(fold=1)
+        return local
+
+    def interval(self, value):
+        """
+        return (start, end, offset, fold) around naive UTC value, UTC times in ``[start, end)`` are
+        local times of value + offset with fold, None if year of value can't be converted
+        """
+        try:
+            starts, offsets, fold_untils = self.years[value.year]
+        except KeyError:
+            starts, offsets, fold_untils = self.years[value.year] = self.build(value.year)
+
+        if starts is None:
+            return None
+
+        i = bisect.bisect_right(starts, value) - 1
+        start, fold = starts[i], 0
+        end = starts[i + 1] if i + 1 < len(starts) else datetime.datetime(value.year + 1, 1, 1)
+        fold_until = fold_untils[i]
+        if fold_until is not None:
+            if value < fold_until:
+                end, fold = min(end, fold_until), 1
+            else:
+                start = fold_until
+        return start, end, offsets[i], fold
+
+    def offset(self, value):
+        return value.replace(tzinfo=datetime.timezone.utc).astimezone(self.tz).utcoffset()
+
+    def build(self, year):
+        """
+        return (starts, offsets, fold_untils) of year, starts from the day before to catch folds
+
+        years which can't be converted (near datetime.min and datetime.max) return Nones
+        """
+        try:
+            start = datetime.datetime(year, 1, 1) - ONE_DAY
+            end = datetime.datetime(year + 1, 1, 1)
+            self.offset(start), self.offset(end)
+        except (ValueError, OverflowError):
+            return None, None, None
+
+        starts, offsets, fold_untils = [start], [self.offset(start)], [None]
+        probe = start
+        while probe < end:
+            following = min(probe + PROBE, end)
+            offset = self.offset(following)
+            if offset != offsets[-1]:
+                transition = self.bisect(probe, following, offset)
+                starts.append(transition)
+                offsets.append(offset)
+                # local times repeat after transition if offset decreased
+                gap = offsets[-2] - offset
+                fold_untils.append(transition + gap if gap > datetime.timedelta(0) else None)
+            probe = following
+        return starts, offsets, fold_untils
+
+    def bisect(self, low, high, offset):
+        """
+        locate first second in (low, high] of which offset is offset
+        """
+        low_s, high_s = 0, int((high - low).total_seconds())
+        while high_s - low_s > 1:
+            middle = (low_s + high_s) // 2
+            if self.offset(low + datetime.timedelta(seconds=middle)) == offset:
+                high_s = middle
+            else:
+                low_s = middle
+        return low + datetime.timedelta(seconds=high_s)
+
+
+_tables = {}
+
+
+def get_table(tz):
+    """
+    get cached TransitionTable of tz
+    """
+    try:
+        return _tables[tz]
+    except KeyError:
+        table = _tables[tz] = TransitionTable(tz)
+        return table